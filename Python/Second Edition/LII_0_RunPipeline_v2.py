@@ -0,0 +1,82 @@
+# Name: LII_0_RunPipeline_v2.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 2.7, ArcMap 10.7 (or Python 3 with Backend = "numpy" in the scripts)
+# Description: Python script to run the whole Landscape Integrity Index from one place, as a graph of stages:
+#               1. Data preparation (LII_1_DataPrep_v2.py)
+#               2. Ecological Integrity Index, Resource- and Stressor-based Metrics and Landscape Metrics
+#                  (PROCESS 1, 2 and 3 of LII_2_CompositeScoringSystem_v2.py)
+#               3. Moving Window Analysis (LII_3_MovingWindowAnalysis_v2.py)
+#               4. Model Validation (LII_4_ModelValidation_v2.py)
+#              Each stage runs once, after the stages it depends on, and is skipped when its outputs are newer than
+#              its inputs (LII_Pipeline.py).
+# Warning:
+#          - User needs to change the parameters in each script first, as when running them one by one.
+#          - If a stage fails, fix it and run this script again: the stages that have been completed are skipped,
+#          instead of commenting out previous codes. Set Force = True to run every stage again.
+#          - Script_parameters are given to every script in place of the values set in it (e.g. Study_Extent); the
+#          multi-region batch (LII_0_RunRegions_v2.py) runs this script once per region with them.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from LII_Pipeline import Stage, run_pipeline
+
+# Parameters
+Workspace_Folder = r"\Folder"    # Folder for storing your data
+Target_list = []                 # Stages to bring up to date (with the stages they depend on), empty for all stages
+Force = False                    # Run every stage even if its outputs are up to date
+Script_parameters = {}           # Parameters of the scripts ({name: value}) in place of the values set in them, e.g. {'Backend': "numpy"}
+
+# Variables - Base
+Script_Folder = os.path.dirname(os.path.abspath(__file__))
+ws = Workspace_Folder + os.sep + "LII_Data.gdb"
+ws_Eco = Workspace_Folder + os.sep + "LII_Eco.gdb"
+ws_RS = Workspace_Folder + os.sep + "LII_ResourceStress.gdb"
+ws_LM = Workspace_Folder + os.sep + "LII_LandscapeMetrics.gdb"
+ws_LII = Workspace_Folder + os.sep + "LII_Final.gdb"
+ws_MV = Workspace_Folder + os.sep + "LII_ModelValidation.gdb"
+Pipeline_log = os.path.join(Workspace_Folder, "LII_Pipeline_log.json")
+
+DataPrep_script = os.path.join(Script_Folder, "LII_1_DataPrep_v2.py")
+CompositeScoring_script = os.path.join(Script_Folder, "LII_2_CompositeScoringSystem_v2.py")
+MovingWindow_script = os.path.join(Script_Folder, "LII_3_MovingWindowAnalysis_v2.py")
+ModelValidation_script = os.path.join(Script_Folder, "LII_4_ModelValidation_v2.py")
+
+# Variables - Outputs of each stage
+EcoYear_list = ['2001', '2008', '2010', '2012', '2014']
+ResourceYear_list = [str(year) for year in range(2001, 2019)]
+StressorYear_list = ['2001', '2003'] + [str(year) for year in range(2005, 2019)]
+NLCDYear_list = ['2001', '2004', '2006', '2008', '2011', '2013', '2016']
+
+DataPrep_outputs = [os.path.join(ws, "EVT" + year) for year in EcoYear_list] + \
+    [os.path.join(ws, "grassland" + year + "_patch_size_Lookup_Acres") for year in EcoYear_list] + \
+    [os.path.join(ws, "NLCD" + year) for year in NLCDYear_list]
+Eco_outputs = [os.path.join(ws_Eco, "EcoIndicator" + year + "_CellStats") for year in EcoYear_list]
+ResourceStressor_outputs = [os.path.join(ws_RS, "ResourceMetrics" + year + "_CellStats") for year in ResourceYear_list] + \
+    [os.path.join(ws_RS, "StressorMetrics" + year + "_CellStats") for year in StressorYear_list]
+LandscapeMetrics_outputs = [os.path.join(ws_LM, "LandscapeMetrics" + year + "_CellStats") for year in NLCDYear_list]
+MovingWindow_outputs = [os.path.join(ws_LII, Name) for Name in ['LII', 'eco_LII', 'resource_LII', 'stressor_LII', 'landscapemetrics_LII']]
+ModelValidation_outputs = [os.path.join(ws_MV, Name) for Name in ['LII_value100', 'LCM2017_value100', \
+    'LII_value50_protected', 'LII_value50_multipleuse', 'LII_value50_unprotected', \
+    'LII_value100_protected', 'LII_value100_multipleuse', 'LII_value100_unprotected']]
+
+# Stage graph
+Stage_list = [
+    Stage("DataPrep", DataPrep_script, outputs=DataPrep_outputs, parameters=Script_parameters),
+    Stage("EcologicalIntegrity", CompositeScoring_script, sections=["PROCESS 1."], depends=["DataPrep"], outputs=Eco_outputs, parameters=Script_parameters),
+    Stage("ResourceStressor", CompositeScoring_script, sections=["PROCESS 2."], depends=["DataPrep"], outputs=ResourceStressor_outputs, parameters=Script_parameters),
+    Stage("LandscapeMetrics", CompositeScoring_script, sections=["PROCESS 3."], depends=["DataPrep"], outputs=LandscapeMetrics_outputs, parameters=Script_parameters),
+    Stage("MovingWindow", MovingWindow_script, depends=["EcologicalIntegrity", "ResourceStressor", "LandscapeMetrics"],
+          inputs=Eco_outputs + ResourceStressor_outputs + LandscapeMetrics_outputs, outputs=MovingWindow_outputs, parameters=Script_parameters),
+    Stage("ModelValidation", ModelValidation_script, depends=["MovingWindow"], inputs=MovingWindow_outputs[:1], outputs=ModelValidation_outputs, parameters=Script_parameters),
+]
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# PROCESS
+# ---------------------------------------------------------------------------------------------------------------------------
+
+report = run_pipeline(Stage_list, Pipeline_log, Target_list, Force)
+for name, status in report:
+    print("{}: {}".format(name, status))
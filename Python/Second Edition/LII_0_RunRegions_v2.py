@@ -0,0 +1,52 @@
+# Name: LII_0_RunRegions_v2.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, ArcMap 10.7 or ArcGIS Pro (arcpy), NumPy
+# Description: Python script to run the Landscape Integrity Index for many regions in one run, e.g. every field office of
+#              a state from the BLM administrative unit boundaries (LII_Regions.py):
+#               - The grid of each region is derived from its boundary polygons, snapped to the common 30 m grid.
+#               - Each region runs the whole pipeline (LII_0_RunPipeline_v2.py) in Workspace_Folder/region name,
+#                 with the regions on Region_workers processes and the national inputs shared by every region.
+#               - The reprojection indexes of every region are cached in Workspace_Folder/LII_Reproject.
+# Warning:
+#          - User needs to change the parameters in each script first, as when running the pipeline for one study area.
+#          Study_Extent, boundary_input and Workspace_Folder are set for each region.
+#          - Run this script again after a failure: the regions and stages that have been completed are skipped.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys, time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from LII_Regions import run_regions
+
+# Parameters
+Workspace_Folder = r"\Folder"    # Folder for storing your data, with a folder per region
+Region_input = r"\Folder\Data\BLM_NM_Administrative_Unit_Boundaries.gdb\blm_nm_fo"     # Feature class of the region boundaries
+Region_field = "ADMU_NAME"       # Text field with the name of each region
+Region_list = []                 # Regions to run, empty for all regions of Region_input
+Target_list = []                 # Stages to bring up to date in each region (LII_0_RunPipeline_v2.py), empty for all stages
+Force = False                    # Run every stage of every region even if its outputs are up to date
+Region_workers = None            # Regions run at the same time, None for as many as the available memory holds (from the size of each region)
+Shared_parameters = {}           # Parameters of the scripts for every region, e.g. {'Backend': "numpy", 'NLCD2016_input': r"\Folder\Data\nlcd\NLCD.gdb\NLCD_2016"}
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# PROCESS
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Create timer for calculating process time
+def timer(t):
+    m,s = divmod(time.time() - t,60)
+    m,s = int(m),int(s)
+    if m and s:
+        return "{} minutes {} seconds".format(m,s)
+    if m:
+        return "{} minutes".format(m)
+    return "{} seconds".format(s)
+
+clock = time.time()
+
+Report = run_regions(Region_input, Region_field, Workspace_Folder, Shared_parameters, Region_list, Target_list, Force, Region_workers)
+for name, stages in Report:
+    print(name + ": " + ", ".join("{} {}".format(stage, status) for stage, status in stages))
+print("Completed {} regions |Total run time so far: {}".format(len(Report), timer(clock)))
+print("------------------------------------------------------------------------------")
@@ -14,15 +14,38 @@
 #
 #           If user wants to create patch size variable for other ecosystems in addition to grassland,
 #           user needs to manually change the uncomment the codes in line 410-411 and comment out line 412-413.
+#          - If user wants to create the patch size and connectivity variables without ArcMap, set Backend = "numpy"
+#           to use LII_Patch.py and LII_Distance.py. Each EVT year is labeled once for all habitats in PatchSize_habitat_list.
+#           The habitats of each EVT year are then read in one pass into a habitat label raster (LII_Habitat.py)
+#           in place of a raster per habitat.
+#          - With Backend = "numpy", the national rasters are projected without ProjectRaster_management (LII_Reproject.py):
+#           the source cell of every cell of the study area grid is computed once per distinct source grid (cached in
+#           LII_Reproject), and each raster is resampled with a nearest neighbor gather clipped to the boundary mask.
+#          - The national rasters are clipped to the window under the study area first (Study_Extent in the coordinate system
+#           of each raster, plus LII_Reproject.Source_margin cells), and only that window is projected, instead of the whole country.
 # -----------------------------------------------------------------------------------------------------------------------------------------
 
-import arcpy, os, sys, traceback, fnmatch, itertools, datetime, time
+import arcpy, os, sys, traceback, fnmatch, itertools, datetime, time, multiprocessing
 from arcpy import env
 from arcpy.sa import *
 from os.path import dirname, basename, join, exists
+from LII_Pipeline import raise_in_stage
 
 # Parameters
 Workspace_Folder = r"\Folder"    # Folder for storing your data
+Backend = "arcpy"                # Map algebra backend: "arcpy" (Spatial Analyst) or "numpy" (LII_Patch.py, LII_Distance.py)
+Study_Extent = (466742.670480727, 3540181.0486208, 682832.670480727, 3716251.0486208)    # XMin, YMin, XMax, YMax of the study area grid (30 m cells)
+Workers = multiprocessing.cpu_count()    # Worker processes for projecting the rasters with Backend = "numpy", 1 to run them one by one
+
+if Backend == "numpy":
+    from LII_MapAlgebra import *
+    from LII_Distance import EucDistance
+    from LII_Patch import save_habitat_patch_acres
+    from LII_Habitat import save_habitat_labels, read_habitat_labels, habitat_raster
+    from LII_Mask import save_boundary_mask
+    from LII_Reproject import save_projected_rasters
+from LII_Rasterize import extent_grid, feature_projection
+from LII_Reproject import source_rectangle
 boundary_input = os.path.join(ws, "boundary_input")     # Feature class of study area boundary
 
 # Parameters - Inputs for Ecological Integrity Indicators
@@ -62,6 +85,9 @@ arcpy.env.overwriteOutput = True # Overwrites pre-existing files
 arcpy.CheckOutExtension("Spatial")
 boundary = os.path.join(ws, "boundary")
 outCS = arcpy.SpatialReference(26913) # NAD_1983_UTM_Zone_13N
+cell_size = 30
+Reproject_cache = Workspace_Folder + os.sep + "LII_Reproject"    # Reprojection indexes of the NumPy backend
+Extent_rectangle = " ".join(str(value) for value in Study_Extent)     # Rectangle of Clip_management
 
 parameter_fc_list =[boundary_input, IPA2017_input, noxweed_input, vTreatment_input, ogwell_input, apd_pt_input, apd_ln_input, apd_poly_input]
 parameter_ras_list =[EVT2001_input, EVT2008_input, EVT2010_input, EVT2012_input, EVT2014_input, \
@@ -91,6 +117,9 @@ Val_list = ['Conifer', 'Conifer-Hardwood', 'Grassland', 'Riparian', 'Shrubland']
 Habitat_list = ['conifer', 'conifer_hardwood', 'grassland', 'riparian', 'shrubland']
 Year_list = ['2001', '2008', '2010', '2012', '2014']
 HabitatYear_list = ["".join(i) for i in itertools.product(Habitat_list, Year_list)]
+EVT_input_dict = dict(zip(Year_list, [EVT2001_input, EVT2008_input, EVT2010_input, EVT2012_input, EVT2014_input]))    # Attribute tables of the EVT rasters
+EVTField_dict = {'2001': "SYSTMGRPPH", '2008': "SYSTMGRPPH", '2010': "EVT_PHYS", '2012': "EVT_PHYS", '2014': "EVT_PHYS"}    # Field of the habitat classes
+PatchSize_habitat_list = ['grassland']     # Habitats with patch size variable for Backend = "numpy", can be all of Habitat_list
 PatchSize_list = []
 LookUp_list = []
 
@@ -104,9 +133,23 @@ ogwell_field = "Year"
 apd_pt = os.path.join(ws, "apd_pt")
 apd_pt_field = "FISCAL_YEAR"
 apd_ln = os.path.join(ws, "apd_ln")
-apd_ln_field = "FISCAL_YEAR"
+apd_ln_field = "Fiscal_Year_1"      # Year field of the Select queries of apd_ln (FISCAL_YEAR only listed the years to select)
 apd_poly = os.path.join(ws, "apd_poly")
 apd_poly_field = "Fiscal_Year_1"
+First_year, Last_year = 2001, 2018
+# Outputs of each feature class, split by year: (year field, filters for every output, [(output name, filters of the output)]).
+# Filters are {field: accepted values}, the same as the queries of Select.
+Partition_dict = {
+    "noxweed": (noxweed_field, {}, [("noxweed", {})]),
+    "vTreatment": (vTreatment_field, {}, [("vTreatment", {})]),
+    "ogwell": (ogwell_field, {}, [("ogwell", {})]),
+    "apd_pt": (apd_pt_field, {"TYPE": ["APD"], "STATUS": ["APPROVED"]}, [("apd_pt", {})]),
+    "apd_ln": (apd_ln_field, {"TYPE": ["APD"], "Status_1": ["Approved"]},
+               [("flowline", {"FEATURE_TYPE": ["FLOWLINE"]}), ("pipeline", {"FEATURE_TYPE": ["PIPELINE"]}),
+                ("powerline", {"FEATURE_TYPE": ["POWERLINE"]}), ("road", {"FEATURE_TYPE": ["Road", "ROAD"]})]),
+    "apd_poly": (apd_poly_field, {"TYPE": ["APD"], "Status_1": ["Approved"]},
+                 [("frac_pond", {"FEATURE_TYPE": ["FRAC POND"]}), ("well_pad", {"FEATURE_TYPE": ["Well Pad"]})]),
+}
 
 # Variables - Landscape Metrics
 NLCD2001 = os.path.join(ws, "NLCD2001.tif")      # r"\\ilmnirm3ds1.blm.doi.net\nr\users\llee\My Documents\USC\SSCI 594b - Master Thesis\landscapemetrics\NLCD2001.tif"
@@ -151,6 +194,45 @@ def list_int(x):
     x_int = list(map(int, x_str))
     return x_int
 
+# Year of a field value (number or text), None if it isn't a year
+def year_of(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+# Split a feature class into feature classes by year and type in one scan of its rows, in place of one Select per
+# year and type. Rows outside First_year - Last_year or not matching the filters are skipped during the scan.
+# Every output name is created for every year found (empty if no row matches), like the Select of each year.
+# The outputs of a year are created when the scan finds its first row, and rows are written as they are read
+# (one InsertCursor per output, open until the end of the scan), so no row is kept in memory.
+def partition_by_year(table, year_field, filters, output_list, workspace):
+    fields = [f.name for f in arcpy.ListFields(table) if f.editable and f.type not in ("OID", "Geometry")]
+    position = dict((name, i + 1) for i, name in enumerate(fields))
+    geometry_type = arcpy.Describe(table).shapeType
+    spatial_reference = arcpy.Describe(table).spatialReference
+    cursors = {}
+    try:
+        with arcpy.da.SearchCursor(table, ["SHAPE@"] + fields) as cursor:
+            for row in cursor:
+                year = year_of(row[position[year_field]])
+                if year is None or year < First_year or year > Last_year:
+                    continue
+                if year not in cursors:
+                    cursors[year] = []
+                    for name, output_filters in output_list:
+                        arcpy.CreateFeatureclass_management(workspace, name + str(year), geometry_type, table, "", "", spatial_reference)
+                        cursors[year].append(arcpy.da.InsertCursor(os.path.join(workspace, name + str(year)), ["SHAPE@"] + fields))
+                if any(row[position[field]] not in values for field, values in filters.items()):
+                    continue
+                for (name, output_filters), out_cursor in zip(output_list, cursors[year]):
+                    if all(row[position[field]] in values for field, values in output_filters.items()):
+                        out_cursor.insertRow(row)
+    finally:
+        years = sorted(cursors)
+        cursors = out_cursor = None    # Delete the InsertCursors, which releases the locks of the outputs
+    return [name + str(year) for year in years for name, output_filters in output_list]
+
 try:
     # Create file GDB for original data
     arcpy.CreateFileGDB_management(Workspace_Folder, gdb_data)
@@ -167,6 +249,7 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 try:
 # Project feature classes to boundary
@@ -182,16 +265,26 @@ try:
         arcpy.Clip_analysis(clip, "boundary_mem", Output)
 
 # Project raster to boundary
-    for parameter, clipName in zip(parameter_ras_list, clipName_ras_list):
-        Name = clipName + "_mem"
-        clip_ras_list.append(Name)
-        Output = os.path.join(ws, Name)
-        arcpy.ProjectRaster_management(parameter, Output, outCS)
+# The NumPy backend computes the source cells of the study area grid once per distinct source grid and resamples every
+# raster with one gather, clipped with the boundary mask in the same pass (LII_Reproject.py, LII_Mask.py)
+    Grid_shape, Grid_georef = extent_grid(Study_Extent, cell_size, feature_projection(boundary))
+    if Backend == "numpy":
+        Boundary_mask = save_boundary_mask(boundary, os.path.join(ws, "boundary_mask"), Grid_shape, Grid_georef)
+        save_projected_rasters(parameter_ras_list, [os.path.join(ws, clipName) for clipName in clipName_ras_list],
+                               Grid_shape, Grid_georef, Reproject_cache, Boundary_mask, Workers)
+    else:
+        for parameter, clipName in zip(parameter_ras_list, clipName_ras_list):
+            Name = clipName + "_mem"
+            clip_ras_list.append(Name)
+            Output = os.path.join(ws, Name)
+            Window = os.path.join(ws, clipName + "_window")
+            arcpy.Clip_management(parameter, source_rectangle(parameter, Grid_shape, Grid_georef), Window, "#", "#", "NONE", "MAINTAIN_EXTENT")
+            arcpy.ProjectRaster_management(Window, Output, outCS)
 
 # Clip raster to boundary
-    for clip, clipName in zip(clip_ras_list, clipName_ras_list):
-        Output = os.path.join(ws, clipName)
-        arcpy.Clip_management(clip, "466767.3125 3540198.25 682824.75 3716246.75", Output, "boundary_mem", "#", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+        for clip, clipName in zip(clip_ras_list, clipName_ras_list):
+            Output = os.path.join(ws, clipName)
+            arcpy.Clip_management(clip, Extent_rectangle, Output, "boundary_mem", "#", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
 
     print("Completed projecting and clipping feature classes and raster |Total run time so far: {}".format(timer(clock)))
     print("------------------------------------------------------------------------------------------------------------")
@@ -206,6 +299,7 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 # Add a Year Text field type and extract year
 try:
@@ -224,58 +318,65 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 fc_walk = arcpy.da.Walk(ws, datatype="FeatureClass")
 ras_walk = arcpy.da.Walk(ws, datatype="RasterDataset")
 
 # Select variables by years and categories - Raster
+# The NumPy backend compiles the attribute table of each EVT raster once into a code -> habitat lookup and reads the
+# EVT raster once into a habitat label raster (EVT2001_habitat), in place of Extract by Attributes for each habitat
 try:
-    for dirpath, dirnames, filenames in ras_walk:
-        for filename in filenames:
-            if filename == "EVT2001":
-                Fld = "SYSTMGRPPH"
-                for val, habitat in zip(Val_list, Habitat_list):
-                    Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2001, Fld), val)
-                    Name = habitat + "2001"
-                    OutputName = os.path.join(ws, Name)
-                    Output = arcpy.sa.ExtractByAttributes(EVT2001, Query)
-                    Output.save(OutputName)
-
-            if filename == "EVT2008":
-                Fld = "SYSTMGRPPH"
-                for val, habitat in zip(Val_list, Habitat_list):
-                    Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2008, Fld), val)
-                    Name = habitat + "2008"
-                    OutputName = os.path.join(ws, Name)
-                    Output = arcpy.sa.ExtractByAttributes(EVT2008, Query)
-                    Output.save(OutputName)
-
-            if filename == "EVT2010":
-                Fld = "EVT_PHYS"
-                for val, habitat in zip(Val_list, Habitat_list):
-                    Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2010, Fld), val)
-                    Name = habitat + "2010"
-                    OutputName = os.path.join(ws, Name)
-                    Output = arcpy.sa.ExtractByAttributes(EVT2010, Query)
-                    Output.save(OutputName)
-
-            if filename == "EVT2012":
-                Fld = "EVT_PHYS"
-                for val, habitat in zip(Val_list, Habitat_list):
-                    Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2012, Fld), val)
-                    Name = habitat + "2012"
-                    OutputName = os.path.join(ws, Name)
-                    Output = arcpy.sa.ExtractByAttributes(EVT2012, Query)
-                    Output.save(OutputName)
-
-            if filename == "EVT2014":
-                Fld = "EVT_PHYS"
-                for val, habitat in zip(Val_list, Habitat_list):
-                    Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2014, Fld), val)
-                    Name = habitat + "2014"
-                    OutputName = os.path.join(ws, Name)
-                    Output = arcpy.sa.ExtractByAttributes(EVT2014, Query)
-                    Output.save(OutputName)
+    if Backend == "numpy":
+        for year in Year_list:
+            save_habitat_labels(os.path.join(ws, "EVT" + year), EVTField_dict[year], Val_list, vat_raster=EVT_input_dict[year])
+    else:
+        for dirpath, dirnames, filenames in ras_walk:
+            for filename in filenames:
+                if filename == "EVT2001":
+                    Fld = "SYSTMGRPPH"
+                    for val, habitat in zip(Val_list, Habitat_list):
+                        Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2001, Fld), val)
+                        Name = habitat + "2001"
+                        OutputName = os.path.join(ws, Name)
+                        Output = arcpy.sa.ExtractByAttributes(EVT2001, Query)
+                        Output.save(OutputName)
+
+                if filename == "EVT2008":
+                    Fld = "SYSTMGRPPH"
+                    for val, habitat in zip(Val_list, Habitat_list):
+                        Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2008, Fld), val)
+                        Name = habitat + "2008"
+                        OutputName = os.path.join(ws, Name)
+                        Output = arcpy.sa.ExtractByAttributes(EVT2008, Query)
+                        Output.save(OutputName)
+
+                if filename == "EVT2010":
+                    Fld = "EVT_PHYS"
+                    for val, habitat in zip(Val_list, Habitat_list):
+                        Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2010, Fld), val)
+                        Name = habitat + "2010"
+                        OutputName = os.path.join(ws, Name)
+                        Output = arcpy.sa.ExtractByAttributes(EVT2010, Query)
+                        Output.save(OutputName)
+
+                if filename == "EVT2012":
+                    Fld = "EVT_PHYS"
+                    for val, habitat in zip(Val_list, Habitat_list):
+                        Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2012, Fld), val)
+                        Name = habitat + "2012"
+                        OutputName = os.path.join(ws, Name)
+                        Output = arcpy.sa.ExtractByAttributes(EVT2012, Query)
+                        Output.save(OutputName)
+
+                if filename == "EVT2014":
+                    Fld = "EVT_PHYS"
+                    for val, habitat in zip(Val_list, Habitat_list):
+                        Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(EVT2014, Fld), val)
+                        Name = habitat + "2014"
+                        OutputName = os.path.join(ws, Name)
+                        Output = arcpy.sa.ExtractByAttributes(EVT2014, Query)
+                        Output.save(OutputName)
 
     print("Completed selecting Ecological Integrity Indicator - Habitats by Years |Total run time so far: {}".format(timer(clock)))
     print("----------------------------------------------------------------------------------------------------------------------")
@@ -290,97 +391,16 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 # Select variables by years and categories - Feature Class
+# Each feature class is read once and all its years and types are written from that scan
 try:
     for dirpath, dirnames, filenames in fc_walk:
         for filename in filenames:
-            if filename == "noxweed":
-                noxweed_year = unique_values(noxweed, noxweed_field)
-                noxweed_year_list = [i for i in noxweed_year if i >=2001 and i <=2018]
-                for year in noxweed_year_list:
-                    Name = "noxweed" + str(year)
-                    Query = "year = " + str(year)
-                    Output = os.path.join(ws, Name)
-                    arcpy.Select_analysis(noxweed, Output, Query)
-
-            if filename == "vTreatment":
-                vTreatment_year = unique_values(vTreatment, vTreatment_field)
-                vTreatment_year_str = list_str(vTreatment_year)
-                vTreatment_year_int = list_int(vTreatment_year_str)
-                vTreatment_year_int_list = [i for i in vTreatment_year_int if i >=2001 and i <=2018]
-                vTreatment_year_str_list = list_str(vTreatment_year_int_list)
-                for year in vTreatment_year_str_list:
-                    Name = "vTreatment" + str(year)
-                    Query = """{} = '{}'""".format(arcpy.AddFieldDelimiters(vTreatment, vTreatment_field), year)
-                    Output = os.path.join(ws, Name)
-                    arcpy.Select_analysis(vTreatment, Output, Query)
-
-            if filename == "ogwell":
-                ogwell_year = unique_values(ogwell, ogwell_field)
-                ogwell_year_list = [i for i in ogwell_year if i >=2001 and i <=2018]
-                for year in ogwell_year_list:
-                    Name = "ogwell" + str(year)
-                    Query = "Year = " + str(year)
-                    Output = os.path.join(ws, Name)
-                    arcpy.Select_analysis(ogwell, Output, Query)
-
-            if filename == "apd_pt":
-                apd_pt_year = unique_values(apd_pt, apd_pt_field)
-                apd_pt_year_str = list_str(apd_pt_year)
-                apd_pt_year_int = list_int(apd_pt_year_str)
-                apd_pt_year_int_list = [i for i in apd_pt_year_int if i >=2001 and i <=2018]
-                apd_pt_year_str_list = list_str(apd_pt_year_int_list)
-                apd_pt_year_str_list_quote = []
-                for i in apd_pt_year_str_list:
-                    apd_pt_year_str_list_quote.append("'" + i + "'")
-                for year in apd_pt_year_str_list_quote:
-                    Name = "apd_pt" + year.strip("'")
-                    Output = os.path.join(ws, Name)
-                    Query = "FISCAL_YEAR = " + year + " AND TYPE = 'APD' AND STATUS = 'APPROVED'"
-                    arcpy.Select_analysis(apd_pt, Output, Query)
-
-            if filename == "apd_ln":
-                apd_ln_year = unique_values(apd_ln, apd_ln_field)
-                apd_ln_year_str = list_str(apd_ln_year)
-                apd_ln_year_int = list_int(apd_ln_year_str)
-                apd_ln_year_int_list = [i for i in apd_ln_year_int if i >=2001 and i <=2018]
-                for year in apd_ln_year_int_list:
-                    Name = "flowline" + str(year)
-                    Output = os.path.join(ws, Name)
-                    Query = "Fiscal_Year_1 = " + str(year) + " AND TYPE = 'APD' AND Status_1 = 'Approved' AND FEATURE_TYPE = 'FLOWLINE'"
-                    arcpy.Select_analysis(apd_ln, Output, Query)
-
-                    Name = "pipeline" + str(year)
-                    Output = os.path.join(ws, Name)
-                    Query = "Fiscal_Year_1 = " + str(year) + " AND TYPE = 'APD' AND Status_1 = 'Approved' AND FEATURE_TYPE = 'PIPELINE'"
-                    arcpy.Select_analysis(apd_ln, Output, Query)
-
-                    Name = "powerline" + str(year)
-                    Output = os.path.join(ws, Name)
-                    Query = "Fiscal_Year_1 = " + str(year) + " AND TYPE = 'APD' AND Status_1 = 'Approved' AND FEATURE_TYPE = 'POWERLINE'"
-                    arcpy.Select_analysis(apd_ln, Output, Query)
-
-                    Name = "road" + str(year)
-                    Output = os.path.join(ws, Name)
-                    Query = "(Fiscal_Year_1 = " + str(year) + " AND TYPE = 'APD' AND Status_1 = 'Approved') AND (FEATURE_TYPE = 'Road' OR FEATURE_TYPE = 'ROAD')"
-                    arcpy.Select_analysis(apd_ln, Output, Query)
-
-            if filename == "apd_poly":
-                apd_poly_year = unique_values(apd_poly, apd_poly_field)
-                apd_poly_year_str = list_str(apd_poly_year)
-                apd_poly_year_int = list_int(apd_poly_year_str)
-                apd_poly_year_int_list = [i for i in apd_poly_year_int if i >=2001 and i <=2018]
-                for year in apd_poly_year_int_list:
-                    Name = "frac_pond" + str(year)
-                    Output = os.path.join(ws, Name)
-                    Query = "Fiscal_Year_1 = " + str(year) + " AND TYPE = 'APD' AND Status_1 = 'Approved' AND FEATURE_TYPE = 'FRAC POND'"
-                    arcpy.Select_analysis(apd_poly, Output, Query)
-
-                    Name = "well_pad" + str(year)
-                    Output = os.path.join(ws, Name)
-                    Query = "Fiscal_Year_1 = " + str(year) + " AND TYPE = 'APD' AND Status_1 = 'Approved' AND FEATURE_TYPE = 'Well Pad'"
-                    arcpy.Select_analysis(apd_poly, Output, Query)
+            if filename in Partition_dict:
+                year_field, filters, output_list = Partition_dict[filename]
+                partition_by_year(os.path.join(ws, filename), year_field, filters, output_list, ws)
 
     print("Completed selecting Noxious Weed Treatments, Vegetation Treatments, Existing Oil and Gas Wells, APD points," \
         "\n flowline, pipeline, powerline, and road from APD lines" \
@@ -397,6 +417,7 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 # ---------------------------------------------------------------------------------------------------------------------------
 # Ecological Integrity Indicator Variables
@@ -405,42 +426,60 @@ except:
 # Need to rerun because change ele to filename, see how long it takes and what has been created
 
 try:
-    for dirpath, dirnames, filenames in ras_walk:
+    if Backend == "numpy":
+# Label each EVT year once (union-find on the cells with the same value) and create the patch size variable
+# in acres of every habitat of that year, in place of Region Group, Lookup and Map Algebra
+        for year in Year_list:
+            EVT_raster = Raster(os.path.join(ws, "EVT" + year))
+            labels = read_habitat_labels(os.path.join(ws, "EVT" + year + "_habitat"))
+            habitat_rasters = dict((habitat, habitat_raster(EVT_raster, labels, Habitat_list.index(habitat) + 1)) for habitat in PatchSize_habitat_list)
+            Acres_dict = dict((habitat, os.path.join(ws, habitat + year + "_patch_size_Lookup_Acres")) for habitat in PatchSize_habitat_list)
+            save_habitat_patch_acres(os.path.join(ws, "EVT" + year), habitat_rasters, Acres_dict)
+            for habitat in PatchSize_habitat_list:
+
+# Use Euclidean Distance to create structural connectivity variable for each ecosystem
+                Name = habitat + year + "_connectivity"
+                OutputName = os.path.join(ws, Name)
+                Output = EucDistance(habitat_rasters[habitat], "", "30")
+                Output.save(OutputName)
+
+    else:
+        for dirpath, dirnames, filenames in ras_walk:
 
 ### Use Region Group tool to create patch size variable for each ecosystem
 ##        for filename in HabitatYear_list:
 # Use Region Group tool to create patch size variable for grassland
-        for filename in fnmatch.filter(filenames, 'grassland*'):
-            Name = filename + "_patch_size"
-            PatchSize_list.append(Name)
-            PatchSize_list_str = list_str(PatchSize_list)
-            OutputName = os.path.join(ws, Name)
-            Output = arcpy.sa.RegionGroup(filename, "EIGHT", "WITHIN", "ADD_LINK", "")
-            Output.save(OutputName)
+            for filename in fnmatch.filter(filenames, 'grassland*'):
+                Name = filename + "_patch_size"
+                PatchSize_list.append(Name)
+                PatchSize_list_str = list_str(PatchSize_list)
+                OutputName = os.path.join(ws, Name)
+                Output = arcpy.sa.RegionGroup(filename, "EIGHT", "WITHIN", "ADD_LINK", "")
+                Output.save(OutputName)
 
 # Use Euclidean Distance tool to create structural connectivity variable for each ecosystem
-            Name = filename + "_connectivity"
-            OutputName = os.path.join(ws, Name)
-            Output = arcpy.sa.EucDistance(filename, "", "30")
-            Output.save(OutputName)
+                Name = filename + "_connectivity"
+                OutputName = os.path.join(ws, Name)
+                Output = arcpy.sa.EucDistance(filename, "", "30")
+                Output.save(OutputName)
 
 # Use Lookup tool to show how many pixels are in each group
-        for filename in PatchSize_list_str:
-            Name = filename + "_Lookup"
-            LookUp_list.append(Name)
-            LookUp_list_str = list_str(LookUp_list)
-            OutputName = os.path.join(ws, Name)
-            Output = arcpy.sa.Lookup(filename, "Count")
-            Output.save(OutputName)
+            for filename in PatchSize_list_str:
+                Name = filename + "_Lookup"
+                LookUp_list.append(Name)
+                LookUp_list_str = list_str(LookUp_list)
+                OutputName = os.path.join(ws, Name)
+                Output = arcpy.sa.Lookup(filename, "Count")
+                Output.save(OutputName)
 
 # Use Map Algebra (Raster Calculator tool) to calculate the number of acres of each patch by multiplying the new raster
 # with 0.222395 (0.222395 acres = 900 square meter, for 30 m pixel)
-        for filename in LookUp_list_str:
-            Name = filename + "_Acres"
-            LookUp_raster = arcpy.Raster(filename)
-            OutputName = os.path.join(ws, Name)
-            Output = LookUp_raster * 0.222395
-            Output.save(OutputName)
+            for filename in LookUp_list_str:
+                Name = filename + "_Acres"
+                LookUp_raster = arcpy.Raster(filename)
+                OutputName = os.path.join(ws, Name)
+                Output = LookUp_raster * 0.222395
+                Output.save(OutputName)
 
     print("Completed creating patch size variables, using Look Up tool, calculating acres of each patch, \
         and creating structural connectivity variables using Euclidean Distance |Total run time so far: {}".format(timer(clock)))
@@ -456,6 +495,7 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 # Delete feature classes with _mem
 raster_list = arcpy.ListRasters()
@@ -485,5 +525,6 @@ except:
     msgs = "ArcPy ERRORS:\n" + arcpy.GetMessages(2) + "\n"
     print(pymsg)    # Print Python error messages for use in Python / Python window
     print(msgs)
+    raise_in_stage()    # Run by the pipeline (LII_Pipeline.py): the stage fails instead of being logged as completed
 
 print("The entire program took {}".format(timer(clock)))
\ No newline at end of file
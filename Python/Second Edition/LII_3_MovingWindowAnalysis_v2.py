@@ -7,14 +7,38 @@
 # Warning:
 #          - If user gets a "TypeError: expected a raster or layer name", comment out previous codes
 #          that have been completed and run the rest of the script again.
+#           LII_0_RunPipeline_v2.py does this by itself: it skips the stages whose outputs are up to date.
+#          - If user wants to run the map algebra without ArcMap, set Backend = "numpy" to use LII_MapAlgebra.py
+#           and LII_Focal.py (Cell Statistics and the 1km circle Focal Statistics on NumPy arrays).
+#           The Cell Statistics of each year then run on Workers processes (LII_Parallel.py), and the Focal Statistics
+#           run tile by tile on the saved means with a halo of the 1km circle (LII_Tiles.py), so memory is bounded by the tile size.
+#          - With Backend = "numpy" and Incremental = True, the means of all years (LII, eco, resource, stressor,
+#           landscapemetrics _CellStats) keep their running sum and count (LII_Incremental.py): when a new year is added
+#           to the lists, only its Cell Statistics are computed and folded in, and the Focal Statistics are refreshed
+#           from the updated means without reading the other years again.
+#          - With Backend = "numpy", the boundary is rasterized once into a mask on the study area grid (LII_Mask.py) and
+#           applied inside the Focal Statistics in place of Clip_management: the final rasters (LII, eco_LII, ...) are
+#           saved directly, without the _FocalStats rasters, and the tiles outside the boundary are not computed.
 # -----------------------------------------------------------------------------------------------------------------------------------------
 
-import arcpy, os, sys, traceback, fnmatch, itertools, datetime, time
+import arcpy, os, sys, traceback, fnmatch, itertools, datetime, time, multiprocessing
 from arcpy import env
 from arcpy.sa import *
 
 # Parameters
 Workspace_Folder = r"\Folder"    # Folder for storing your data
+Backend = "arcpy"                # Map algebra backend: "arcpy" (Spatial Analyst) or "numpy" (LII_MapAlgebra.py, LII_Focal.py)
+Workers = multiprocessing.cpu_count()    # Worker processes for the per-year Cell Statistics with Backend = "numpy", 1 to run them one by one
+Incremental = True               # With Backend = "numpy", fold only the new years into the means of all years (False computes them again from all years)
+Study_Extent = (466742.670480727, 3540181.0486208, 682832.670480727, 3716251.0486208)    # XMin, YMin, XMax, YMax of the study area grid (30 m cells)
+
+if Backend == "numpy":
+    from LII_MapAlgebra import *
+    from LII_Focal import FocalStatistics
+    from LII_Parallel import run_tasks, save_cell_statistics
+    from LII_Incremental import update_mean, out_of_date
+    from LII_Rasterize import extent_grid, feature_projection
+    from LII_Mask import save_boundary_mask, ExtractByMask
 
 # Variables - Base
 gdb_data = "LII_Data.gdb"
@@ -187,7 +211,7 @@ landscapemetrics_CellStats = os.path.join(ws_LII_Final, "landscapemetrics_CellSt
 landscapemetrics_FocalStats = os.path.join(ws_LII_Final, "landscapemetrics_FocalStats")
 landscapemetrics_LII = os.path.join(ws_LII_Final, "landscapemetrics_LII")
 
-LII_list = [LII2001_CellStats, LII2002_CellStats, LII2003_CellStats, LII2004_CellStats, LII2005_CellStats, LII2006_CellStats, LII2007_CellStats, LII2008_CellStats, LII2009_CellStats, LII2010_CellStats, LII2011_CellStats, LII2012_CellStats, LII2013_CellStats, LII2014_CellStats, LII2015_CellStats, LII2010_CellStats, LII2016_CellStats, LII2017_CellStats, LII2018_CellStats]
+LII_list = [LII2001_CellStats, LII2002_CellStats, LII2003_CellStats, LII2004_CellStats, LII2005_CellStats, LII2006_CellStats, LII2007_CellStats, LII2008_CellStats, LII2009_CellStats, LII2010_CellStats, LII2011_CellStats, LII2012_CellStats, LII2013_CellStats, LII2014_CellStats, LII2015_CellStats, LII2016_CellStats, LII2017_CellStats, LII2018_CellStats]
 LII_CellStats = os.path.join(ws_LII_Final, "LII_CellStats")
 LII_FocalStats = os.path.join(ws_LII_Final, "LII_FocalStats")
 LII = os.path.join(ws_LII_Final, "LII")
@@ -215,115 +239,158 @@ print("-------------------------------------------------------------------------
 
 # Set Extent
 Null_extent = arcpy.Describe(boundary).extent
-arcpy.env.extent = arcpy.Extent(466742.670480727, 3540181.0486208, 682832.670480727, 3716251.0486208)
+arcpy.env.extent = arcpy.Extent(*Study_Extent)
 print("Completed defining environment extent |Total run time so far: {}".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
+# Rasterize the boundary once into the mask of the study area grid (NumPy backend)
+if Backend == "numpy":
+    Grid_shape, Grid_georef = extent_grid(Study_Extent, cell_size, feature_projection(boundary))
+    Boundary_mask = save_boundary_mask(boundary, os.path.join(ws, "boundary_mask"), Grid_shape, Grid_georef)
+    print("Completed rasterizing the boundary mask |Total run time so far: {}".format(timer(clock)))
+    print("------------------------------------------------------------------------------")
+
 # Use Cell Statistics to overlay Ecological Integrity Indicators, Resource-based and Landscape Metrics for each year (Mean)
-LII2001_CellStats = CellStatistics(LII2001_list, "MEAN", "DATA")
-LII2001_CellStats.save(os.path.join(ws_LII_Final, "LII2001_CellStats"))
-LII2002_CellStats = CellStatistics(LII2002_list, "MEAN", "DATA")
-LII2002_CellStats.save(os.path.join(ws_LII_Final, "LII2002_CellStats"))
-LII2003_CellStats = CellStatistics(LII2003_list, "MEAN", "DATA")
-LII2003_CellStats.save(os.path.join(ws_LII_Final, "LII2003_CellStats"))
-LII2004_CellStats = CellStatistics(LII2004_list, "MEAN", "DATA")
-LII2004_CellStats.save(os.path.join(ws_LII_Final, "LII2004_CellStats"))
-LII2005_CellStats = CellStatistics(LII2005_list, "MEAN", "DATA")
-LII2005_CellStats.save(os.path.join(ws_LII_Final, "LII2005_CellStats"))
-LII2006_CellStats = CellStatistics(LII2006_list, "MEAN", "DATA")
-LII2006_CellStats.save(os.path.join(ws_LII_Final, "LII2006_CellStats"))
-LII2007_CellStats = CellStatistics(LII2007_list, "MEAN", "DATA")
-LII2007_CellStats.save(os.path.join(ws_LII_Final, "LII2007_CellStats"))
-LII2008_CellStats = CellStatistics(LII2008_list, "MEAN", "DATA")
-LII2008_CellStats.save(os.path.join(ws_LII_Final, "LII2008_CellStats"))
-LII2009_CellStats = CellStatistics(LII2009_list, "MEAN", "DATA")
-LII2009_CellStats.save(os.path.join(ws_LII_Final, "LII2009_CellStats"))
-LII2010_CellStats = CellStatistics(LII2010_list, "MEAN", "DATA")
-LII2010_CellStats.save(os.path.join(ws_LII_Final, "LII2010_CellStats"))
-LII2011_CellStats = CellStatistics(LII2011_list, "MEAN", "DATA")
-LII2011_CellStats.save(os.path.join(ws_LII_Final, "LII2011_CellStats"))
-LII2012_CellStats = CellStatistics(LII2012_list, "MEAN", "DATA")
-LII2012_CellStats.save(os.path.join(ws_LII_Final, "LII2012_CellStats"))
-LII2013_CellStats = CellStatistics(LII2013_list, "MEAN", "DATA")
-LII2013_CellStats.save(os.path.join(ws_LII_Final, "LII2013_CellStats"))
-LII2014_CellStats = CellStatistics(LII2014_list, "MEAN", "DATA")
-LII2014_CellStats.save(os.path.join(ws_LII_Final, "LII2014_CellStats"))
-LII2015_CellStats = CellStatistics(LII2015_list, "MEAN", "DATA")
-LII2015_CellStats.save(os.path.join(ws_LII_Final, "LII2015_CellStats"))
-LII2016_CellStats = CellStatistics(LII2016_list, "MEAN", "DATA")
-LII2016_CellStats.save(os.path.join(ws_LII_Final, "LII2016_CellStats"))
-LII2017_CellStats = CellStatistics(LII2017_list, "MEAN", "DATA")
-LII2017_CellStats.save(os.path.join(ws_LII_Final, "LII2017_CellStats"))
-LII2018_CellStats = CellStatistics(LII2018_list, "MEAN", "DATA")
-LII2018_CellStats.save(os.path.join(ws_LII_Final, "LII2018_CellStats"))
+# The NumPy backend runs each year as a task for the worker processes
+# With Incremental = True, only the years whose Cell Statistics are missing or older than their inputs are computed
+if Backend == "numpy":
+    LIIYear_list = [str(year) for year in range(2001, 2019)]
+    LIIYear_lists = [LII2001_list, LII2002_list, LII2003_list, LII2004_list, LII2005_list, LII2006_list, LII2007_list, LII2008_list, LII2009_list, \
+        LII2010_list, LII2011_list, LII2012_list, LII2013_list, LII2014_list, LII2015_list, LII2016_list, LII2017_list, LII2018_list]
+    CellStats_tasks = [(LIIYear_in_list, os.path.join(ws_LII_Final, "LII" + year + "_CellStats"), "MEAN", "DATA") for year, LIIYear_in_list in zip(LIIYear_list, LIIYear_lists)]
+    CellStats_tasks = [task for task in CellStats_tasks if not Incremental or out_of_date(task[1], task[0])]
+    run_tasks(save_cell_statistics, CellStats_tasks, Workers)
+else:
+    LII2001_CellStats = CellStatistics(LII2001_list, "MEAN", "DATA")
+    LII2001_CellStats.save(os.path.join(ws_LII_Final, "LII2001_CellStats"))
+    LII2002_CellStats = CellStatistics(LII2002_list, "MEAN", "DATA")
+    LII2002_CellStats.save(os.path.join(ws_LII_Final, "LII2002_CellStats"))
+    LII2003_CellStats = CellStatistics(LII2003_list, "MEAN", "DATA")
+    LII2003_CellStats.save(os.path.join(ws_LII_Final, "LII2003_CellStats"))
+    LII2004_CellStats = CellStatistics(LII2004_list, "MEAN", "DATA")
+    LII2004_CellStats.save(os.path.join(ws_LII_Final, "LII2004_CellStats"))
+    LII2005_CellStats = CellStatistics(LII2005_list, "MEAN", "DATA")
+    LII2005_CellStats.save(os.path.join(ws_LII_Final, "LII2005_CellStats"))
+    LII2006_CellStats = CellStatistics(LII2006_list, "MEAN", "DATA")
+    LII2006_CellStats.save(os.path.join(ws_LII_Final, "LII2006_CellStats"))
+    LII2007_CellStats = CellStatistics(LII2007_list, "MEAN", "DATA")
+    LII2007_CellStats.save(os.path.join(ws_LII_Final, "LII2007_CellStats"))
+    LII2008_CellStats = CellStatistics(LII2008_list, "MEAN", "DATA")
+    LII2008_CellStats.save(os.path.join(ws_LII_Final, "LII2008_CellStats"))
+    LII2009_CellStats = CellStatistics(LII2009_list, "MEAN", "DATA")
+    LII2009_CellStats.save(os.path.join(ws_LII_Final, "LII2009_CellStats"))
+    LII2010_CellStats = CellStatistics(LII2010_list, "MEAN", "DATA")
+    LII2010_CellStats.save(os.path.join(ws_LII_Final, "LII2010_CellStats"))
+    LII2011_CellStats = CellStatistics(LII2011_list, "MEAN", "DATA")
+    LII2011_CellStats.save(os.path.join(ws_LII_Final, "LII2011_CellStats"))
+    LII2012_CellStats = CellStatistics(LII2012_list, "MEAN", "DATA")
+    LII2012_CellStats.save(os.path.join(ws_LII_Final, "LII2012_CellStats"))
+    LII2013_CellStats = CellStatistics(LII2013_list, "MEAN", "DATA")
+    LII2013_CellStats.save(os.path.join(ws_LII_Final, "LII2013_CellStats"))
+    LII2014_CellStats = CellStatistics(LII2014_list, "MEAN", "DATA")
+    LII2014_CellStats.save(os.path.join(ws_LII_Final, "LII2014_CellStats"))
+    LII2015_CellStats = CellStatistics(LII2015_list, "MEAN", "DATA")
+    LII2015_CellStats.save(os.path.join(ws_LII_Final, "LII2015_CellStats"))
+    LII2016_CellStats = CellStatistics(LII2016_list, "MEAN", "DATA")
+    LII2016_CellStats.save(os.path.join(ws_LII_Final, "LII2016_CellStats"))
+    LII2017_CellStats = CellStatistics(LII2017_list, "MEAN", "DATA")
+    LII2017_CellStats.save(os.path.join(ws_LII_Final, "LII2017_CellStats"))
+    LII2018_CellStats = CellStatistics(LII2018_list, "MEAN", "DATA")
+    LII2018_CellStats.save(os.path.join(ws_LII_Final, "LII2018_CellStats"))
 
 print("Completed using Cell Statistics to overlay Ecological Integrity Indicators, Resource-based and Landscape Metrics for each year.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Use Cell Statistics to overlay all years into one LII
-LII_CellStats = CellStatistics(LII_list, "MEAN", "DATA")
-LII_CellStats.save(os.path.join(ws_LII_Final, "LII_CellStats"))
+# The NumPy backend folds the new years into the running sum and count of the mean (LII_Incremental.py)
+if Backend == "numpy":
+    LII_CellStats = update_mean(LII_list, os.path.join(ws_LII_Final, "LII_CellStats"), not Incremental)
+else:
+    LII_CellStats = CellStatistics(LII_list, "MEAN", "DATA")
+    LII_CellStats.save(os.path.join(ws_LII_Final, "LII_CellStats"))
 
 print("Completed using Cell Statistics to overlay all years into one LII.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Use Focal Statistics to find the average (mean) impact value with 1km circle
-LII_FocalStats = FocalStatistics(LII_CellStats, "Circle 100 MAP", "MEAN", "DATA")
-LII_FocalStats.save(os.path.join(ws_LII_Final, "LII_FocalStats"))
+# The NumPy backend reads the saved mean tile by tile with a halo of the circle radius (LII_Tiles.py)
+# and applies the boundary mask to each tile it computes, skipping the tiles outside the boundary
+if Backend == "numpy":
+    LII_FocalStats = ExtractByMask(FocalStatistics(LII_CellStats, "Circle 100 MAP", "MEAN", "DATA"), Boundary_mask)
+    LII_FocalStats.save(LII)
+else:
+    LII_FocalStats = FocalStatistics(LII_CellStats, "Circle 100 MAP", "MEAN", "DATA")
+    LII_FocalStats.save(os.path.join(ws_LII_Final, "LII_FocalStats"))
 print("Completed using Focal Statistics to find the average (mean) impact value with 1km circle.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Clip LII with boundary
-LII_FocalStats_raster = Raster(LII_FocalStats)
-arcpy.Clip_management(LII_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
-print("Completed clipping LII with boundary.".format(timer(clock)))
-print("------------------------------------------------------------------------------")
+if Backend != "numpy":
+    LII_FocalStats_raster = Raster(LII_FocalStats)
+    arcpy.Clip_management(LII_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+    print("Completed clipping LII with boundary.".format(timer(clock)))
+    print("------------------------------------------------------------------------------")
 
 # Process for overlaying eco, resource, stressor, landscapemetrics into LII
 # Use Cell Statistics to overlay all years into one LII
-eco_CellStats = CellStatistics(eco_list, "MEAN", "DATA")
-eco_CellStats.save(os.path.join(ws_LII_Final, "eco_CellStats"))
-
-resource_CellStats = CellStatistics(resource_list, "MEAN", "DATA")
-resource_CellStats.save(os.path.join(ws_LII_Final, "resource_CellStats"))
-
-stressor_CellStats = CellStatistics(stressor_list, "MEAN", "DATA")
-stressor_CellStats.save(os.path.join(ws_LII_Final, "stressor_CellStats"))
-
-landscapemetrics_CellStats = CellStatistics(landscapemetrics_list, "MEAN", "DATA")
-landscapemetrics_CellStats.save(os.path.join(ws_LII_Final, "landscapemetrics_CellStats"))
+# The NumPy backend folds the new years into the running sum and count of each mean (LII_Incremental.py)
+if Backend == "numpy":
+    eco_CellStats = update_mean(eco_list, os.path.join(ws_LII_Final, "eco_CellStats"), not Incremental)
+    resource_CellStats = update_mean(resource_list, os.path.join(ws_LII_Final, "resource_CellStats"), not Incremental)
+    stressor_CellStats = update_mean(stressor_list, os.path.join(ws_LII_Final, "stressor_CellStats"), not Incremental)
+    landscapemetrics_CellStats = update_mean(landscapemetrics_list, os.path.join(ws_LII_Final, "landscapemetrics_CellStats"), not Incremental)
+else:
+    eco_CellStats = CellStatistics(eco_list, "MEAN", "DATA")
+    eco_CellStats.save(os.path.join(ws_LII_Final, "eco_CellStats"))
+
+    resource_CellStats = CellStatistics(resource_list, "MEAN", "DATA")
+    resource_CellStats.save(os.path.join(ws_LII_Final, "resource_CellStats"))
+
+    stressor_CellStats = CellStatistics(stressor_list, "MEAN", "DATA")
+    stressor_CellStats.save(os.path.join(ws_LII_Final, "stressor_CellStats"))
+
+    landscapemetrics_CellStats = CellStatistics(landscapemetrics_list, "MEAN", "DATA")
+    landscapemetrics_CellStats.save(os.path.join(ws_LII_Final, "landscapemetrics_CellStats"))
 print("Completed using Cell Statistics to overlay all years into one LII.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Use Focal Statistics to find the average (mean) impact value with 1km circle
-eco_FocalStats = FocalStatistics(eco_CellStats, "Circle 100 MAP", "MEAN", "DATA")
-eco_FocalStats.save(os.path.join(ws_LII_Final, "eco_FocalStats"))
-
-resource_FocalStats = FocalStatistics(resource_CellStats, "Circle 100 MAP", "MEAN", "DATA")
-resource_FocalStats.save(os.path.join(ws_LII_Final, "resource_FocalStats"))
-
-stressor_FocalStats = FocalStatistics(stressor_CellStats, "Circle 100 MAP", "MEAN", "DATA")
-stressor_FocalStats.save(os.path.join(ws_LII_Final, "stressor_FocalStats"))
-
-landscapemetrics_FocalStats = FocalStatistics(landscapemetrics_CellStats, "Circle 100 MAP", "MEAN", "DATA")
-landscapemetrics_FocalStats.save(os.path.join(ws_LII_Final, "landscapemetrics_FocalStats"))
+# The NumPy backend reads the saved mean tile by tile with a halo of the circle radius (LII_Tiles.py)
+# and applies the boundary mask to each tile it computes, skipping the tiles outside the boundary
+if Backend == "numpy":
+    for Mean, Output in [(eco_CellStats, eco_LII), (resource_CellStats, resource_LII), (stressor_CellStats, stressor_LII), \
+        (landscapemetrics_CellStats, landscapemetrics_LII)]:
+        ExtractByMask(FocalStatistics(Mean, "Circle 100 MAP", "MEAN", "DATA"), Boundary_mask).save(Output)
+else:
+    eco_FocalStats = FocalStatistics(eco_CellStats, "Circle 100 MAP", "MEAN", "DATA")
+    eco_FocalStats.save(os.path.join(ws_LII_Final, "eco_FocalStats"))
+
+    resource_FocalStats = FocalStatistics(resource_CellStats, "Circle 100 MAP", "MEAN", "DATA")
+    resource_FocalStats.save(os.path.join(ws_LII_Final, "resource_FocalStats"))
+
+    stressor_FocalStats = FocalStatistics(stressor_CellStats, "Circle 100 MAP", "MEAN", "DATA")
+    stressor_FocalStats.save(os.path.join(ws_LII_Final, "stressor_FocalStats"))
+
+    landscapemetrics_FocalStats = FocalStatistics(landscapemetrics_CellStats, "Circle 100 MAP", "MEAN", "DATA")
+    landscapemetrics_FocalStats.save(os.path.join(ws_LII_Final, "landscapemetrics_FocalStats"))
 print("Completed using Focal Statistics to find the average (mean) impact value with 1km circle.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Clip LII with boundary
-eco_FocalStats_raster = Raster(eco_FocalStats)
-arcpy.Clip_management(eco_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", eco_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+if Backend != "numpy":
+    eco_FocalStats_raster = Raster(eco_FocalStats)
+    arcpy.Clip_management(eco_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", eco_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
 
-resource_FocalStats_raster = Raster(resource_FocalStats)
-arcpy.Clip_management(resource_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", resource_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+    resource_FocalStats_raster = Raster(resource_FocalStats)
+    arcpy.Clip_management(resource_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", resource_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
 
-stressor_FocalStats_raster = Raster(stressor_FocalStats)
-arcpy.Clip_management(stressor_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", stressor_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+    stressor_FocalStats_raster = Raster(stressor_FocalStats)
+    arcpy.Clip_management(stressor_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", stressor_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
 
-landscapemetrics_FocalStats_raster = Raster(landscapemetrics_FocalStats)
-arcpy.Clip_management(landscapemetrics_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", landscapemetrics_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
-print("Completed clipping LII with boundary.".format(timer(clock)))
-print("------------------------------------------------------------------------------")
+    landscapemetrics_FocalStats_raster = Raster(landscapemetrics_FocalStats)
+    arcpy.Clip_management(landscapemetrics_FocalStats_raster, "-4302469.16115448 2857650.94578372 5302469.16115448 8309863.52125522", landscapemetrics_LII, boundary, "", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+    print("Completed clipping LII with boundary.".format(timer(clock)))
+    print("------------------------------------------------------------------------------")
 
 
 print("The entire program took {}".format(timer(clock)))
\ No newline at end of file
@@ -5,17 +5,21 @@
 # Software: Python 2.7, ArcMap 10.7
 # Description: Python script to validate the Landscape Integrity Index (LII) value.
 # Warning:
-#              - User needs to change the directory of the PADUS and Landscape Condition Map (LCM),
-#               export LCM with the right projection (no promote pixel depth).
+#              - User needs to change the directory of the PADUS and Landscape Condition Map (LCM).
+#               Only the window of the LCM under the study area (plus LII_Reproject.Source_margin cells) is clipped and projected, so the
+#               national LCM doesn't need to be projected by hand first.
 #              - User needs to use LII_Model_Validation.Rmd in R after this script to complete the model validation.
 # -----------------------------------------------------------------------------------------------------------------------------------------
 
 import arcpy, os, sys, traceback, fnmatch, itertools, datetime, time
 from arcpy import env
 from arcpy.sa import *
+from LII_Rasterize import extent_grid, feature_projection
+from LII_Reproject import source_rectangle
 
 # Parameters
 Workspace_Folder = r"\Folder"    # Folder for storing your data
+Study_Extent = (466742.670480727, 3540181.0486208, 682832.670480727, 3716251.0486208)    # XMin, YMin, XMax, YMax of the study area grid (30 m cells)
 
 # Variables - Base
 gdb_MV = "LII_ModelValidation.gdb"
@@ -23,6 +27,8 @@ ws_MV = Workspace_Folder + os.sep + gdb_MV
 
 boundary = os.path.join(ws, "boundary")
 outCS = arcpy.SpatialReference(26913) # NAD_1983_UTM_Zone_13N
+Extent_rectangle = " ".join(str(value) for value in Study_Extent)     # Rectangle of Clip_management
+cell_size = 30
 
 # Variables - Model Validation
 LII = os.path.join(ws_LII_Final, "LII")
@@ -41,8 +47,8 @@ PADUS2018_protected_Dis = os.path.join(ws_MV, "PADUS2018_protected_Dis")
 PADUS2018_multipleuse_Dis = os.path.join(ws_MV, "PADUS2018_multipleuse_Dis")
 PADUS2018_unprotected_Dis = os.path.join(ws_MV, "PADUS2018_unprotected_Dis")
 
-LCM2017_input = r"D:\USC\LCM.tif"
 LCM2017_orig_input = r"D:\USC\LCM_original.tif" # May need to change the LCM name to match the user's downloaded LCM
+LCM2017_orig_window = os.path.join(ws_MV, "LCM2017_orig_window")
 LCM2017_orig_mem = os.path.join(ws_MV, "LCM2017_orig_mem")
 LCM2017 = os.path.join(ws_MV, "LCM2017")
 
@@ -87,20 +93,22 @@ print("-------------------------------------------------------------------------
 
 # Set Extent
 Null_extent = arcpy.Describe(boundary).extent
-arcpy.env.extent = arcpy.Extent(466742.670480727, 3540181.0486208, 682832.670480727, 3716251.0486208)
+arcpy.env.extent = arcpy.Extent(*Study_Extent)
 print("Completed defining environment extent |Total run time so far: {}".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Project raster and feature classes to boundary
-# The LCM raster was manually projected due to the large size
+# Only the window of the LCM raster under the study area is projected, the whole raster is too large
 arcpy.Project_management(PADUS2018_input, PADUS2018_mem, outCS)
-arcpy.Project_management(LCM2017_orig_input, LCM2017_orig_mem, outCS) # May need to do this step manually if there is not enough processing memory space
+Grid_shape, Grid_georef = extent_grid(Study_Extent, cell_size, feature_projection(boundary))
+arcpy.Clip_management(LCM2017_orig_input, source_rectangle(LCM2017_orig_input, Grid_shape, Grid_georef), LCM2017_orig_window, "#", "#", "NONE", "MAINTAIN_EXTENT")
+arcpy.ProjectRaster_management(LCM2017_orig_window, LCM2017_orig_mem, outCS)
 print("Completed projecting.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
 # Clip raster to boundary
 arcpy.Clip_analysis(PADUS2018_mem, boundary, PADUS2018)
-arcpy.Clip_management(LCM2017_input, "466767.3125 3540198.25 682824.75 3716246.75", LCM2017, boundary, "#", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
+arcpy.Clip_management(LCM2017_orig_mem, Extent_rectangle, LCM2017, boundary, "#", "ClippingGeometry", "NO_MAINTAIN_EXTENT")
 print("Completed clipping.".format(timer(clock)))
 print("------------------------------------------------------------------------------")
 
@@ -176,4 +184,4 @@ print("-------------------------------------------------------------------------
 
 # Compare points by using Welch's two sample t-test in R
 
-print "The entire program took", (timeit.default_timer() - starttime) / 60, "minutes to run"
\ No newline at end of file
+print("The entire program took {}".format(timer(clock)))
\ No newline at end of file
@@ -0,0 +1,79 @@
+# Name: LII_5_Scenarios_v2.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy (Backend = "numpy")
+# Description: Python script to compare scoring scenarios: the Landscape Integrity Index with the impact scores (IP) of
+#              each scenario of LII_ImpactScores.csv (Scenario, Layer, IP), e.g. road at 0.5 instead of 0.75.
+#              Only the scoring of the resource, stressor and IPA layers, the Cell Statistics and the Focal Statistics
+#              are computed again (LII_Scenario.py); the distance decay surfaces kept by LII_2_CompositeScoringSystem_v2.py
+#              are reused, so a scenario takes minutes instead of running the whole pipeline again.
+# Warning:
+#          - Run LII_2_CompositeScoringSystem_v2.py with Backend = "numpy" first. If it ran with Scenario_cache = False
+#          (the default), PROCESS 2 of it runs again here with Scenario_cache = True to keep the decay surfaces, with
+#          Script_parameters in place of the values set in it (e.g. Study_Extent).
+#          - User needs to add the scenarios to LII_ImpactScores.csv: the first scenario (baseline) has the IP of every
+#          layer, the other scenarios only need the layers whose IP they change.
+#          - With Sweep_distance_list, the resource and stressor means of every scenario at every maximum distance are
+#          also computed (LII_Sweep.py) from distance fields at the largest one, into the cubes LII_Scenarios/LII_Sweep_*.npy.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys, time, multiprocessing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from LII_Pipeline import Stage, run_stage
+from LII_Scenario import read_scenarios, run_scenarios, layer_years, ImpactScores_csv, Resource_list, Stressor_list
+from LII_Store import store_exists
+from LII_Sweep import run_sweep
+
+# Parameters
+Workspace_Folder = r"\Folder"    # Folder for storing your data
+Scenario_csv = ImpactScores_csv  # Impact score table of the scenarios
+Scenario_list = []               # Scenarios to compute, empty for all scenarios of the table
+Workers = multiprocessing.cpu_count()    # Worker processes, 1 to run the tasks one by one
+Sweep_distance_list = []         # Maximum distances of the sensitivity sweep, e.g. [1000, 2000, 3000, 4000], empty for no sweep
+Script_parameters = {}           # Parameters of LII_2_CompositeScoringSystem_v2.py when it runs to keep the decay surfaces, e.g. {'Study_Extent': ...}
+
+# Variables - Base
+ws_Eco = Workspace_Folder + os.sep + "LII_Eco.gdb"
+ws_RS = Workspace_Folder + os.sep + "LII_ResourceStress.gdb"
+ws_LM = Workspace_Folder + os.sep + "LII_LandscapeMetrics.gdb"
+ws_Scenario = Workspace_Folder + os.sep + "LII_Scenarios"
+CompositeScoring_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "LII_2_CompositeScoringSystem_v2.py")
+Boundary_mask = Workspace_Folder + os.sep + "LII_Data.gdb" + os.sep + "boundary_mask"    # Boundary mask saved by LII_3_MovingWindowAnalysis_v2.py
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# PROCESS
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Create timer for calculating process time
+def timer(t):
+    m,s = divmod(time.time() - t,60)
+    m,s = int(m),int(s)
+    if m and s:
+        return "{} minutes {} seconds".format(m,s)
+    if m:
+        return "{} minutes".format(m)
+    return "{} seconds".format(s)
+
+clock = time.time()
+
+# The decay surfaces are only kept with Scenario_cache = True: compute the resource and stressor metrics again with it
+if not layer_years(ws_RS, Resource_list + Stressor_list):
+    run_stage(Stage("ResourceStressor", CompositeScoring_script, sections=["PROCESS 2."],
+                    parameters=dict(Script_parameters, Workspace_Folder=Workspace_Folder, Backend="numpy", Scenario_cache=True, Workers=Workers)))
+    print("Completed keeping the distance decay surfaces |Total run time so far: {}".format(timer(clock)))
+    print("------------------------------------------------------------------------------")
+
+Scenarios = read_scenarios(Scenario_csv)
+if Scenario_list:
+    Scenarios = dict((name, Scenarios[name]) for name in Scenario_list)
+Summary = run_scenarios(Scenarios, ws_Eco, ws_RS, ws_LM, ws_Scenario, Workers, Boundary_mask if store_exists(Boundary_mask) else None)
+print("Completed scoring scenarios " + ", ".join(Scenarios) + " |Total run time so far: {}".format(timer(clock)))
+print("Summary of the scenarios: " + Summary)
+print("------------------------------------------------------------------------------")
+
+if Sweep_distance_list:
+    Settings = run_sweep(ws_RS, Sweep_distance_list, Scenarios, ws_Scenario + os.sep + "LII_Sweep", workers=Workers)
+    print("Completed sweep of {} settings (maximum distances {}) |Total run time so far: {}".format(
+        len(Settings), ", ".join(str(d) for d in Sweep_distance_list), timer(clock)))
+    print("------------------------------------------------------------------------------")
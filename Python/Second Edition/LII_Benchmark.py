@@ -0,0 +1,379 @@
+# Name: LII_Benchmark.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Benchmark of every stage of the Landscape Integrity Index with the NumPy backend, on synthetic inputs
+#              shaped like the Carlsbad Field Office (CFO) data: 7203 x 5869 cells at 30 m.
+#              Synthetic inputs:
+#               - EVT, VDEP and NLCD: categorical rasters made of patches of classes, with scattered single cells.
+#               - Oil and gas wells: points clustered around fields. APD: line networks (random walks).
+#                 Vegetation treatments: polygons. The vectors are burned into the source raster of the distance stage
+#                 with LII_Rasterize.py.
+#              Each stage is timed on its own in a new process (clip/project, feature rasterize, habitat extraction,
+#              patch labeling, EDT decay, LUT reclass, Cell Statistics, focal mean, tiled focal mean,
+#              validation sampling), and reports:
+#               - cells/s: cells of the study area grid processed per second.
+#               - peak RSS: peak resident memory of the process running the stage (MB).
+#               - bytes moved: bytes of the input arrays read plus the output arrays written.
+#              Scaling curves: every stage over raster sizes (Scale_list, fraction of the CFO cells), and the per-year
+#              tasks of one stage over worker counts (Worker_list, with LII_Parallel.run_tasks).
+# Warning:
+#          - Run it as a script: python LII_Benchmark.py. The results are printed and saved to Output_csv.
+#          - The full CFO size needs several GB of memory for the distance, patch and focal stages.
+#          - Clip/project runs LII_Reproject.save_projected_rasters on a synthetic NLCD raster in CONUS Albers saved as a
+#          tile store in Scratch_folder (the reprojection index to NAD_1983_UTM_Zone_13N is computed in every run).
+#          Validation sampling has no ArcMap-free implementation in the scripts yet, so it is timed with the equivalent
+#          array operations (random cells sampled in the boundary and protected areas).
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys, csv, time, shutil
+import numpy as np
+from LII_MapAlgebra import Raster, RemapValue, Reclassify, CellStatistics
+from LII_Distance import euc_distance_batch, distance_decay
+from LII_Focal import FocalStatistics, focal_tiles
+from LII_Lookup import read_lut, landscape_metrics
+from LII_Patch import patch_acres
+from LII_Rasterize import point_cells, line_cells, polygon_cells, burn
+from LII_Habitat import habitat_lut, habitat_labels, habitat_raster
+from LII_Parallel import run_tasks, run_in_process
+from LII_Store import save_store, data_suffix
+from LII_Reproject import save_projected_rasters, parse_projection, transform
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Variables
+CFO_shape = (7203, 5869)        # Rows and columns of the CFO study area at 30 m
+Scale_list = [0.0625, 0.125, 0.25, 0.5, 1.0]    # Fractions of the CFO cells for the raster size scaling curve
+Worker_list = [1, 2, 4, 8, 16, 32]              # Worker counts for the core count scaling curve (up to the CPUs of the machine)
+Scaling_stage = 'edt_decay'     # Stage run as per-year tasks for the core count scaling curve
+Scaling_scale = 0.125           # Raster size of the per-year tasks of the core count scaling curve
+Year_count = 18                 # Per-year tasks of the core count scaling curve (2001 - 2018)
+Repeat = 1                      # Runs of each stage, the fastest one is reported
+Seed = 20261018
+Output_csv = "LII_Benchmark.csv"
+Scratch_folder = "LII_Benchmark_scratch"    # Tile stores of the clip/project stage, cleared at each setup
+
+maxDistance = 4000
+cell_size = 30
+patch_cells = 24                # Mean width in cells of the patches of the categorical rasters
+noise_fraction = 0.05           # Fraction of scattered single cells in the categorical rasters
+EVT_list = [76, 95, 2016, 2025, 2054, 2059, 2132, 2133, 2135, 2146, 2149, 2155, 2159, 2162, 2503, 2504, 3074, 3075, 3076, 3115]
+Val_list = ['Conifer', 'Conifer-Hardwood', 'Grassland', 'Riparian', 'Shrubland']
+NLCD_list = [11, 21, 22, 23, 24, 31, 41, 42, 43, 52, 71, 81, 82, 90, 95]
+GAP_status_list = [1, 2, 3, 4]  # GAP status codes of PADUS 2018
+Protected_area_list = [[1, 2], [3], [4]]    # GAP status codes of the protected, multiple use and unprotected areas (LII_4_ModelValidation_v2.py)
+Albers_wkt = ('PROJCS["USA_Contiguous_Albers_Equal_Area_Conic_USGS_version",GEOGCS["GCS_North_American_1983",'
+              'DATUM["D_North_American_1983",SPHEROID["GRS_1980",6378137.0,298.257222101]]],PROJECTION["Albers"],'
+              'PARAMETER["False_Easting",0.0],PARAMETER["False_Northing",0.0],PARAMETER["Central_Meridian",-96.0],'
+              'PARAMETER["Standard_Parallel_1",29.5],PARAMETER["Standard_Parallel_2",45.5],PARAMETER["Latitude_Of_Origin",23.0]]')
+UTM13N_wkt = ('PROJCS["NAD_1983_UTM_Zone_13N",GEOGCS["GCS_North_American_1983",'
+              'DATUM["D_North_American_1983",SPHEROID["GRS_1980",6378137.0,298.257222101]]],PROJECTION["Transverse_Mercator"],'
+              'PARAMETER["False_Easting",500000.0],PARAMETER["False_Northing",0.0],PARAMETER["Central_Meridian",-105.0],'
+              'PARAMETER["Scale_Factor",0.9996],PARAMETER["Latitude_Of_Origin",0.0]]')
+grassland_remap = RemapValue([[76, 1], [95, 1], [2132, 1], [2133, 1], [2135, 1], [2146, 1], [2149, 1], [2503, 1], ["NODATA", -10]])
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Rows and columns of a raster with scale x the cells of the CFO study area
+def scaled_shape(scale):
+    factor = np.sqrt(scale)
+    return max(1, int(round(CFO_shape[0] * factor))), max(1, int(round(CFO_shape[1] * factor)))
+
+# Categorical raster of patches of the classes of class_list with scattered single cells
+def categorical_raster(shape, class_list, rng):
+    rows, cols = shape
+    coarse = rng.integers(0, len(class_list), (rows // patch_cells + 1, cols // patch_cells + 1))
+    index = np.repeat(np.repeat(coarse, patch_cells, axis=0), patch_cells, axis=1)[:rows, :cols]
+    noise = rng.random(shape) < noise_fraction
+    index[noise] = rng.integers(0, len(class_list), int(noise.sum()))
+    return np.asarray(class_list, dtype=np.float64)[index]
+
+# Boundary of the study area: an ellipse touching the edges of the raster
+def boundary_mask(shape):
+    rows, cols = shape
+    r = (np.arange(rows) + 0.5) / rows * 2 - 1
+    c = (np.arange(cols) + 0.5) / cols * 2 - 1
+    return r[:, np.newaxis] ** 2 + c[np.newaxis, :] ** 2 <= 1
+
+# Oil and gas well points (row, column in cells) clustered around fields
+def well_points(shape, rng, count=20000, fields=40, spread=60):
+    centers = rng.random((fields, 2)) * shape
+    field = rng.integers(0, fields, count)
+    points = centers[field] + rng.normal(0, spread, (count, 2))
+    return np.clip(points, 0, np.asarray(shape) - 1)
+
+# APD line networks: random walks of segments (list of (vertices, 2) arrays in cells)
+def apd_lines(shape, rng, count=600, vertices=12, step=40):
+    lines = []
+    for start in rng.random((count, 2)) * shape:
+        walk = start + np.cumsum(rng.normal(0, step, (vertices, 2)), axis=0)
+        lines.append(np.clip(walk, 0, np.asarray(shape) - 1))
+    return lines
+
+# Vegetation treatment polygons: irregular polygons around random centers (list of (vertices, 2) arrays in cells)
+def treatment_polygons(shape, rng, count=300, vertices=10, radius=(10, 80)):
+    polygons = []
+    for center in rng.random((count, 2)) * shape:
+        angle = np.sort(rng.random(vertices)) * 2 * np.pi
+        size = rng.uniform(radius[0], radius[1]) * rng.uniform(0.6, 1.0, vertices)
+        polygons.append(center + np.column_stack([size * np.sin(angle), size * np.cos(angle)]))
+    return polygons
+
+# Source raster of the distance stage: 1 on the cells of the wells, APD lines and treatment polygons, NoData elsewhere
+def burn_sources(shape, points, lines, polygons):
+    index = np.concatenate([point_cells(points, shape), line_cells(lines, shape),
+                            polygon_cells([[polygon] for polygon in polygons], shape)])
+    return burn(index, 1.0, shape)
+
+# Smooth continuous raster (0 - 1) with NoData outside the boundary, like the LII
+def index_raster(shape, rng):
+    rows, cols = shape
+    coarse = rng.random((rows // 64 + 2, cols // 64 + 2))
+    r = np.linspace(0, coarse.shape[0] - 1.001, rows)
+    c = np.linspace(0, coarse.shape[1] - 1.001, cols)
+    r0, c0 = r.astype(np.int64), c.astype(np.int64)
+    fr, fc = (r - r0)[:, np.newaxis], (c - c0)[np.newaxis, :]
+    out = (coarse[np.ix_(r0, c0)] * (1 - fr) * (1 - fc) + coarse[np.ix_(r0 + 1, c0)] * fr * (1 - fc)
+           + coarse[np.ix_(r0, c0 + 1)] * (1 - fr) * fc + coarse[np.ix_(r0 + 1, c0 + 1)] * fr * fc)
+    out[~boundary_mask(shape)] = np.nan
+    return out
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Each stage has a setup (synthetic inputs of a raster shape, not timed) and a run (timed) function
+
+# NLCD raster in CONUS Albers covering a study area grid in UTM zone 13N (at the CFO), and the boundary mask of the
+# study area, saved as tile stores in Scratch_folder
+def clip_project_setup(shape, rng):
+    rows, cols = shape
+    if os.path.exists(Scratch_folder):
+        shutil.rmtree(Scratch_folder)
+    georef = {'geotransform': (560000.0, cell_size, 0.0, 3640000.0, 0.0, -cell_size), 'projection': UTM13N_wkt}
+    x = 560000.0 + np.array([0, cols, 0, cols]) * cell_size
+    y = 3640000.0 - np.array([0, 0, rows, rows]) * cell_size
+    x, y = transform(x, y, parse_projection(UTM13N_wkt), parse_projection(Albers_wkt))
+    x0, y0 = np.floor(x.min() / cell_size - 2) * cell_size, np.ceil(y.max() / cell_size + 2) * cell_size
+    source_shape = (int((y0 - y.min()) / cell_size) + 3, int((x.max() - x0) / cell_size) + 3)
+    source = save_store(categorical_raster(source_shape, NLCD_list, rng), os.path.join(Scratch_folder, "NLCD_Albers"),
+                        {'geotransform': (x0, cell_size, 0.0, y0, 0.0, -cell_size), 'projection': Albers_wkt})
+    mask = save_store(boundary_mask(shape), os.path.join(Scratch_folder, "boundary_mask"), georef, dtype='uint8')
+    return source, mask, shape, georef
+
+# Project the NLCD raster to the study area grid, clipped to the boundary mask (LII_Reproject.py)
+def clip_project_run(source, mask, shape, georef):
+    cache_folder = os.path.join(Scratch_folder, "cache")
+    if os.path.exists(cache_folder):
+        shutil.rmtree(cache_folder)
+    return save_projected_rasters([source], [os.path.join(Scratch_folder, "NLCD_UTM")], shape, georef, cache_folder, mask, 1)
+
+# EVT raster and a lookup of its codes to the 5 habitats (one code in 4 is none of them)
+def habitat_extraction_setup(shape, rng):
+    vat = dict((code, Val_list[i % 5] if i % 4 else "Other") for i, code in enumerate(EVT_list))
+    return categorical_raster(shape, EVT_list, rng), habitat_lut(vat, Val_list)
+
+# Habitat label raster, then the grassland raster reclassified as in the Composite Scoring System
+def habitat_extraction_run(evt, lut):
+    labels = habitat_labels(evt, lut)[0]
+    return labels, np.asarray(Reclassify(habitat_raster(Raster(evt), labels, Val_list.index('Grassland') + 1), "Value", grassland_remap))
+
+def patch_labeling_setup(shape, rng):
+    return (categorical_raster(shape, EVT_list, rng),)
+
+def patch_labeling_run(evt):
+    return np.asarray(patch_acres(evt))
+
+# Wells, APD lines and treatment polygons, as many per cell as on the CFO grid
+def feature_rasterize_setup(shape, rng):
+    scale = float(shape[0] * shape[1]) / (CFO_shape[0] * CFO_shape[1])
+    points = well_points(shape, rng, max(1, int(20000 * scale)))
+    lines = apd_lines(shape, rng, max(1, int(600 * scale)))
+    polygons = treatment_polygons(shape, rng, max(1, int(300 * scale)))
+    return shape, points, lines, polygons
+
+def feature_rasterize_run(shape, points, lines, polygons):
+    return burn_sources(shape, points, lines, polygons)
+
+def edt_decay_setup(shape, rng):
+    return (burn_sources(*feature_rasterize_setup(shape, rng)),)
+
+def edt_decay_run(source):
+    distance = euc_distance_batch(source, maxDistance, cell_size)[0]
+    return distance_decay(distance, source)
+
+def lut_reclass_setup(shape, rng):
+    lut = read_lut()
+    return categorical_raster(shape, NLCD_list, rng), lut[sorted(lut)[0]]
+
+def lut_reclass_run(nlcd, year_lut):
+    return landscape_metrics(nlcd, year_lut)
+
+def cell_statistics_setup(shape, rng):
+    layers = [categorical_raster(shape, [0.1, 0.3, 0.5, 0.7, 0.9, np.nan], rng) for i in range(4)]
+    return (layers,)
+
+def cell_statistics_run(layers):
+    return np.asarray(CellStatistics(layers, "MINIMUM", "DATA"))
+
+def focal_mean_setup(shape, rng):
+    return (Raster(index_raster(shape, rng)),)
+
+def focal_mean_run(lii):
+    return np.asarray(FocalStatistics(lii, "Circle 100 MAP", "MEAN", "DATA"))
+
+# Focal mean tile by tile with a halo of the circle radius (LII_Tiles.py)
+def focal_mean_tiled_run(lii):
+    return np.asarray(focal_tiles(lii, "Circle 100 MAP", "MEAN", "DATA"))
+
+def validation_sampling_setup(shape, rng):
+    protected = categorical_raster(shape, GAP_status_list, rng)
+    protected[~boundary_mask(shape)] = np.nan
+    return index_raster(shape, rng), protected, rng
+
+# 100 random points in the boundary and 50 and 100 in each of the protected, multiple use and unprotected areas,
+# then the LII value at each point
+def validation_sampling_run(lii, protected, rng):
+    values = []
+    inside = np.flatnonzero(~np.isnan(lii))
+    values.append(lii.ravel()[rng.choice(inside, 100)])
+    for status_list in Protected_area_list:
+        cells = np.flatnonzero(np.isin(protected, status_list))
+        for count in (50, 100):
+            values.append(lii.ravel()[rng.choice(cells, count)])
+    return values
+
+Stage_dict = {
+    'clip_project': (clip_project_setup, clip_project_run),
+    'feature_rasterize': (feature_rasterize_setup, feature_rasterize_run),
+    'habitat_extraction': (habitat_extraction_setup, habitat_extraction_run),
+    'patch_labeling': (patch_labeling_setup, patch_labeling_run),
+    'edt_decay': (edt_decay_setup, edt_decay_run),
+    'lut_reclass': (lut_reclass_setup, lut_reclass_run),
+    'cell_statistics': (cell_statistics_setup, cell_statistics_run),
+    'focal_mean': (focal_mean_setup, focal_mean_run),
+    'focal_mean_tiled': (focal_mean_setup, focal_mean_tiled_run),
+    'validation_sampling': (validation_sampling_setup, validation_sampling_run),
+}
+Stage_list = ['clip_project', 'feature_rasterize', 'habitat_extraction', 'patch_labeling', 'edt_decay', 'lut_reclass', 'cell_statistics', 'focal_mean', 'focal_mean_tiled', 'validation_sampling']
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Measuring
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Peak resident memory of this process in MB, None if it can't be measured
+def peak_rss():
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024.0 ** 2 if sys.platform == 'darwin' else peak / 1024.0
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    return getattr(info, 'peak_wset', info.rss) / 1024.0 ** 2
+
+# Bytes of the arrays and tile stores (paths) in a (nested) list, tuple or dict
+def array_bytes(x):
+    if isinstance(x, np.ndarray):
+        return x.nbytes
+    if isinstance(x, str):
+        return os.path.getsize(x + data_suffix) if os.path.isfile(x + data_suffix) else 0
+    if isinstance(x, dict):
+        return sum(array_bytes(v) for v in x.values())
+    if isinstance(x, (list, tuple)):
+        return sum(array_bytes(v) for v in x)
+    return 0
+
+# Time one stage on a raster shape. Returns a row of the report.
+def measure(stage, shape, seed=Seed, repeat=Repeat):
+    setup, run = Stage_dict[stage]
+    inputs = setup(shape, np.random.default_rng(seed))
+    input_rss = peak_rss()
+    seconds, out = None, None
+    for i in range(repeat):
+        out = None
+        clock = time.perf_counter()
+        out = run(*inputs)
+        elapsed = time.perf_counter() - clock
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    cells = shape[0] * shape[1]
+    return {'stage': stage, 'rows': shape[0], 'columns': shape[1], 'cells': cells, 'workers': 1,
+            'seconds': round(seconds, 4), 'cells_per_s': int(cells / seconds) if seconds else None,
+            'input_rss_mb': input_rss, 'peak_rss_mb': peak_rss(),
+            'bytes_moved': array_bytes(inputs) + array_bytes(out)}
+
+# Run measure in a new process, so the peak memory is the one of this stage only
+def measure_isolated(stage, shape):
+    return run_in_process(measure, [(stage, shape)])[0]
+
+# One per-year task of the core count scaling curve: the run of the stage on inputs made beforehand.
+# Returns the start and end time of the run (time.time(), comparable between processes).
+def year_task(stage, inputs):
+    start = time.time()
+    Stage_dict[stage][1](*inputs)
+    return start, time.time()
+
+# Wall time of Year_count per-year tasks of a stage on each worker count of Worker_list, from the start of the first
+# run to the end of the last one: the inputs are made before and the pool start is not timed
+def core_scaling(stage=None, scale=None):
+    stage = stage or Scaling_stage
+    shape = scaled_shape(scale or Scaling_scale)
+    setup = Stage_dict[stage][0]
+    task_list = [(stage, setup(shape, np.random.default_rng(Seed + year))) for year in range(Year_count)]
+    rows = []
+    for workers in [w for w in Worker_list if w <= (os.cpu_count() or 1)]:
+        times = run_tasks(year_task, task_list, workers)
+        seconds = max(end for start, end in times) - min(start for start, end in times)
+        cells = shape[0] * shape[1] * Year_count
+        rows.append({'stage': stage + '_x' + str(Year_count), 'rows': shape[0], 'columns': shape[1], 'cells': cells,
+                     'workers': workers, 'seconds': round(seconds, 4), 'cells_per_s': int(cells / seconds)})
+    return rows
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------------------------------------------------------
+
+Field_list = ['stage', 'rows', 'columns', 'cells', 'workers', 'seconds', 'cells_per_s', 'input_rss_mb', 'peak_rss_mb', 'bytes_moved']
+
+# Print a row of the report
+def print_row(row):
+    print("{:<24} {:>6} x {:<6} workers {:>2}  {:>9.3f} s  {:>12} cells/s  peak RSS {:>8} MB  {:>14} bytes".format(
+        row['stage'], row['rows'], row['columns'], row['workers'], row['seconds'], row['cells_per_s'],
+        "" if row.get('peak_rss_mb') is None else int(row['peak_rss_mb']), row.get('bytes_moved', "")))
+
+# Run the raster size and core count scaling curves, print them and save them to out_csv
+def run_benchmark(stage_list=Stage_list, scale_list=Scale_list, out_csv=Output_csv):
+    report = []
+    print("Raster size scaling (CFO = {} x {} cells)".format(*CFO_shape))
+    for stage in stage_list:
+        for scale in scale_list:
+            row = measure_isolated(stage, scaled_shape(scale))
+            print_row(row)
+            report.append(row)
+    print("Core count scaling ({} per-year tasks of {})".format(Year_count, Scaling_stage))
+    for row in core_scaling():
+        print_row(row)
+        report.append(row)
+    with open(out_csv, 'w', newline='') as f:
+        writer = csv.DictWriter(f, Field_list)
+        writer.writeheader()
+        writer.writerows(report)
+    print("Saved " + out_csv)
+    return report
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# PROCESS
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Import this file as a module, so the worker processes find the stage functions under LII_Benchmark and not __main__
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import LII_Benchmark
+    LII_Benchmark.run_benchmark()
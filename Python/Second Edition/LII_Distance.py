@@ -0,0 +1,239 @@
+# Name: LII_Distance.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Exact Euclidean distance transform for the resource- and stressor-based metrics of the Composite Scoring System.
+#              Separable two-phase algorithm (Meijster / Felzenszwalb-Huttenlocher), linear in the number of cells:
+#               1. Column phase: distance (in cells) to the nearest source in the same column, swept down and up
+#                  all columns at once and capped at the maximum distance.
+#               2. Row phase: lower envelope of the parabolas (x - q)^2 + g(q)^2 along every row, all rows at once.
+#                  Rows with no source within the maximum distance are skipped.
+#              All layer-years are processed in one batched call (euc_distance_batch) and the output is the same
+#              as EucDistance(ras, maxDistance, cell_size): distance in map units from the source cell centers,
+#              0 on the sources and NoData (NaN) beyond the maximum distance.
+#              distance_decay fuses the distance decay chain of the scoring script into one stage:
+#               EucDis -> Log10 -> Null -> nor -> Log10IP -> Log10IP_Null -> SetNull
+#              A first pass over the blocks of the distance raster gathers the min and max for the normalization,
+#              a second pass computes the final _Log10IP_Null_SetNull values block by block without any intermediate raster.
+#              save_distance_decay_tiles runs the same on rasters on disk tile by tile (LII_Tiles.py): the distance of a
+#              tile only depends on the sources within the maximum distance, so each tile is read with a halo of the
+#              maximum distance (134 cells for 4000 m at 30 m), and memory is bounded by the tile size.
+#              The normalized Log 10 surface (_EucDis_Log10_Null_nor) doesn't depend on the impact score, so it can be
+#              kept (keep_nor) for LII_Scenario.py to score the layer-years again with other impact scores.
+# Warning:
+#          - Source cells are the cells that are not NoData (NaN), as in EucDistance on a raster source.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import numpy as np
+from LII_MapAlgebra import block_windows, block_apply, block_size, create_raster, write_window, close_raster
+from LII_Store import create_store, delete_store
+from LII_Stats import RasterStats, save_stats
+from LII_Tiles import open_inputs, halo_tiles, tile_size
+
+# Variables
+row_chunk = 4096    # Rows processed together in the row phase (memory is ~ 3 x row_chunk x columns x 8 bytes)
+null_value = -10    # Value given to NoData by the "Calculate the null" steps: Con(IsNull(ras), -10, ras)
+distance_suffix = "_EucDis"     # Scratch distance raster of save_distance_decay_tiles: source raster name + distance_suffix
+nor_suffix = "_EucDis_Log10_Null_nor"   # Normalized Log 10 surface kept with keep_nor: source raster name + nor_suffix
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Distance transform
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Return the maximum distance in cells, or None for no maximum distance
+def max_cells(maximum_distance, cell_size):
+    if maximum_distance in (None, "", "#", 0):
+        return None
+    return int(np.floor(float(maximum_distance) / float(cell_size)))
+
+# Column phase: distance in cells to the nearest source in the same column for a (layers, rows, columns) stack.
+# Distances over cap are set to cap + 1 (no source within the maximum distance).
+def column_distance(sources, cap):
+    layers, rows, cols = sources.shape
+    far = rows + cols if cap is None else cap + 1
+    g = np.where(sources, 0, far).astype(np.int32)
+    for i in range(1, rows):
+        np.minimum(g[:, i, :], g[:, i - 1, :] + 1, out=g[:, i, :])
+    for i in range(rows - 2, -1, -1):
+        np.minimum(g[:, i, :], g[:, i + 1, :] + 1, out=g[:, i, :])
+    np.minimum(g, far, out=g)
+    return g, far
+
+# Row phase: squared distance in cells along each row of g (rows, columns), from the lower envelope of parabolas.
+# Columns with g == far are not sources of a parabola. Rows without any parabola get -1.
+def row_distance(g, far):
+    rows, n = g.shape
+    f = g.astype(np.float64) ** 2
+    finite = g < far
+    out = np.full((rows, n), -1, dtype=np.int64)
+    busy = np.flatnonzero(finite.any(axis=1))
+    for start in range(0, len(busy), row_chunk):
+        r = busy[start:start + row_chunk]
+        out[r] = lower_envelope(f[r], finite[r])
+    return out
+
+# Felzenszwalb-Huttenlocher lower envelope for many rows at once.
+# v[row, k] holds the column of the k-th parabola of the envelope and z[row, k] where it starts.
+def lower_envelope(f, finite):
+    rows, n = f.shape
+    idx = np.arange(rows)
+    v = np.zeros((rows, n), dtype=np.int64)
+    z = np.empty((rows, n + 1))
+    k = np.full(rows, -1, dtype=np.int64)
+
+    for q in range(n):
+        active = finite[:, q]
+        if not active.any():
+            continue
+        first = active & (k < 0)
+        if first.any():
+            r = idx[first]
+            k[r] = 0
+            v[r, 0] = q
+            z[r, 0] = -np.inf
+            z[r, 1] = np.inf
+        r = idx[active & ~first]
+        if len(r) == 0:
+            continue
+        fq = f[r, q] + q * q
+        s = intersection(f, r, v[r, k[r]], fq, q)
+        pop = s <= z[r, k[r]]
+        while pop.any():
+            k[r[pop]] -= 1
+            s[pop] = intersection(f, r[pop], v[r[pop], k[r[pop]]], fq[pop], q)
+            pop[pop] = s[pop] <= z[r[pop], k[r[pop]]]
+        k[r] += 1
+        v[r, k[r]] = q
+        z[r, k[r]] = s
+        z[r, k[r] + 1] = np.inf
+
+    d2 = np.empty((rows, n), dtype=np.int64)
+    k[:] = 0
+    for q in range(n):
+        step = z[idx, k + 1] < q
+        while step.any():
+            k[step] += 1
+            step = z[idx, k + 1] < q
+        vk = v[idx, k]
+        d2[:, q] = (q - vk) ** 2 + f[idx, vk].astype(np.int64)
+    return d2
+
+# Column where the parabola of column q starts to be lower than the parabola of column p
+def intersection(f, r, p, fq, q):
+    return (fq - (f[r, p] + p * p)) / (2.0 * (q - p))
+
+# Euclidean distance for a stack of source rasters (layers, rows, columns) or a list of rasters with the same shape.
+# Returns a float64 stack of distances in map units with NaN beyond maximum_distance.
+def euc_distance_batch(in_source_data, maximum_distance=None, cell_size=30):
+    stack = np.asarray(in_source_data, dtype=np.float64)
+    if stack.ndim == 2:
+        stack = stack[np.newaxis]
+    layers, rows, cols = stack.shape
+    cap = max_cells(maximum_distance, cell_size)
+    g, far = column_distance(~np.isnan(stack), cap)
+    d2 = row_distance(g.reshape(layers * rows, cols), far).reshape(layers, rows, cols)
+    out = d2.astype(np.float64)
+    out[d2 < 0] = np.nan
+    out = np.sqrt(out) * float(cell_size)
+    if cap is not None:
+        out[out > float(maximum_distance)] = np.nan
+    return out
+
+# Euclidean distance of one source raster, same as arcpy.sa.EucDistance(in_source_data, maximum_distance, cell_size)
+def EucDistance(in_source_data, maximum_distance=None, cell_size=30):
+    out = euc_distance_batch(in_source_data, maximum_distance, cell_size)[0]
+    if hasattr(in_source_data, 'georef'):
+        return type(in_source_data)(out, in_source_data.georef)
+    return out
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Distance decay
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Log 10 of a distance block with NoData as -10, same as the _EucDis_Log10_Null raster.
+# Source cells (distance 0) and cells beyond the maximum distance (NaN) get -10.
+def log10_null(distance):
+    out = np.full(np.shape(distance), float(null_value))
+    with np.errstate(invalid='ignore'):
+        positive = distance > 0
+    out[positive] = np.log10(distance[positive])
+    return out
+
+# First pass: min and max of the _EucDis_Log10_Null raster, read block by block
+def decay_range(distance, block_size=block_size):
+    low, high = np.inf, -np.inf
+    for window in block_windows(np.shape(distance), block_size):
+        values = log10_null(np.asarray(distance[window], dtype=np.float64))
+        low = min(low, values.min())
+        high = max(high, values.max())
+    return float(low), float(high)
+
+# _EucDis_Log10_Null_nor block from a distance block and the min and max of the first pass:
+#   nor = (Log10_Null - min) / (max - min)
+def decay_nor(distance, low, high):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (log10_null(distance) - low) / (high - low)
+
+# _Log10IP_Null_SetNull block from a nor block and the source block (IP on the sources, NaN elsewhere).
+# Same cell values as the chain of the scoring script:
+#   Log10IP = Con(nor & Null, nor * Null, Con(nor, nor, Con(Null, Null)))
+#   SetNull((Con(IsNull(Log10IP), -10, Log10IP) < 0) | (... == 100), ...)
+def impact_block(nor, source):
+    ip_null = np.where(np.isnan(source), float(null_value), source)
+    out = np.where(nor != 0, np.where(ip_null != 0, nor * ip_null, nor), np.where(ip_null != 0, ip_null, np.nan))
+    out = np.where(np.isnan(nor), np.nan, out)
+    out = np.where(np.isnan(out), float(null_value), out)
+    return np.where((out < 0) | (out == 100), np.nan, out)
+
+# Second pass: _Log10IP_Null_SetNull block from a distance block and the source block
+def decay_block(distance, source, low, high):
+    return impact_block(decay_nor(distance, low, high), source)
+
+# Fused distance decay of one layer-year: distance raster (from euc_distance_batch) and source raster to the final
+# decayed impact raster, with only one block of temporaries in memory at a time
+def distance_decay(distance, source, out=None, block_size=block_size):
+    low, high = decay_range(distance, block_size)
+    return block_apply(lambda d, s: decay_block(d, s, low, high), [distance, source], out, block_size)
+
+# Fused distance decay of all years of a resource or stressor (source rasters on disk) computed tile by tile.
+# First pass: batched distance of every tile with a halo of the maximum distance, saved to a float64 scratch raster
+# (source + "_EucDis"), and the min and max of its Log 10. Second pass: the final values block by block, saved to
+# out_rasters, and with keep_nor=True the nor surface to source + "_EucDis_Log10_Null_nor".
+# The scratch rasters are deleted at the end. Returns out_rasters.
+def save_distance_decay_tiles(in_rasters, out_rasters, maximum_distance, cell_size=30, tile_size=tile_size, keep_nor=False):
+    cap = max_cells(maximum_distance, cell_size)
+    if cap is None:
+        raise ValueError("Tiled Euclidean distance needs a maximum distance")
+    readers, shape, georef = open_inputs(in_rasters)
+    distance_list = [create_store(Input + distance_suffix, shape, georef, dtype='float64') for Input in in_rasters]
+    low, high = [np.inf] * len(in_rasters), [-np.inf] * len(in_rasters)
+    for window, sources, inner in halo_tiles(readers, shape, cap, tile_size):
+        tile = euc_distance_batch(sources, maximum_distance, cell_size)[(slice(None),) + inner]
+        for i, distance in enumerate(tile):
+            distance_list[i].write(distance, window)
+            values = log10_null(distance)
+            low[i], high[i] = min(low[i], values.min()), max(high[i], values.max())
+    for i, OutputName in enumerate(out_rasters):
+        ds, rb, path = create_raster(OutputName, shape, georef)
+        stats = RasterStats()
+        if keep_nor:
+            nor_ds, nor_rb, nor_path = create_raster(in_rasters[i] + nor_suffix, shape, georef)
+            nor_stats = RasterStats()
+        for window in block_windows(shape, tile_size):
+            nor = decay_nor(distance_list[i].read(window), low[i], high[i])
+            block = impact_block(nor, readers[i](window))
+            write_window(rb, block, window)
+            stats.add(block)
+            if keep_nor:
+                write_window(nor_rb, nor, window)
+                nor_stats.add(nor)
+        close_raster(rb)
+        save_stats(path, stats)
+        if keep_nor:
+            close_raster(nor_rb)
+            save_stats(nor_path, nor_stats)
+            nor_ds = nor_rb = None
+        ds = rb = distance_list[i] = None
+        delete_store(in_rasters[i] + distance_suffix)
+    return list(out_rasters)
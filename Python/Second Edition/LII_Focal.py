@@ -0,0 +1,171 @@
+# Name: LII_Focal.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Focal Statistics for the moving window analysis of the Landscape Integrity Index, used in place of
+#              arcpy.sa.FocalStatistics(ras, "Circle 100 MAP", "MEAN", "DATA").
+#              The window sum is built from row runs over per-row prefix sums:
+#               - Each row of the circle is a run of 2w + 1 cells, and the sum of a run is the difference of two
+#                 prefix sums, so one row of the circle costs 2 operations per cell whatever its width.
+#               - The circle is summed row by row (2r + 1 rows) with whole-raster array operations,
+#                 instead of visiting the ~3.14 r^2 cells of the window for every output cell.
+#               - Rectangles use a summed-area table (4 operations per cell for any size).
+#              A count plane of the cells with data is summed the same way, so "DATA" gives the mean of the cells
+#              with data in the window (NoData where there is none) and "NODATA" gives NoData where any cell is NoData.
+#              A raster on disk (path) is computed tile by tile with a halo of the neighborhood radius (LII_Tiles.py),
+#              so the memory is bounded by the tile size and the result is the same as for the whole raster.
+# Warning:
+#          - Cells of the window outside the raster are treated as NoData, as in Spatial Analyst.
+#          - A cell is in the circle when its center is within the radius of the center of the processing cell.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import numpy as np
+from LII_MapAlgebra import Raster
+from LII_Tiles import halo_raster, open_inputs, tile_size
+
+# Variables
+cell_size = 30      # Cell size used for "MAP" units when the raster has no georeference
+Statistics_list = ['MEAN', 'SUM']
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Neighborhood
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Neighborhood of Focal Statistics, same as arcpy.sa.NbrCircle(radius, units) and NbrRectangle(width, height, units)
+class NbrCircle(object):
+
+    def __init__(self, radius=3, units="CELL"):
+        self.radius = radius
+        self.units = units
+
+class NbrRectangle(object):
+
+    def __init__(self, width=3, height=3, units="CELL"):
+        self.width = width
+        self.height = height
+        self.units = units
+
+# Return the neighborhood of a string such as "Circle 100 MAP" or "Rectangle 3 3 CELL"
+def parse_neighborhood(neighborhood):
+    if not isinstance(neighborhood, str):
+        return neighborhood
+    parts = neighborhood.split()
+    shape = parts[0].upper()
+    units = parts[-1].upper() if parts[-1].upper() in ("CELL", "MAP") else "CELL"
+    if shape == "CIRCLE":
+        return NbrCircle(float(parts[1]), units)
+    if shape == "RECTANGLE":
+        return NbrRectangle(float(parts[1]), float(parts[2]), units)
+    raise ValueError("Unsupported neighborhood " + neighborhood)
+
+# Return the cell size of a raster or georeference, or the default cell size
+def raster_cell_size(in_raster):
+    georef = in_raster if isinstance(in_raster, dict) else getattr(in_raster, 'georef', None)
+    if georef:
+        return abs(float(georef['geotransform'][1]))
+    return float(cell_size)
+
+# Return a length of the neighborhood in cells
+def to_cells(length, units, size):
+    if units.upper() == "MAP":
+        return float(length) / size
+    return float(length)
+
+# Halo of a neighborhood in cells: the farthest row or column of the window from the processing cell
+def neighborhood_halo(nbr, size):
+    if isinstance(nbr, NbrCircle):
+        return int(np.floor(to_cells(nbr.radius, nbr.units, size)))
+    height = int(round(to_cells(nbr.height, nbr.units, size)))
+    width = int(round(to_cells(nbr.width, nbr.units, size)))
+    return max(height, width) // 2
+
+# Half-width in cells of each row of a circle of radius r cells, from row offset -R to R
+def circle_runs(r):
+    R = int(np.floor(r))
+    dy = np.arange(-R, R + 1)
+    return dy, np.floor(np.sqrt(r * r - dy * dy) + 1e-9).astype(np.int64)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Window sums
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Sum of a plane over a circle of radius r cells around every cell, from row runs over per-row prefix sums
+def circle_sum(plane, r):
+    rows, cols = plane.shape
+    dy, half = circle_runs(r)
+    pad = int(half.max())
+    prefix = np.zeros((rows, cols + 1))
+    np.cumsum(plane, axis=1, out=prefix[:, 1:])
+    # Pad the prefix sums so that runs going past the left or right edge are clipped to the raster
+    prefix = np.concatenate([np.repeat(prefix[:, :1], pad, axis=1), prefix, np.repeat(prefix[:, -1:], pad, axis=1)], axis=1)
+    out = np.zeros((rows, cols))
+    for offset, w in zip(dy, half):
+        top, bottom = max(0, -offset), min(rows, rows - offset)
+        if top >= bottom:
+            continue
+        src = slice(top + offset, bottom + offset)
+        out[top:bottom] += prefix[src, pad + w + 1:pad + w + 1 + cols] - prefix[src, pad - w:pad - w + cols]
+    return out
+
+# Sum of a plane over a rectangle of height x width cells around every cell, from a summed-area table
+def rectangle_sum(plane, height, width):
+    rows, cols = plane.shape
+    table = np.zeros((rows + 1, cols + 1))
+    table[1:, 1:] = plane.cumsum(axis=0).cumsum(axis=1)
+    # Spatial Analyst centers even-sized rectangles one cell up and left of the processing cell
+    up, left = height // 2, width // 2
+    r0 = np.clip(np.arange(rows) - up, 0, rows)
+    r1 = np.clip(np.arange(rows) - up + height, 0, rows)
+    c0 = np.clip(np.arange(cols) - left, 0, cols)
+    c1 = np.clip(np.arange(cols) - left + width, 0, cols)
+    return (table[np.ix_(r1, c1)] - table[np.ix_(r0, c1)] - table[np.ix_(r1, c0)] + table[np.ix_(r0, c0)])
+
+# Sum of a plane over the neighborhood of every cell
+def window_sum(plane, neighborhood, size):
+    if isinstance(neighborhood, NbrCircle):
+        return circle_sum(plane, to_cells(neighborhood.radius, neighborhood.units, size))
+    height = int(round(to_cells(neighborhood.height, neighborhood.units, size)))
+    width = int(round(to_cells(neighborhood.width, neighborhood.units, size)))
+    return rectangle_sum(plane, height, width)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Focal Statistics
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Focal Statistics of an array (NoData as NaN), cells outside the array treated as NoData
+def focal_array(a, nbr, size, statistics_type="MEAN", ignore_nodata="DATA"):
+    statistics_type = statistics_type.upper()
+    valid = ~np.isnan(a)
+    total = window_sum(np.where(valid, a, 0.0), nbr, size)
+    count = np.rint(window_sum(valid.astype(np.float64), nbr, size))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out = total / count if statistics_type == 'MEAN' else total
+    out = np.where(count == 0, np.nan, out)
+    if ignore_nodata.upper() != "DATA":
+        full = np.rint(window_sum(np.ones(a.shape), nbr, size))
+        out = np.where(count < full, np.nan, out)
+    return out
+
+# Focal Statistics of a raster (path or array) computed tile by tile with a halo of the neighborhood radius.
+# Returns a BlockRaster: save() writes one tile at a time.
+def focal_tiles(in_raster, neighborhood="Rectangle 3 3 CELL", statistics_type="MEAN", ignore_nodata="DATA", tile_size=tile_size):
+    nbr = parse_neighborhood(neighborhood)
+    size = raster_cell_size(open_inputs([in_raster])[2])
+    return halo_raster(lambda a: focal_array(a, nbr, size, statistics_type, ignore_nodata), [in_raster], neighborhood_halo(nbr, size), tile_size)
+
+# Focal Statistics with a circle or rectangle neighborhood, same as arcpy.sa.FocalStatistics for MEAN and SUM.
+# ignore_nodata: "DATA" uses the cells with data in the window, "NODATA" gives NoData where any cell is NoData.
+# A path is computed tile by tile (focal_tiles), an array or Raster as a whole.
+def FocalStatistics(in_raster, neighborhood="Rectangle 3 3 CELL", statistics_type="MEAN", ignore_nodata="DATA"):
+    statistics_type = statistics_type.upper()
+    if statistics_type not in Statistics_list:
+        raise ValueError("Unsupported statistics type " + statistics_type)
+    if isinstance(in_raster, str):
+        return focal_tiles(in_raster, neighborhood, statistics_type, ignore_nodata)
+    nbr = parse_neighborhood(neighborhood)
+    size = raster_cell_size(in_raster)
+    out = focal_array(np.asarray(in_raster, dtype=np.float64), nbr, size, statistics_type, ignore_nodata)
+    if hasattr(in_raster, 'georef'):
+        return type(in_raster)(out, in_raster.georef)
+    return out
@@ -0,0 +1,98 @@
+# Name: LII_Habitat.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, ArcMap 10.7 or ArcGIS Pro (arcpy, only for reading the EVT attribute table)
+# Description: Habitats of the ecological integrity indicators from the EVT rasters in one pass, used in place of
+#              ExtractByAttributes(EVT, "SYSTMGRPPH = 'Grassland'") run once per habitat and year:
+#               1. The value attribute table of an EVT raster is compiled once into a lookup from EVT code to habitat
+#                  (habitat_lut), with the same field as the queries (SYSTMGRPPH or EVT_PHYS).
+#               2. Each block of the EVT raster is read once and looked up, giving a habitat label raster
+#                  (uint8: 1 - 5 in the order of Habitat_list, 0 for other classes and NoData), saved as
+#                  "EVT" + year + "_habitat" next to the EVT raster.
+#               3. The habitat raster used by Reclassify, Region Group (LII_Patch.py) and Euclidean Distance is
+#                  taken from the EVT and label rasters in memory (habitat_raster), without a raster per habitat on disk.
+#                  For Reclassify, a habitat with few cells (e.g. riparian) is a sparse raster (LII_Sparse.py).
+# Warning:
+#          - The label raster is saved in the tile store of LII_Store.py (uint8), whatever the scratch format.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+import numpy as np
+from LII_MapAlgebra import Raster, open_raster, dataset_shape, read_window, georef_of_dataset, block_windows, block_size
+from LII_Store import save_store
+from LII_Sparse import SparseRaster, is_sparse
+
+# Variables
+label_suffix = "_habitat"   # Name of the label raster: EVT raster name + label_suffix
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Habitat labels
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Read the value attribute table of a raster: {value: class in field}
+def read_vat(in_raster, field):
+    import arcpy
+    with arcpy.da.SearchCursor(in_raster, ["Value", field]) as cursor:
+        return dict((int(value), name) for value, name in cursor)
+
+# Lookup from code to habitat number (uint8 array indexed by code): position in val_list + 1, 0 for other classes
+def habitat_lut(vat, val_list):
+    lut = np.zeros(max(list(vat) + [0]) + 1, dtype=np.uint8)
+    for value, name in vat.items():
+        if name in val_list and value >= 0:
+            lut[value] = val_list.index(name) + 1
+    return lut
+
+# Habitat numbers of a block of codes (NaN and codes missing from the lookup give 0)
+def label_block(block, lut):
+    block = np.asarray(block, dtype=np.float64)
+    valid = ~np.isnan(block) & (block >= 0) & (block < len(lut))
+    out = np.zeros(block.shape, dtype=np.uint8)
+    out[valid] = lut[block[valid].astype(np.int64)]
+    return out
+
+# Habitat label raster of an EVT raster (path or array), reading each block once. Returns the uint8 labels and the georeference.
+def habitat_labels(evt_raster, lut, block_size=block_size):
+    if not isinstance(evt_raster, str):
+        return label_block(evt_raster, lut), getattr(evt_raster, 'georef', None)
+    ds, rb, nd = open_raster(evt_raster)
+    shape = dataset_shape(ds)
+    labels = np.zeros(shape, dtype=np.uint8)
+    for window in block_windows(shape, block_size):
+        labels[window] = label_block(read_window(rb, nd, window), lut)
+    georef = georef_of_dataset(ds)
+    ds = None
+    return labels, georef
+
+# Compile the attribute table of an EVT raster once and save its habitat label raster (EVT + label_suffix). Returns its path.
+# vat_raster is the raster the attribute table is read from when the EVT raster has none (projected by LII_Reproject.py).
+def save_habitat_labels(evt_raster, field, val_list, out_raster=None, vat_raster=None):
+    out_raster = out_raster or evt_raster + label_suffix
+    labels, georef = habitat_labels(evt_raster, habitat_lut(read_vat(vat_raster or evt_raster, field), val_list))
+    return save_store(labels, out_raster, georef, dtype='uint8')
+
+# Read a habitat label raster as uint8
+def read_habitat_labels(in_raster):
+    ds, rb, nd = open_raster(in_raster)
+    labels = np.asarray(read_window(rb, nd))
+    ds = None
+    return np.where(np.isnan(labels), 0, labels).astype(np.uint8) if labels.dtype.kind == 'f' else labels
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Habitat rasters
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Habitat raster: the EVT values of the cells with habitat number, NoData elsewhere.
+# Same as ExtractByAttributes(EVT, habitat query).
+def habitat_raster(evt_raster, labels, number):
+    evt = evt_raster if isinstance(evt_raster, Raster) else Raster(evt_raster)
+    return Raster(np.where(labels == number, evt, np.nan), evt.georef)
+
+# Habitat raster of a habitat and year name (e.g. grassland2001) from the EVT and label rasters of that year in workspace.
+# A SparseRaster when fewer than sparse_limit of the cells are in the habitat, so Reclassify only works on its tiles.
+def extract_habitat(workspace, name, habitat_list):
+    habitat, year = name[:-4], name[-4:]
+    evt = os.path.join(workspace, "EVT" + year)
+    ras = habitat_raster(evt, read_habitat_labels(evt + label_suffix), habitat_list.index(habitat) + 1)
+    return SparseRaster.from_array(ras, ras.georef) if is_sparse(ras) else ras
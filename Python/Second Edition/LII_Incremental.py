@@ -0,0 +1,131 @@
+# Name: LII_Incremental.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Append-a-year mode for the multi-year means of the Moving Window Analysis (LII_CellStats, eco_CellStats,
+#              resource_CellStats, stressor_CellStats, landscapemetrics_CellStats) with the NumPy backend.
+#              Each mean keeps its running sum and count of data cells next to it (tile stores):
+#               - mean + "_sum" (float64) and mean + "_count" (uint16): sum and count of the inputs folded so far.
+#               - mean + "_inputs.json": the inputs folded so far and their modification times.
+#              update_mean folds only the inputs that are not in the sum yet (e.g. LII2019_CellStats) and saves the
+#              mean as sum / count, same as CellStatistics(inputs, "MEAN", "DATA"), without reading the other years.
+#              When a folded input changed or is not in the inputs anymore, the sum and count are rebuilt from all inputs.
+#              The inputs are folded block by block (the tiles of the sum), with the mean of each block saved as it is
+#              folded, so memory is a few blocks whatever the size of the rasters.
+# Warning:
+#          - An input listed twice is folded twice, as CellStatistics counts it twice.
+#          - The inputs list is removed while the sum and count are updated: if the run stops, the next one rebuilds them.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, io, json
+import numpy as np
+from collections import Counter
+from LII_MapAlgebra import save_blocks, block_windows
+from LII_Store import TileStore, store_exists, create_store
+from LII_Tiles import open_inputs
+from LII_Pipeline import path_time
+
+# Variables
+sum_suffix = "_sum"
+count_suffix = "_count"
+inputs_suffix = "_inputs.json"
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Running sum and count
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Read the folded inputs [[path, modification time]] of a mean. None if it has no running sum and count.
+def read_inputs(out_raster):
+    if not (store_exists(out_raster + sum_suffix) and store_exists(out_raster + count_suffix)):
+        return None
+    try:
+        with io.open(out_raster + inputs_suffix, encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+# Save the folded inputs of a mean
+def save_inputs(out_raster, inputs):
+    with io.open(out_raster + inputs_suffix, 'w', encoding='utf-8') as f:
+        f.write(u"" + json.dumps(inputs, indent=2))
+
+# Open the running sum and count of a mean for writing, or create them (shape, georef) when new
+def open_state(out_raster, new, shape=None, georef=None):
+    if new:
+        return (create_store(out_raster + sum_suffix, shape, georef, dtype='float64'),
+                create_store(out_raster + count_suffix, shape, georef, dtype='uint16'))
+    return TileStore(os.path.abspath(out_raster + sum_suffix), mode="r+"), TileStore(os.path.abspath(out_raster + count_suffix), mode="r+")
+
+# Add the data cells of a raster to the running sum and count
+def fold(total, count, array):
+    valid = ~np.isnan(array)
+    total[valid] += array[valid]
+    count += valid
+
+# Fold the inputs (window readers) into the running sum and count block by block, and yield (window, mean block).
+# new starts the sum and count from zeros instead of reading them.
+def fold_blocks(readers, total, count, new):
+    for window in block_windows(total.shape, total.tile_size):
+        rows, cols = window
+        if new:
+            total_block = np.zeros((rows.stop - rows.start, cols.stop - cols.start))
+            count_block = np.zeros(total_block.shape, dtype=np.uint16)
+        else:
+            total_block = np.array(total.read(window), dtype=np.float64)
+            count_block = np.array(count.read(window), dtype=np.uint16)
+        for reader in readers:
+            fold(total_block, count_block, reader(window))
+        total.write(total_block, window)
+        count.write(count_block, window)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            yield window, np.where(count_block == 0, np.nan, total_block / count_block)
+
+# Inputs to fold: the inputs not folded yet (an input listed n times is folded n times).
+# None if a folded input changed or is not in in_rasters anymore, so the sum must be rebuilt.
+def new_inputs(in_rasters, inputs):
+    folded = Counter((path, time) for path, time in inputs)
+    current = Counter((path, path_time(path)) for path in in_rasters)
+    if folded - current:
+        return None
+    pending = current - folded
+    todo = []
+    for path in in_rasters:
+        key = (path, path_time(path))
+        if pending[key] > 0:
+            pending[key] -= 1
+            todo.append(path)
+    return todo
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Mean
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Mean of in_rasters with NoData ignored (CellStatistics MEAN, DATA) saved to out_raster, folding only the inputs that are
+# not in its running sum yet. rebuild=True starts from all inputs. Returns out_raster.
+def update_mean(in_rasters, out_raster, rebuild=False):
+    inputs = None if rebuild else read_inputs(out_raster)
+    todo = None if inputs is None else new_inputs(in_rasters, inputs)
+    new = todo is None
+    if new:
+        inputs, todo = [], list(in_rasters)
+    if new and not todo:
+        raise ValueError("No inputs for the mean " + out_raster)
+    readers, shape, georef = open_inputs(todo) if todo else ([], None, None)
+    total, count = open_state(out_raster, new, shape, georef)
+    if shape is not None and tuple(shape) != total.shape:
+        raise ValueError("Inputs of the mean " + out_raster + " must be on the grid of its running sum")
+    if os.path.isfile(out_raster + inputs_suffix):
+        os.remove(out_raster + inputs_suffix)
+    save_blocks(fold_blocks(readers, total, count, new), total.shape, out_raster, total.georef)
+    total.flush()
+    count.flush()
+    save_inputs(out_raster, inputs + [[path, path_time(path)] for path in todo])
+    return out_raster
+
+# True if out_raster is missing or older than one of in_rasters (the per-year Cell Statistics to compute again)
+def out_of_date(out_raster, in_rasters):
+    out_time = path_time(out_raster)
+    if out_time is None:
+        return True
+    return any(path_time(path) is None or path_time(path) > out_time for path in in_rasters)
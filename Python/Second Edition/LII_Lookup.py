@@ -0,0 +1,121 @@
+# Name: LII_Lookup.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, GDAL (only for reading and saving rasters)
+# Description: Lookup-table reclassification of NLCD into the landscape metrics of the Composite Scoring System.
+#              The value of every metric for every NLCD class and year is read from LII_LandscapeMetrics_LUT.csv
+#              (Year, Value, PAFRAC, CAI_CV, CORE_CV, CLUMPY) instead of nested Con(NLCD == 11, ..., Con(...)) chains.
+#              For each year the four metrics and their normalizations (_nor) are columns of one table indexed by
+#              NLCD class, so all eight bands of an NLCD block come from one read and one gather:
+#               1. First pass: histogram of the NLCD classes, which gives the min and max of the metrics that are
+#                  normalized with their own min and max (CAI_CV, CORE_CV) without reclassifying anything.
+#               2. Second pass: table[NLCD block] for all bands, each band written block by block with its
+#                  statistics sidecar (LII_Stats.py), so the scripts normalizing a band read its min and max from the sidecar.
+# Warning:
+#          - Same values as the Con chains: classes that are not in the table get -10, NoData stays NoData.
+#          - PAFRAC is normalized between 1 and 2, CLUMPY between -1 and 1, CAI_CV and CORE_CV between the
+#          min and max of the reclassified raster (see Metric_range).
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, csv
+import numpy as np
+from LII_MapAlgebra import open_raster, dataset_shape, read_window, georef_of_dataset, create_raster, write_window, close_raster, \
+    block_windows, block_size
+from LII_Stats import RasterStats, save_stats
+
+# Variables
+LandscapeMetrics_LUT_csv = os.path.join(os.path.dirname(os.path.abspath(__file__)), "LII_LandscapeMetrics_LUT.csv")
+Metric_list = ['PAFRAC', 'CAI_CV', 'CORE_CV', 'CLUMPY']
+Metric_range = {'PAFRAC': (1, 2), 'CAI_CV': None, 'CORE_CV': None, 'CLUMPY': (-1, 1)}   # None: min and max of the metric
+missing_value = -10     # Value of the NLCD classes that are not in the table
+class_count = 256       # NLCD classes are 8-bit
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Lookup table
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Read the lookup table csv into {year: {metric: array of values by class}}.
+# Classes that are not in the table, and the extra last entry for values outside 0-255, get missing_value.
+def read_lut(path=LandscapeMetrics_LUT_csv):
+    lut = {}
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            year = row['Year'].strip()
+            if year not in lut:
+                lut[year] = dict((metric, np.full(class_count + 1, float(missing_value))) for metric in Metric_list)
+            for metric in Metric_list:
+                lut[year][metric][int(row['Value'])] = float(row[metric])
+    return lut
+
+# Table index of every cell of an NLCD block: the class, or class_count for values outside 0-255.
+# Returns the index and the NoData mask.
+def class_index(block):
+    nodata = np.isnan(block)
+    index = np.where(nodata, 0, block)
+    index = np.where((index >= 0) & (index < class_count), index, class_count).astype(np.int64)
+    return index, nodata
+
+# Histogram of the table index of the cells with data of an NLCD block
+def class_histogram(block):
+    index, nodata = class_index(block)
+    return np.bincount(index[~nodata], minlength=class_count + 1)
+
+# Band table of one year (classes x bands): the four metrics and their normalizations.
+# counts (from class_histogram) gives the min and max of the metrics normalized with their own min and max.
+def band_table(year_lut, counts):
+    names, columns = [], []
+    present = counts > 0
+    for metric in Metric_list:
+        values = year_lut[metric]
+        if Metric_range[metric] is None:
+            low, high = (values[present].min(), values[present].max()) if present.any() else (0, 0)
+        else:
+            low, high = Metric_range[metric]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            nor = (values - low) / float(high - low)
+        names += [metric, metric + "_nor"]
+        columns += [values, nor]
+    return names, np.column_stack(columns)
+
+# Gather all bands of an NLCD block from the band table. Returns a (bands, rows, columns) array with NoData as NaN.
+def lookup_block(block, table):
+    index, nodata = class_index(block)
+    out = np.moveaxis(table[index], -1, 0)
+    out[:, nodata] = np.nan
+    return out
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Landscape metrics
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# All landscape metric bands of an NLCD array: {"PAFRAC": ..., "PAFRAC_nor": ..., ...}
+def landscape_metrics(in_raster, year_lut):
+    block = np.asarray(in_raster, dtype=np.float64)
+    names, table = band_table(year_lut, class_histogram(block))
+    return dict(zip(names, lookup_block(block, table)))
+
+# Reclassify an NLCD raster on disk into every landscape metric band and save them as out_prefix + "_" + band
+# (e.g. NLCD2001_PAFRAC, NLCD2001_PAFRAC_nor), reading the NLCD raster once per pass block by block.
+# Returns the list of saved paths.
+def save_landscape_metrics(in_raster, year_lut, out_prefix, block_size=block_size):
+    ds, rb, nd = open_raster(in_raster)
+    shape = dataset_shape(ds)
+    counts = np.zeros(class_count + 1, dtype=np.int64)
+    for window in block_windows(shape, block_size):
+        counts += class_histogram(read_window(rb, nd, window))
+    names, table = band_table(year_lut, counts)
+    outputs = [create_raster(out_prefix + "_" + name, shape, georef_of_dataset(ds)) for name in names]
+    stats_list = [RasterStats() for name in names]
+    for window in block_windows(shape, block_size):
+        bands = lookup_block(read_window(rb, nd, window), table)
+        for (out_ds, out_rb, path), stats, band in zip(outputs, stats_list, bands):
+            write_window(out_rb, band, window)
+            stats.add(band)
+    paths = []
+    for (out_ds, out_rb, path), stats in zip(outputs, stats_list):
+        close_raster(out_rb)
+        save_stats(path, stats)
+        paths.append(path)
+    outputs = ds = None
+    return paths
@@ -0,0 +1,584 @@
+# Name: LII_MapAlgebra.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, GDAL (only for reading and saving rasters)
+# Description: NumPy backend for the map algebra used by the Composite Scoring System, so the scoring stage can run
+#              without ArcMap. Implements Raster, Con, SetNull, IsNull, Log10, Reclassify, RemapValue, CellStatistics
+#              and the Boolean/relational operators with the Spatial Analyst NoData rules:
+#               - NoData is stored as NaN in float64 arrays.
+#               - A NoData cell in the condition of Con or SetNull gives NoData.
+#               - Relational and Boolean operators give NoData where any input is NoData.
+#               - Log10 of a value <= 0 gives NoData.
+#               - CellStatistics with "DATA" ignores NoData, with "NODATA" any NoData input gives NoData.
+#              CellStatistics on rasters saved on disk streams them block by block (BlockRaster), so reducing
+#              many years keeps a few blocks in memory instead of every input raster.
+#              All operators are cell-by-cell, so they work on whole rasters or on blocks of them
+#              (see block_windows and block_apply).
+#              Saved rasters go to the chunked, memory-mapped tile store of LII_Store.py by default (scratch_format),
+#              so the intermediate rasters that are read again and again are opened without decoding a file format.
+#              save_raster and save_blocks record the min, max, count, sum and histogram of the saved values in a sidecar
+#              (LII_Stats.py), so .minimum, .maximum and .mean of a Raster read from disk don't scan the raster.
+#              Rasters that are almost all NoData (burned resource and stressor layers, habitat rasters) are saved as
+#              sparse rasters (LII_Sparse.py), and Raster(path) opens them as a SparseRaster: the map algebra functions
+#              and operators then run tile by tile and skip the tiles without data.
+# Warning:
+#          - Use it in place of arcpy.sa by setting Backend = "numpy" in LII_2_CompositeScoringSystem_v2.py.
+#          - Raster(path) reads the tile store of path if it exists, then path + ".tif", otherwise the raster from the
+#          file GDB with GDAL's OpenFileGDB driver. Raster.save(path) writes the tile store (path + ".tiles" and
+#          path + ".tiles.json"), or path + ".tif" with scratch_format = "tif" (file GDB rasters can't be written by GDAL).
+#          A path with an extension (.tif, .img) is always read and written with GDAL.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, operator, functools
+import numpy as np
+from LII_Store import TileStore, store_exists, open_store, create_store, nodata_to_nan
+from LII_Stats import RasterStats, save_stats, read_stats
+from LII_Sparse import SparseRaster, sparse_call, has_sparse, sparse_exists, open_sparse, is_sparse, save_sparse
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+__all__ = ['Raster', 'RemapValue', 'Con', 'SetNull', 'IsNull', 'Log10', 'Reclassify', 'CellStatistics',
+           'BooleanAnd', 'BooleanOr', 'BooleanNot', 'LessThan', 'LessThanEqual', 'GreaterThan', 'GreaterThanEqual',
+           'EqualTo', 'NotEqual', 'BlockRaster', 'block_windows', 'block_apply', 'read_raster', 'save_raster']
+
+# Variables
+block_size = 1024                       # Rows and columns of a block for block_apply
+nodata_value = -3.4028234663852886e+38  # NoData value written to float32 GeoTIFF (same as ArcMap's float NoData)
+Statistics_list = ['MEAN', 'MINIMUM', 'MAXIMUM', 'SUM', 'RANGE']
+scratch_format = "store"                # Format of saved rasters: "store" (tile store of LII_Store.py) or "tif" (GeoTIFF)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Reading and saving rasters
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Stop with a clear message if GDAL is needed but not installed
+def require_gdal():
+    if gdal is None:
+        raise ImportError("GDAL (osgeo) is required to read and save rasters with the NumPy backend")
+
+# Return the GDAL name of a raster: the .tif saved by this backend, or the raster inside a file GDB
+def gdal_path(path):
+    if os.path.splitext(path)[1]:
+        return path
+    if os.path.exists(path + ".tif"):
+        return path + ".tif"
+    gdb, name = os.path.split(path)
+    if gdb.lower().endswith(".gdb"):
+        return 'OpenFileGDB:"{}":{}'.format(gdb, name)
+    return path
+
+# Open one band of a raster: a tile store, a sparse raster, or a raster GDAL can read.
+# Return the dataset (keep it while reading), the band and its NoData value (the store for both and None for a tile
+# store or sparse raster).
+def open_raster(path, band=1):
+    if not os.path.splitext(path)[1] and store_exists(path):
+        store = open_store(path)
+        return store, store, store.nodata
+    if not os.path.splitext(path)[1] and sparse_exists(path):
+        sparse = open_sparse(path)
+        return sparse, sparse, None
+    require_gdal()
+    ds = gdal.Open(gdal_path(path))
+    if ds is None:
+        raise IOError("Can't open raster " + path)
+    rb = ds.GetRasterBand(band)
+    return ds, rb, rb.GetNoDataValue()
+
+# Return the georeference (geotransform and projection) of an open dataset
+def georef_of_dataset(ds):
+    if isinstance(ds, (TileStore, SparseRaster)):
+        return ds.georef
+    return {'geotransform': ds.GetGeoTransform(), 'projection': ds.GetProjection()}
+
+# Return the (rows, columns) of an open dataset
+def dataset_shape(ds):
+    if isinstance(ds, (TileStore, SparseRaster)):
+        return ds.shape
+    return (ds.RasterYSize, ds.RasterXSize)
+
+# Read a (row slice, column slice) window of an open band, or the whole band, as float64 with NoData as NaN.
+# From a float tile store, a window inside one tile is a read-only float32 view of the tile (no copy).
+def read_window(rb, nd, window=None):
+    if isinstance(rb, (TileStore, SparseRaster)):
+        return nodata_to_nan(rb.read(window), nd)
+    if window is None:
+        array = rb.ReadAsArray()
+    else:
+        rows, cols = window
+        array = rb.ReadAsArray(cols.start, rows.start, cols.stop - cols.start, rows.stop - rows.start)
+    array = array.astype(np.float64)
+    if nd is not None:
+        array[array == nd] = np.nan
+    return array
+
+# Read one band of a raster into a float64 array with NoData as NaN.
+# Return the array and the georeference (geotransform and projection) needed to save outputs on the same grid.
+def read_raster(path, band=1):
+    ds, rb, nd = open_raster(path, band)
+    array = np.array(read_window(rb, nd), dtype=np.float64)
+    georef = georef_of_dataset(ds)
+    ds = None
+    return array, georef
+
+# Create a float32 raster of the given shape with NaN written as NoData: a tile store (scratch_format = "store")
+# or a GeoTIFF. Return the dataset, its band (the store for both) and its path.
+def create_raster(path, shape, georef=None):
+    if scratch_format == "store" and not os.path.splitext(path)[1]:
+        store = create_store(path, shape, georef)
+        return store, store, path
+    require_gdal()
+    if not os.path.splitext(path)[1]:
+        path = path + ".tif"
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    rows, cols = shape
+    ds = gdal.GetDriverByName("GTiff").Create(path, cols, rows, 1, gdal.GDT_Float32,
+                                              ["COMPRESS=LZW", "TILED=YES", "BIGTIFF=IF_SAFER"])
+    if georef:
+        ds.SetGeoTransform(georef['geotransform'])
+        ds.SetProjection(georef['projection'])
+    rb = ds.GetRasterBand(1)
+    rb.SetNoDataValue(nodata_value)
+    return ds, rb, path
+
+# Write a block of float64 values (NaN as NoData) at a (row slice, column slice) window of a band from create_raster
+def write_window(rb, array, window=None):
+    if isinstance(rb, TileStore):
+        rb.write(array, window)
+        return
+    array = np.asarray(array, dtype=np.float64)
+    array = np.where(np.isnan(array), nodata_value, array).astype(np.float32)
+    if window is None:
+        rb.WriteArray(array)
+    else:
+        rb.WriteArray(array, window[1].start, window[0].start)
+
+# Write the data of a band from create_raster to disk
+def close_raster(rb):
+    if isinstance(rb, TileStore):
+        rb.flush()
+    else:
+        rb.FlushCache()
+
+# Save an array as a float32 raster (tile store or GeoTIFF) with NaN written as NoData, and its statistics sidecar.
+# A SparseRaster, or an array with fewer than sparse_limit of its cells with data, is saved as a sparse raster (except to GeoTIFF).
+def save_raster(array, path, georef=None):
+    if isinstance(array, SparseRaster):
+        return save_sparse(array, path)
+    array = np.asarray(array, dtype=np.float64)
+    if scratch_format == "store" and not os.path.splitext(path)[1] and array.ndim == 2 and is_sparse(array):
+        return save_sparse(SparseRaster.from_array(array, georef), path)
+    ds, rb, path = create_raster(path, array.shape, georef)
+    stats = RasterStats()
+    write_window(rb, array)
+    stats.add(array)
+    close_raster(rb)
+    save_stats(path, stats)
+    ds = None
+    return path
+
+# Save (window, block) pairs as a float32 raster (tile store or GeoTIFF), one block at a time, and its statistics sidecar
+def save_blocks(blocks, shape, path, georef=None):
+    ds, rb, path = create_raster(path, shape, georef)
+    stats = RasterStats()
+    for window, block in blocks:
+        write_window(rb, block, window)
+        stats.add(block)
+    close_raster(rb)
+    save_stats(path, stats)
+    ds = None
+    return path
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Raster and remap classes
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Raster on a float64 array, used like arcpy.sa.Raster: .minimum, .maximum, .save() and map algebra operators.
+# A Raster read from disk takes .minimum, .maximum and .mean from the statistics sidecar of the file when there is one.
+# Raster(path) of a sparse raster returns the SparseRaster (same properties, operators and save()).
+# Relational operators give 1/0 and Boolean operators (&, |, ~) follow Spatial Analyst's BooleanAnd/Or/Not,
+# with NoData wherever an input is NoData.
+class Raster(np.ndarray):
+
+    def __new__(cls, in_raster, georef=None):
+        stats = None
+        if isinstance(in_raster, str) and not os.path.splitext(in_raster)[1] and sparse_exists(in_raster):
+            return open_sparse(in_raster)
+        if isinstance(in_raster, str):
+            array, georef = read_raster(in_raster)
+            stats = read_stats(in_raster)
+        else:
+            if georef is None:
+                georef = getattr(in_raster, 'georef', None)
+            array = np.asarray(in_raster, dtype=np.float64)
+        obj = array.view(cls)
+        obj.georef = georef
+        obj.stats = stats
+        return obj
+
+    def __array_finalize__(self, obj):
+        self.georef = getattr(obj, 'georef', None)
+        self.stats = None
+
+    @property
+    def minimum(self):
+        if self.stats is not None:
+            return self.stats['minimum']
+        return float(np.nanmin(np.asarray(self)))
+
+    @property
+    def maximum(self):
+        if self.stats is not None:
+            return self.stats['maximum']
+        return float(np.nanmax(np.asarray(self)))
+
+    @property
+    def mean(self):
+        if self.stats is not None:
+            return self.stats['mean']
+        return float(np.nanmean(np.asarray(self)))
+
+    def save(self, path):
+        return save_raster(self, path, self.georef)
+
+    def __lt__(self, other):
+        return LessThan(self, other)
+
+    def __le__(self, other):
+        return LessThanEqual(self, other)
+
+    def __gt__(self, other):
+        return GreaterThan(self, other)
+
+    def __ge__(self, other):
+        return GreaterThanEqual(self, other)
+
+    def __eq__(self, other):
+        return EqualTo(self, other)
+
+    def __ne__(self, other):
+        return NotEqual(self, other)
+
+    def __and__(self, other):
+        return BooleanAnd(self, other)
+
+    def __rand__(self, other):
+        return BooleanAnd(other, self)
+
+    def __or__(self, other):
+        return BooleanOr(self, other)
+
+    def __ror__(self, other):
+        return BooleanOr(other, self)
+
+    def __invert__(self):
+        return BooleanNot(self)
+
+    __hash__ = None
+
+# Remap table for Reclassify, same form as arcpy.sa.RemapValue: [[old value, new value], ..., ["NODATA", new value]]
+class RemapValue(object):
+
+    def __init__(self, remapTable):
+        self.remapTable = remapTable
+
+# Raster computed block by block on demand, returned by CellStatistics when every input is a raster on disk.
+# save() computes and writes one block at a time, so only a few blocks are ever in memory.
+# np.asarray(), Raster() and the map algebra functions read it into a full array.
+class BlockRaster(object):
+
+    def __init__(self, block_function, shape, georef=None, block_size=block_size):
+        self.block_function = block_function
+        self.shape = tuple(shape)
+        self.georef = georef
+        self.block_size = block_size
+
+    def blocks(self):
+        for window in block_windows(self.shape, self.block_size):
+            yield window, self.block_function(window)
+
+    def __array__(self, dtype=None, copy=None):
+        out = np.empty(self.shape, dtype=np.float64)
+        for window, block in self.blocks():
+            out[window] = block
+        return out if dtype is None else out.astype(dtype)
+
+    @property
+    def minimum(self):
+        return float(np.fmin.reduce([np.fmin.reduce(block, axis=None) for window, block in self.blocks()]))
+
+    @property
+    def maximum(self):
+        return float(np.fmax.reduce([np.fmax.reduce(block, axis=None) for window, block in self.blocks()]))
+
+    def save(self, path):
+        return save_blocks(self.blocks(), self.shape, path, self.georef)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Map algebra
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Return a raster, constant, or path as a float64 array (constants stay 0-d and broadcast)
+def as_array(x):
+    if isinstance(x, str):
+        x = Raster(x)
+    return np.asarray(x, dtype=np.float64)
+
+# Return the georeference of the first input that has one (a path gives the georeference of its raster)
+def georef_of(*rasters):
+    for ras in rasters:
+        if isinstance(ras, str):
+            ds, rb, nd = open_raster(ras)
+            return georef_of_dataset(ds)
+        georef = getattr(ras, 'georef', None)
+        if georef is not None:
+            return georef
+    return None
+
+# Run a map algebra function tile by tile (sparse_call) when one of its raster arguments (positions) is a SparseRaster
+# or a path saved as one. The other paths are read when there is a SparseRaster; a list of paths (CellStatistics) is
+# opened sparse only when every path in it is sparse, otherwise it is streamed.
+def sparse_aware(*positions):
+    def decorate(function):
+        @functools.wraps(function)
+        def call(*args, **kwargs):
+            args = [open_sparse_args(arg) if i in positions else arg for i, arg in enumerate(args)]
+            if not any(has_sparse(arg) for arg in args):
+                return function(*args, **kwargs)
+            args = [read_paths(arg) if i in positions else arg for i, arg in enumerate(args)]
+            return sparse_call(function, args, kwargs)
+        return call
+    return decorate
+
+# Open an argument that is a path saved as a sparse raster, or a list of paths that are all saved as sparse rasters
+def open_sparse_args(arg):
+    if isinstance(arg, str):
+        return open_sparse(arg) if not os.path.splitext(arg)[1] and sparse_exists(arg) else arg
+    if isinstance(arg, (list, tuple)) and arg and all(isinstance(item, str) and not os.path.splitext(item)[1] and sparse_exists(item) for item in arg):
+        return [open_sparse(item) for item in arg]
+    return arg
+
+# Read the paths of a raster argument (or list of them) as Rasters
+def read_paths(arg):
+    if isinstance(arg, (list, tuple)):
+        return [Raster(item) if isinstance(item, str) else item for item in arg]
+    return Raster(arg) if isinstance(arg, str) else arg
+
+# Return the result as a Raster when any input was a Raster or a path (as Spatial Analyst), otherwise as a plain array
+# (blocks stay plain arrays)
+def wrap(array, *rasters):
+    if any(isinstance(ras, (Raster, BlockRaster, str)) for ras in rasters):
+        return Raster(array, georef_of(*rasters))
+    return array
+
+# Apply a relational operator, NoData where any input is NoData
+def compare(op, in_raster1, in_raster2):
+    a, b = as_array(in_raster1), as_array(in_raster2)
+    with np.errstate(invalid='ignore'):
+        out = op(a, b).astype(np.float64)
+    out = np.where(np.isnan(a) | np.isnan(b), np.nan, out)
+    return wrap(out, in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def LessThan(in_raster1, in_raster2):
+    return compare(operator.lt, in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def LessThanEqual(in_raster1, in_raster2):
+    return compare(operator.le, in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def GreaterThan(in_raster1, in_raster2):
+    return compare(operator.gt, in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def GreaterThanEqual(in_raster1, in_raster2):
+    return compare(operator.ge, in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def EqualTo(in_raster1, in_raster2):
+    return compare(operator.eq, in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def NotEqual(in_raster1, in_raster2):
+    return compare(operator.ne, in_raster1, in_raster2)
+
+# Boolean And/Or: non-zero is true, NoData where any input is NoData
+@sparse_aware(0, 1)
+def BooleanAnd(in_raster1, in_raster2):
+    return compare(lambda a, b: (a != 0) & (b != 0), in_raster1, in_raster2)
+
+@sparse_aware(0, 1)
+def BooleanOr(in_raster1, in_raster2):
+    return compare(lambda a, b: (a != 0) | (b != 0), in_raster1, in_raster2)
+
+@sparse_aware(0)
+def BooleanNot(in_raster):
+    a = as_array(in_raster)
+    out = np.where(np.isnan(a), np.nan, (a == 0).astype(np.float64))
+    return wrap(out, in_raster)
+
+# Con: true value where the condition is non-zero, false value (or NoData) where it is zero, NoData where it is NoData
+@sparse_aware(0, 1, 2)
+def Con(in_conditional_raster, in_true_raster_or_constant, in_false_raster_or_constant=None):
+    cond = as_array(in_conditional_raster)
+    true = as_array(in_true_raster_or_constant)
+    false = np.nan if in_false_raster_or_constant is None else as_array(in_false_raster_or_constant)
+    out = np.where(cond != 0, true, false)
+    out = np.where(np.isnan(cond), np.nan, out)
+    out = np.broadcast_to(out, np.broadcast(cond, true, false).shape).astype(np.float64)
+    return wrap(out, in_conditional_raster, in_true_raster_or_constant, in_false_raster_or_constant)
+
+# SetNull: NoData where the condition is non-zero or NoData, false value elsewhere
+@sparse_aware(0, 1)
+def SetNull(in_conditional_raster, in_false_raster_or_constant):
+    cond = as_array(in_conditional_raster)
+    false = as_array(in_false_raster_or_constant)
+    out = np.where(np.isnan(cond) | (cond != 0), np.nan, false)
+    out = np.broadcast_to(out, np.broadcast(cond, false).shape).astype(np.float64)
+    return wrap(out, in_conditional_raster, in_false_raster_or_constant)
+
+# IsNull: 1 where NoData, 0 elsewhere (never NoData)
+@sparse_aware(0)
+def IsNull(in_raster):
+    a = as_array(in_raster)
+    return wrap(np.isnan(a).astype(np.float64), in_raster)
+
+# Log10: NoData where the input is NoData or <= 0 (e.g. the source cells of a Euclidean distance raster)
+@sparse_aware(0)
+def Log10(in_raster_or_constant):
+    a = as_array(in_raster_or_constant)
+    positive = a > 0
+    out = np.full(a.shape, np.nan)
+    out[positive] = np.log10(a[positive])
+    return wrap(out, in_raster_or_constant)
+
+# Reclassify individual values with a RemapValue.
+# "NODATA" as an old value reclassifies NoData cells, "NODATA" as a new value sets NoData.
+# missing_values="DATA" keeps values that are not in the remap table, "NODATA" sets them to NoData.
+@sparse_aware(0)
+def Reclassify(in_raster, reclass_field, remap, missing_values="DATA"):
+    if reclass_field.upper() != "VALUE":
+        raise ValueError("The NumPy backend only reclassifies the Value field, not " + reclass_field)
+    a = as_array(in_raster)
+    nodata = np.isnan(a)
+    out = a.copy() if missing_values == "DATA" else np.full(a.shape, np.nan)
+    old_values, new_values = [], []
+    for old, new in remap.remapTable:
+        new = np.nan if new == "NODATA" else float(new)
+        if old == "NODATA":
+            out[nodata] = new
+        else:
+            old_values.append(float(old))
+            new_values.append(new)
+    if old_values:
+        order = np.argsort(old_values)
+        old_values = np.asarray(old_values)[order]
+        new_values = np.asarray(new_values)[order]
+        values = a[~nodata]
+        idx = np.clip(np.searchsorted(old_values, values), 0, len(old_values) - 1)
+        hit = old_values[idx] == values
+        reclassed = out[~nodata]
+        reclassed[hit] = new_values[idx[hit]]
+        out[~nodata] = reclassed
+    return wrap(out, in_raster)
+
+# Reduce arrays (or blocks) one at a time with a Cell Statistics type, keeping only the planes that type needs
+# (sum and count for MEAN, running minimum for MINIMUM, ...) and never a stack of the inputs.
+def reduce_cells(arrays, statistics_type="MEAN", ignore_nodata="DATA"):
+    statistics_type = statistics_type.upper()
+    ignore = ignore_nodata.upper() == "DATA"
+    total = low = high = anynull = None
+    count = None
+    for a in arrays:
+        valid = ~np.isnan(a)
+        if count is None:
+            count = np.zeros(np.shape(a), dtype=np.int32)
+            if not ignore:
+                anynull = np.zeros(np.shape(a), dtype=bool)
+            if statistics_type in ('MEAN', 'SUM'):
+                total = np.zeros(np.shape(a))
+            if statistics_type in ('MINIMUM', 'RANGE'):
+                low = np.full(np.shape(a), np.inf)
+            if statistics_type in ('MAXIMUM', 'RANGE'):
+                high = np.full(np.shape(a), -np.inf)
+        count += valid
+        if total is not None:
+            total += np.where(valid, a, 0.0)
+        if low is not None:
+            np.fmin(low, a, out=low)
+        if high is not None:
+            np.fmax(high, a, out=high)
+        if anynull is not None:
+            anynull |= ~valid
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if statistics_type == 'MEAN':
+            out = total / count
+        elif statistics_type == 'MINIMUM':
+            out = low
+        elif statistics_type == 'MAXIMUM':
+            out = high
+        elif statistics_type == 'SUM':
+            out = total
+        else:
+            out = high - low
+    out = np.where(count == 0, np.nan, out)
+    if not ignore:
+        out = np.where(anynull, np.nan, out)
+    return out
+
+# Cell Statistics of rasters on disk, read one block of each input at a time (see BlockRaster).
+# The inputs must be on the same grid (same rows and columns). Blocks of tile stores are tiles, read without a copy.
+def stream_cell_statistics(in_rasters, statistics_type="MEAN", ignore_nodata="DATA", block_size=block_size):
+    bands = [open_raster(path) for path in in_rasters]
+    ds = bands[0][0]
+    shape = dataset_shape(ds)
+    for path, (other, rb, nd) in zip(in_rasters, bands):
+        if dataset_shape(other) != shape:
+            raise ValueError("CellStatistics inputs must be on the same grid: " + path)
+
+    def block(window):
+        return reduce_cells((read_window(rb, nd, window) for ds, rb, nd in bands), statistics_type, ignore_nodata)
+
+    return BlockRaster(block, shape, georef_of_dataset(ds), block_size)
+
+# Cell Statistics over a list of rasters or constants, accumulated one input at a time (no stack of all inputs).
+# statistics_type: MEAN, MINIMUM, MAXIMUM, SUM or RANGE. ignore_nodata: "DATA" or "NODATA".
+# When every input is a path the result is a BlockRaster that reads the inputs block by block.
+@sparse_aware(0)
+def CellStatistics(in_rasters_or_constants, statistics_type="MEAN", ignore_nodata="DATA"):
+    statistics_type = statistics_type.upper()
+    if statistics_type not in Statistics_list:
+        raise ValueError("Unsupported statistics type " + statistics_type)
+    if not in_rasters_or_constants:
+        raise ValueError("CellStatistics needs at least one input")
+    if all(isinstance(ras, str) for ras in in_rasters_or_constants):
+        return stream_cell_statistics(in_rasters_or_constants, statistics_type, ignore_nodata)
+    out = reduce_cells((as_array(ras) for ras in in_rasters_or_constants), statistics_type, ignore_nodata)
+    return wrap(out, *in_rasters_or_constants)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Block processing
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Yield (row slice, column slice) windows that cover a raster of the given shape in blocks
+def block_windows(shape, block_size=block_size):
+    rows, cols = shape
+    for r in range(0, rows, block_size):
+        for c in range(0, cols, block_size):
+            yield slice(r, min(r + block_size, rows)), slice(c, min(c + block_size, cols))
+
+# Run a cell-by-cell function block by block over rasters of the same shape (arrays or np.memmap) and write to out.
+# Only one block of each input is in memory at a time when the inputs are memory-mapped.
+def block_apply(func, in_rasters, out=None, block_size=block_size):
+    shape = np.shape(in_rasters[0])
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    for window in block_windows(shape, block_size):
+        out[window] = func(*[np.asarray(ras[window], dtype=np.float64) for ras in in_rasters])
+    return out
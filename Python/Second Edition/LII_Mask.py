@@ -0,0 +1,99 @@
+# Name: LII_Mask.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, ArcMap 10.7 or ArcGIS Pro (arcpy, only for reading the boundary feature class)
+# Description: Boundary mask of the study area for the NumPy backend, in place of Clip_management with "ClippingGeometry",
+#              which tests every cell of every clipped raster against the boundary polygon again:
+#               1. The boundary is rasterized once on the study area grid (the cells whose center is inside a polygon,
+#                  as ClippingGeometry keeps, LII_Rasterize.py) and saved as a uint8 tile store (1 inside, 0 outside).
+#                  It is rasterized again only when the grid or the boundary polygons change: the mask keeps a fingerprint
+#                  of the grid and of the coordinates of the polygons, since a feature class inside a file GDB has no
+#                  modification time of its own.
+#               2. ExtractByMask applies the mask inside the operator that gives the output: a raster computed block by
+#                  block (Focal Statistics, Cell Statistics, ...) gets the block function of the operator wrapped, so
+#                  the tiles with no cell inside the boundary are NoData without being computed, and the other tiles
+#                  are set to NoData outside the boundary as they are written.
+# Warning:
+#          - The output keeps the extent of the study area grid (Study_Extent), the cells outside the boundary are NoData,
+#          where Clip_management with NO_MAINTAIN_EXTENT trims the extent to the boundary.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import io, json, hashlib
+import numpy as np
+from LII_MapAlgebra import BlockRaster
+from LII_Store import save_store, open_store, store_exists
+from LII_Tiles import open_inputs, tile_size
+from LII_Rasterize import read_features, map_to_cells, polygon_cells
+
+# Variables
+mask_dtype = 'uint8'     # Data type of the mask: 1 inside the boundary, 0 outside
+fingerprint_suffix = ".boundary.json"   # Fingerprint of the grid and boundary the mask was rasterized from
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Mask
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Mask of polygons (list of polygons, each a list of rings in map coordinates) on a grid: True where the cell center is inside
+def polygon_mask(polygons, shape, georef):
+    mask = np.zeros(shape, dtype=bool)
+    mask.ravel()[polygon_cells([[map_to_cells(ring, georef) for ring in rings] for rings in polygons], shape)] = True
+    return mask
+
+# Fingerprint of polygons on a grid: SHA-1 of the shape, the geotransform and the coordinates of every ring
+def boundary_fingerprint(polygons, shape, georef):
+    digest = hashlib.sha1(json.dumps([list(shape), list(georef['geotransform'])]).encode('utf-8'))
+    for rings in polygons:
+        digest.update(np.int64(len(rings)).tobytes())
+        for ring in rings:
+            ring = np.ascontiguousarray(ring, dtype=np.float64)
+            digest.update(np.int64(len(ring)).tobytes())
+            digest.update(ring.tobytes())
+    return digest.hexdigest()
+
+# Fingerprint a mask was rasterized from, None if it has none
+def read_fingerprint(out_mask):
+    try:
+        with io.open(out_mask + fingerprint_suffix, encoding='utf-8') as f:
+            return json.load(f).get('fingerprint')
+    except (IOError, ValueError):
+        return None
+
+# Rasterize the boundary feature class on the grid (shape, georef) once and save it as a tile store to out_mask.
+# The mask is kept when it was rasterized from the same polygons on the same grid. Returns out_mask.
+def save_boundary_mask(boundary, out_mask, shape, georef):
+    polygons = [parts for kind, parts, value in read_features(boundary, "OID@") if kind == "polygon"]
+    fingerprint = boundary_fingerprint(polygons, shape, georef)
+    if store_exists(out_mask) and read_fingerprint(out_mask) == fingerprint:
+        return out_mask
+    save_store(polygon_mask(polygons, shape, georef), out_mask, georef, tile_size, mask_dtype)
+    with io.open(out_mask + fingerprint_suffix, 'w', encoding='utf-8') as f:
+        f.write(u"" + json.dumps({'fingerprint': fingerprint}))
+    return out_mask
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Extract by mask
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# in_raster with NoData outside the mask (path of save_boundary_mask), same as arcpy.sa.ExtractByMask with the boundary
+# or Clip_management with "ClippingGeometry". A BlockRaster (tiled operator) is masked in its block function, and its
+# tiles outside the mask are not computed; a path or array is read block by block. Returns a BlockRaster.
+def ExtractByMask(in_raster, in_mask_data):
+    mask = open_store(in_mask_data)
+    if isinstance(in_raster, BlockRaster):
+        read, shape, georef, block_size = in_raster.block_function, in_raster.shape, in_raster.georef, in_raster.block_size
+    else:
+        (read,), shape, georef = open_inputs([in_raster])
+        block_size = tile_size
+    if tuple(shape) != mask.shape:
+        raise ValueError("The mask is not on the grid of the raster: " + str(in_mask_data))
+
+    def block(window):
+        inside = np.asarray(mask.read(window)) > 0
+        if not inside.any():
+            return np.full(inside.shape, np.nan)
+        out = np.array(read(window), dtype=np.float64)
+        out[~inside] = np.nan
+        return out
+
+    return BlockRaster(block, shape, georef or mask.georef, block_size)
@@ -0,0 +1,126 @@
+# Name: LII_Parallel.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, GDAL (only for reading and saving rasters)
+# Description: Runs the independent per-year (and per layer type) tasks of the Composite Scoring System and the
+#              Moving Window Analysis on a pool of worker processes with the NumPy backend.
+#              Each task reads its inputs from disk and saves its output to disk, so only paths go to the workers
+#              and only paths come back:
+#               - run_tasks(function, task_list, workers) runs function(*task) for every task and returns the results
+#                 in the order of task_list, whatever order the workers finish in.
+#               - Workers = 1 runs the tasks one after the other in this process.
+#               - Otherwise the pool starts in a new Python process running this file (run_in_process), so with
+#                 "spawn" (Windows) the workers import this module and not the calling script, which has no
+#                 if __name__ == "__main__" block and would run again in every worker.
+#              The task functions (save_cell_statistics, save_distance_decay, ...) are in this module so that
+#              the workers can import them without running the scripts.
+# Warning:
+#          - Only for Backend = "numpy": the arcpy geoprocessing environment (workspace, extent) is not passed to
+#          worker processes.
+#          - The task functions and their arguments are pickled: the functions must be importable from a module
+#          (not defined in the calling script).
+#          - Each worker holds the blocks of one task in memory. The distance decay task runs tile by tile with a halo of
+#          the maximum distance, so Workers x years x (tile + halo) size must fit in memory.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys, pickle, shutil, subprocess, tempfile, traceback, multiprocessing
+from LII_MapAlgebra import CellStatistics
+from LII_Distance import save_distance_decay_tiles
+from LII_VectorDistance import save_vector_decay
+from LII_Rasterize import read_features
+
+# Variables
+Workers = os.cpu_count() or 1   # Number of worker processes
+Python = sys.executable         # Python of the worker pool (in ArcGIS Pro: os.path.join(sys.exec_prefix, "python.exe"))
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Run function(*task) for every task of task_list on workers processes.
+# Returns the results in the order of task_list. An error in a task stops the run and is raised here.
+def run_tasks(function, task_list, workers=Workers):
+    task_list = [tuple(task) for task in task_list]
+    workers = max(1, min(int(workers), len(task_list)))
+    if workers == 1:
+        return [function(*task) for task in task_list]
+    return run_in_process(function, task_list, workers)
+
+# Run the tasks in a new Python process running this file, on a pool of workers processes started there
+# (workers = 1: in that process itself). The tasks and the results go through pickle files in a temporary folder.
+# Returns the results in the order of task_list. The error of a task is raised here.
+def run_in_process(function, task_list, workers=1):
+    folder = tempfile.mkdtemp(prefix="LII_Parallel_")
+    task_file, result_file = os.path.join(folder, "tasks.pkl"), os.path.join(folder, "results.pkl")
+    try:
+        with open(task_file, 'wb') as f:
+            pickle.dump(list(sys.path), f)
+            pickle.dump((function, [tuple(task) for task in task_list], int(workers)), f)
+        code = subprocess.call([Python, os.path.abspath(__file__), task_file, result_file])
+        if not os.path.exists(result_file):
+            raise RuntimeError("The worker pool stopped with exit code " + str(code) + " and no results")
+        with open(result_file, 'rb') as f:
+            done, results = pickle.load(f)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    if not done:
+        raise results
+    return results
+
+# Run the tasks on a pool of workers processes, or one after the other with workers = 1
+def run_pool(function, task_list, workers):
+    if workers == 1:
+        return [function(*task) for task in task_list]
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.starmap(function, task_list, chunksize=1)
+    finally:
+        pool.terminate()
+        pool.join()
+    return results
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Tasks
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Cell Statistics of the rasters in_rasters saved to out_raster. Returns out_raster.
+def save_cell_statistics(in_rasters, out_raster, statistics_type="MEAN", ignore_nodata="DATA"):
+    CellStatistics(list(in_rasters), statistics_type, ignore_nodata).save(out_raster)
+    return out_raster
+
+# Euclidean distance of all years of a resource or stressor in one batched distance transform, then the fused
+# distance decay of each year saved to out_rasters (_Log10IP_Null_SetNull), tile by tile.
+# With feature_classes (one per year, burned with value_field), the sparse years are computed from their features
+# (LII_VectorDistance.py) and only the other years go through the distance transform.
+# keep_nor=True also keeps the normalized decay surfaces (_EucDis_Log10_Null_nor) for LII_Scenario.py. Returns out_rasters.
+def save_distance_decay(in_rasters, out_rasters, maximum_distance, cell_size, feature_classes=None, value_field="IP", keep_nor=False):
+    dense = list(range(len(in_rasters)))
+    if feature_classes:
+        dense = [i for i in dense if save_vector_decay(read_features(feature_classes[i], value_field), in_rasters[i], out_rasters[i],
+                                                       maximum_distance, cell_size, sparse_only=True, keep_nor=keep_nor) is None]
+    if dense:
+        save_distance_decay_tiles([in_rasters[i] for i in dense], [out_rasters[i] for i in dense], maximum_distance, cell_size,
+                                  keep_nor=keep_nor)
+    return list(out_rasters)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Worker pool process of run_in_process: python LII_Parallel.py <task file> <result file>
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# The result file holds (True, results), or (False, the error of a task) with its traceback printed here
+if __name__ == "__main__":
+    with open(sys.argv[1], 'rb') as f:
+        sys.path[:] = pickle.load(f)
+        function, task_list, workers = pickle.load(f)
+    try:
+        result = (True, run_pool(function, task_list, workers))
+    except Exception as e:
+        traceback.print_exc()
+        result = (False, e)
+    try:
+        data = pickle.dumps(result)
+    except Exception:
+        data = pickle.dumps((False, RuntimeError(traceback.format_exc())))
+    with open(sys.argv[2], 'wb') as f:
+        f.write(data)
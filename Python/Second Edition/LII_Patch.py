@@ -0,0 +1,182 @@
+# Name: LII_Patch.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Patch size variable of the ecological integrity indicators, used in place of
+#              RegionGroup(ras, "EIGHT", "WITHIN") -> Lookup(..., "Count") -> * 0.222395.
+#              Connected-component labeling with union-find, done block by block in two passes:
+#               1. Each block is labeled on its own: neighboring cells (8 directions) with the same value are joined
+#                  with a vectorized union-find (hook the larger root to the smaller one, then pointer jumping).
+#                  Only the number of cells of every label and the labels of the two rows (columns) on both sides of
+#                  every block seam are kept, not the labels of the grid.
+#               2. The labels are merged across the block seams with a second union-find on the labels of the seams
+#                  only, and the counts of the merged labels are added up: the number of cells of every patch.
+#               3. Each block is labeled again and its labels are replaced by the acres of their patch, so the patch
+#                  acres raster is written block by block without the region and lookup rasters.
+#              Memory is a few blocks, the seam strips and one count per label, whatever the size of the raster.
+#              Patches are groups of cells with the same value ("WITHIN"), so labeling an EVT raster once gives the
+#              patches of every habitat of that year (see save_habitat_patch_acres).
+# Warning:
+#          - NoData cells are not part of any patch and stay NoData.
+#          - Each block is labeled twice (first and third step), which is cheaper than keeping the labels of the grid.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import numpy as np
+from LII_MapAlgebra import BlockRaster, block_windows, create_raster, write_window, close_raster
+from LII_Stats import RasterStats, save_stats
+from LII_Tiles import window_reader
+
+# Variables
+block_size = 1024           # Rows and columns of a block labeled on its own
+acres_per_cell = 0.222395   # 0.222395 acres = 900 square meter, for 30 m pixel
+Direction_list = [(0, 1), (1, 0), (1, 1), (1, -1)]     # Half of the 8 directions, each pair of neighbors once
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Union-find
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Join the pairs (u[k], v[k]) in a parent array where parent[i] <= i, and return it with every entry pointing to its root.
+# Each round hooks every root to the smallest root it is paired with, then jumps pointers until all point to roots.
+def union_pairs(parent, u, v):
+    parent = compress(parent)
+    while len(u):
+        pu, pv = parent[u], parent[v]
+        np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+        parent = compress(parent)
+        keep = parent[u] != parent[v]
+        u, v = u[keep], v[keep]
+    return parent
+
+# Pointer jumping until every entry points to its root
+def compress(parent):
+    while True:
+        grand = parent[parent]
+        if np.array_equal(grand, parent):
+            return parent
+        parent = grand
+
+# Pairs of ids of neighboring cells (8 directions) with data and the same value
+def same_value_pairs(values, valid, ids):
+    rows, cols = values.shape
+    u, v = [], []
+    for dr, dc in Direction_list:
+        a = (slice(0, rows - dr), slice(max(0, -dc), cols - max(0, dc)))
+        b = (slice(dr, rows), slice(max(0, dc), cols - max(0, -dc)))
+        same = valid[a] & valid[b] & (values[a] == values[b])
+        u.append(ids[a][same])
+        v.append(ids[b][same])
+    return np.concatenate(u), np.concatenate(v)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Labeling
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Label the 8-connected groups of cells with the same value of a block on its own. Returns the labels (int64, numbered
+# from 0 in the order of the first cell of each group, -1 for NoData) and the number of labels.
+def block_labels(values, valid):
+    local = np.arange(values.size, dtype=np.int64).reshape(values.shape)
+    u, v = same_value_pairs(values, valid, local)
+    parent = union_pairs(local.ravel(), u, v)
+    roots, index = np.unique(parent[valid.ravel()], return_inverse=True)
+    labels = np.full(values.shape, -1, dtype=np.int64)
+    labels[valid] = index.ravel()
+    return labels, len(roots)
+
+# Keep the first and last row and column of a block (values and labels) in the strips of the seams they border:
+# {("row" or "column", seam): (values, labels)}, each strip holding the two rows (columns) on both sides of the seam
+def add_seams(strips, window, values, labels, shape):
+    rows, cols = window
+    for axis, lo, hi, size in (("row", rows.start, rows.stop, shape[0]), ("column", cols.start, cols.stop, shape[1])):
+        for seam, side, edge in ((lo, 1, 0), (hi, 0, -1)):
+            if seam in (0, size):
+                continue
+            if (axis, seam) not in strips:
+                strip = (2, shape[1]) if axis == "row" else (shape[0], 2)
+                strips[(axis, seam)] = (np.full(strip, np.nan), np.full(strip, -1, dtype=np.int64))
+            strip_values, strip_labels = strips[(axis, seam)]
+            if axis == "row":
+                strip_values[side, cols] = values[edge]
+                strip_labels[side, cols] = labels[edge]
+            else:
+                strip_values[rows, side] = values[:, edge]
+                strip_labels[rows, side] = labels[:, edge]
+
+# Number of cells of the patch of every label: the counts of the labels joined across the seams are added up
+def patch_sizes(counts, strips):
+    u, v = [], []
+    for values, labels in strips.values():
+        pu, pv = same_value_pairs(values, labels >= 0, labels)
+        u.append(pu)
+        v.append(pv)
+    if not u:
+        return counts
+    lu, lv = np.concatenate(u), np.concatenate(v)
+    keys = np.unique(np.concatenate([lu, lv]))
+    parent = union_pairs(np.arange(len(keys), dtype=np.int64), np.searchsorted(keys, lu), np.searchsorted(keys, lv))
+    sizes = counts.copy()
+    sizes[keys] = np.bincount(parent, weights=counts[keys], minlength=len(keys)).astype(np.int64)[parent]
+    return sizes
+
+# First pass: label the 8-connected groups of cells with the same value of a raster (path, array or Raster) block by
+# block, same patches as RegionGroup(ras, "EIGHT", "WITHIN"). The labels of a block start at its offset.
+# Returns the reader of the raster, its shape and georeference, the offsets {(first row, first column): offset}
+# and the number of cells of the patch of every label.
+def label_patches(in_raster, block_size=block_size):
+    reader, shape, georef = window_reader(in_raster)
+    offsets, counts, strips = {}, [], {}
+    total = 0
+    for window in block_windows(shape, block_size):
+        values = reader(window)
+        valid = ~np.isnan(values)
+        labels, count = block_labels(values, valid)
+        counts.append(np.bincount(labels[valid], minlength=count))
+        offsets[(window[0].start, window[1].start)] = total
+        add_seams(strips, window, values, np.where(valid, labels + total, -1), shape)
+        total += count
+    counts = np.concatenate(counts) if counts else np.zeros(0, dtype=np.int64)
+    return reader, tuple(shape), georef, offsets, patch_sizes(counts, strips)
+
+# Second pass: number of cells of the patch of every cell of a block, NaN for NoData
+def block_patch_cells(reader, window, offsets, sizes):
+    values = reader(window)
+    valid = ~np.isnan(values)
+    labels = block_labels(values, valid)[0]
+    out = np.full(values.shape, np.nan)
+    out[valid] = sizes[labels[valid] + offsets[(window[0].start, window[1].start)]]
+    return out
+
+# Number of cells of the patch of every cell (Lookup(RegionGroup(...), "Count")), NoData for NoData.
+# Returns a BlockRaster: save() writes one block at a time.
+def patch_cells(in_raster, block_size=block_size):
+    reader, shape, georef, offsets, sizes = label_patches(in_raster, block_size)
+    return BlockRaster(lambda window: block_patch_cells(reader, window, offsets, sizes), shape, georef, block_size)
+
+# Acres of the patch of every cell, same as Lookup(RegionGroup(ras, "EIGHT", "WITHIN"), "Count") * 0.222395.
+# Returns a BlockRaster: save() writes one block at a time.
+def patch_acres(in_raster, acres_per_cell=acres_per_cell, block_size=block_size):
+    reader, shape, georef, offsets, sizes = label_patches(in_raster, block_size)
+    return BlockRaster(lambda window: block_patch_cells(reader, window, offsets, sizes) * acres_per_cell, shape, georef, block_size)
+
+# Patch acres of several habitats of one year from one labeling of the EVT raster, saved block by block.
+# habitat_rasters: {habitat: habitat raster extracted from that EVT raster}, out_rasters: {habitat: path}.
+# Returns the saved paths.
+def save_habitat_patch_acres(evt_raster, habitat_rasters, out_rasters, acres_per_cell=acres_per_cell, block_size=block_size):
+    reader, shape, georef, offsets, sizes = label_patches(evt_raster, block_size)
+    habitat_list = list(out_rasters)
+    habitat_readers = [window_reader(habitat_rasters[habitat])[0] for habitat in habitat_list]
+    outputs = [create_raster(out_rasters[habitat], shape, georef) for habitat in habitat_list]
+    stats_list = [RasterStats() for habitat in habitat_list]
+    for window in block_windows(shape, block_size):
+        acres = block_patch_cells(reader, window, offsets, sizes) * acres_per_cell
+        for (out_ds, out_rb, path), stats, habitat_reader in zip(outputs, stats_list, habitat_readers):
+            block = np.where(np.isnan(habitat_reader(window)), np.nan, acres)
+            write_window(out_rb, block, window)
+            stats.add(block)
+    paths = []
+    for (out_ds, out_rb, path), stats in zip(outputs, stats_list):
+        close_raster(out_rb)
+        save_stats(path, stats)
+        paths.append(path)
+    outputs = None
+    return paths
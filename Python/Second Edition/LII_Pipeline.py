@@ -0,0 +1,214 @@
+# Name: LII_Pipeline.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 2.7 or 3 (ArcMap 10.7 or NumPy backend)
+# Description: Dependency-graph runner for the Landscape Integrity Index scripts (see LII_0_RunPipeline_v2.py).
+#              Each stage runs a script, or some PROCESS sections of a script, and declares the stages it depends on,
+#              its inputs and its outputs:
+#               - Stages run in dependency order, each stage at most once.
+#               - A stage is skipped when all its outputs exist and they are newer than its inputs, its script,
+#                 and the outputs of the stages it depends on. A stage runs again when a stage it depends on ran.
+#               - The time a stage completed is kept in a log (json), so outputs inside a file GDB, which have no file
+#                 of their own, are dated by the run that created them.
+#              Replaces commenting out the codes that have been completed and running the rest of the script again.
+# Warning:
+#          - A stage fails, and is not logged as completed, when its script raises an error or an output is missing after it
+#          ran. The scripts raise the errors of their try blocks again when they are run by the pipeline (raise_in_stage).
+#          - Outputs are checked as files (or path + ".tif", the tile store path + ".tiles" and the sparse raster
+#          path + ".sparse.npz" saved by the NumPy backend); outputs inside a file GDB
+#          are checked with arcpy.Exists.
+#          - A section is the code between two "# PROCESS" banners; the code before the first banner (parameters,
+#          variables and classes) runs with every section.
+#          - The parameters of a stage replace the value of the lines "name = ..." before the first banner of its script,
+#          so one script can run for another workspace or study area (LII_Regions.py). Names the script doesn't have are ignored.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys, io, json, time
+
+# Variables
+Banner = "# PROCESS"    # Start of the title line of a section banner
+Stage_running = False   # True while run_stage runs the script of a stage
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Stage of the pipeline: script (path), sections (titles of the PROCESS sections to run, None for the whole script),
+# depends (names of the stages it depends on), inputs and outputs (paths), parameters ({name: value} of the script)
+class Stage(object):
+
+    def __init__(self, name, script, sections=None, depends=None, inputs=None, outputs=None, parameters=None):
+        self.name = name
+        self.script = script
+        self.sections = sections
+        self.depends = list(depends or [])
+        self.inputs = list(inputs or [])
+        self.outputs = list(outputs or [])
+        self.parameters = dict(parameters or {})
+
+# Stages in dependency order, keeping the order of stage_list among stages that don't depend on each other.
+# With targets, only the target stages and the stages they depend on.
+def stage_order(stage_list, targets=None):
+    stage_dict = dict((stage.name, stage) for stage in stage_list)
+    for stage in stage_list:
+        for name in stage.depends:
+            if name not in stage_dict:
+                raise ValueError("Stage " + stage.name + " depends on unknown stage " + name)
+    needed = set(stage_dict)
+    if targets:
+        needed, todo = set(), list(targets)
+        while todo:
+            name = todo.pop()
+            if name not in stage_dict:
+                raise ValueError("Unknown stage " + name)
+            if name not in needed:
+                needed.add(name)
+                todo.extend(stage_dict[name].depends)
+    order, done = [], set()
+    while len(order) < len(needed):
+        ready = [stage for stage in stage_list if stage.name in needed and stage.name not in done
+                 and all(name in done for name in stage.depends)]
+        if not ready:
+            raise ValueError("Stages depend on each other: " + ", ".join(sorted(needed - done)))
+        order.append(ready[0])
+        done.add(ready[0].name)
+    return order
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Up to date
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Modification time of a file, or of path + ".tif", the tile store path + ".tiles" or the sparse raster path + ".sparse.npz"
+# saved by the NumPy backend. None if there is no such file.
+def path_time(path):
+    for name in (path, path + ".tif", path + ".tiles", path + ".sparse.npz"):
+        if os.path.isfile(name):
+            return os.path.getmtime(name)
+    return None
+
+# True if an output exists: a file, a .tif, tile store or sparse raster saved by the NumPy backend, or a dataset arcpy can
+# find (file GDB)
+def path_exists(path):
+    if os.path.exists(path) or os.path.exists(path + ".tif") or os.path.exists(path + ".tiles") or os.path.exists(path + ".sparse.npz"):
+        return True
+    try:
+        import arcpy
+    except ImportError:
+        return False
+    return bool(arcpy.Exists(path))
+
+# Read the log of the stages: {name: time the stage completed}
+def read_log(log_path):
+    if not os.path.isfile(log_path):
+        return {}
+    with io.open(log_path, encoding='utf-8') as f:
+        return json.load(f)
+
+# Save the log of the stages
+def save_log(log, log_path):
+    with io.open(log_path, 'w', encoding='utf-8') as f:
+        f.write(u"" + json.dumps(log, indent=2, sort_keys=True))
+
+# True if a stage doesn't need to run: its outputs exist and are newer than its inputs, its script and the stages it depends on
+def up_to_date(stage, log):
+    if stage.name not in log or not stage.outputs:
+        return False
+    if not all(path_exists(path) for path in stage.outputs):
+        return False
+    input_times = [path_time(path) for path in stage.inputs + [stage.script]]
+    input_times += [log.get(name) for name in stage.depends]
+    if None in input_times[len(stage.inputs) + 1:]:
+        return False
+    output_times = [path_time(path) for path in stage.outputs] + [log[stage.name]]
+    newest_input = max([t for t in input_times if t is not None] or [0])
+    return min(t for t in output_times if t is not None) >= newest_input
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Source of a script with only the code before the first PROCESS banner and the sections whose title starts with one of sections.
+# The lines of the other sections are left blank so line numbers of errors match the script.
+# parameters ({name: value}) replace the value of the first line "name = ..." before the first banner.
+def script_source(path, sections=None, parameters=None):
+    with io.open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    lines = set_parameters(lines, parameters or {})
+    if sections is None:
+        return "\n".join(lines) + "\n"
+    keep, title = [], None
+    for i, line in enumerate(lines):
+        if line.startswith(Banner) and i > 0 and lines[i - 1].startswith("# ---"):
+            title = line[2:].strip()
+            if keep:
+                keep[-1] = any(title.startswith(section) for section in sections)
+        keep.append(title is None or any(title.startswith(section) for section in sections))
+    missing = [section for section in sections
+               if not any(line[2:].strip().startswith(section) for line in lines if line.startswith(Banner))]
+    if missing:
+        raise ValueError("No section " + ", ".join(missing) + " in " + path)
+    return "\n".join(line if k else "" for line, k in zip(lines, keep)) + "\n"
+
+# Lines of a script with the parameter lines "name = ..." before the first banner set to name = value
+def set_parameters(lines, parameters):
+    lines, todo = list(lines), dict(parameters)
+    for i, line in enumerate(lines):
+        if line.startswith(Banner) or not todo:
+            break
+        name = line.split("=", 1)[0].strip()
+        if "=" in line and name in todo and line.startswith(name) and not line.split("=", 1)[1].startswith("="):
+            lines[i] = "{} = {!r}    # Set by the pipeline".format(name, todo.pop(name))
+    return lines
+
+# Run the script (or sections) of a stage in a namespace of its own. Returns the namespace.
+def run_stage(stage):
+    folder = os.path.dirname(os.path.abspath(stage.script))
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    code = compile(script_source(stage.script, stage.sections, stage.parameters), stage.script, 'exec')
+    namespace = {'__name__': '__lii_stage__', '__file__': stage.script}
+    global Stage_running
+    running, Stage_running = Stage_running, True
+    try:
+        exec(code, namespace)
+    finally:
+        Stage_running = running
+    return namespace
+
+# Called at the end of the except block of a try block of the scripts, after the error is printed: raise the error again
+# when the script is run by the pipeline, so the stage fails instead of being logged as completed
+def raise_in_stage():
+    if Stage_running:
+        raise
+
+# Run the stages of stage_list (or only targets and the stages they depend on) in dependency order, skipping the
+# stages that are up to date, unless force. log_path keeps the time each stage completed.
+# A stage that raises an error or doesn't write all its outputs stops the pipeline and is removed from the log.
+# Returns [(name, "ran" or "skipped")].
+def run_pipeline(stage_list, log_path, targets=None, force=False):
+    log = read_log(log_path)
+    ran, report = set(), []
+    for stage in stage_order(stage_list, targets):
+        if not force and not any(name in ran for name in stage.depends) and up_to_date(stage, log):
+            print("Skipped " + stage.name + ": outputs are up to date")
+            report.append((stage.name, "skipped"))
+            continue
+        print("Running " + stage.name + " (" + os.path.basename(stage.script) + ")")
+        clock = time.time()
+        try:
+            run_stage(stage)
+            missing = [path for path in stage.outputs if not path_exists(path)]
+            if missing:
+                raise RuntimeError("Stage " + stage.name + " didn't write " + ", ".join(missing))
+        except Exception:
+            print("Failed " + stage.name)
+            log.pop(stage.name, None)
+            save_log(log, log_path)
+            raise
+        log[stage.name] = time.time()
+        save_log(log, log_path)
+        ran.add(stage.name)
+        print("Completed " + stage.name + " in {} seconds".format(int(time.time() - clock)))
+        report.append((stage.name, "ran"))
+    return report
@@ -0,0 +1,301 @@
+# Name: LII_Rasterize.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, ArcMap 10.7 or ArcGIS Pro or GDAL (arcpy or OGR, only for reading feature classes)
+# Description: Rasterizer for the resource- and stressor-based metrics, used in place of
+#              FeatureToRaster_conversion -> MakeRasterLayer_management -> CopyRaster_management.
+#              The features are burned directly on the study area grid (the extent of the scripts at 30 m):
+#               - Points: the cell that holds the point.
+#               - Lines: every cell the line passes through (supercover), from the grid lines each segment crosses.
+#               - Polygons: scanline fill, the cells whose center is inside the polygon (even-odd rule, so holes
+#                 stay empty), from the crossings of the edges with the row centers.
+#              All years of a resource or stressor are burned in one pass over the geometries (rasterize_years):
+#              each geometry adds its cells to the plane of its year, and each year is saved as its _ras raster.
+# Warning:
+#          - A cell is burned with the value field of the last feature that covers it. The IP value is the same for
+#          every feature of a feature class, so the order doesn't change the result.
+#          - Features are read from feature_class + ".geojson" when it exists (a feature class exported to run without
+#          ArcMap), otherwise with arcpy.da.SearchCursor, or with OGR's OpenFileGDB driver when arcpy isn't installed
+#          (read_features); the rasterizing itself needs only NumPy.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, math, json, fnmatch
+import numpy as np
+from LII_MapAlgebra import save_raster
+
+# Variables
+Extent = (466742.670480727, 3540181.0486208, 682832.670480727, 3716251.0486208)    # XMin, YMin, XMax, YMax of the study area
+cell_size = 30
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Grid
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Shape (rows, columns) and georeference of the grid of cell_size cells that covers an extent (XMin, YMin, XMax, YMax)
+def extent_grid(extent=Extent, cell_size=cell_size, projection=""):
+    xmin, ymin, xmax, ymax = extent
+    cols = int(math.ceil((xmax - xmin) / cell_size - 1e-6))
+    rows = int(math.ceil((ymax - ymin) / cell_size - 1e-6))
+    return (rows, cols), {'geotransform': (xmin, cell_size, 0.0, ymax, 0.0, -cell_size), 'projection': projection}
+
+# Map coordinates ((n, 2) array of x, y) to cell coordinates ((n, 2) array of row, column, not rounded)
+def map_to_cells(xy, georef):
+    x0, dx, rx, y0, ry, dy = georef['geotransform']
+    xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+    return np.column_stack([(xy[:, 1] - y0) / dy, (xy[:, 0] - x0) / dx])
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Cells of geometries (in cell coordinates: row, column)
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Linear indexes (row * columns + column) of the cells inside the grid
+def cell_index(rows, cols, shape):
+    inside = (rows >= 0) & (rows < shape[0]) & (cols >= 0) & (cols < shape[1])
+    return rows[inside] * shape[1] + cols[inside]
+
+# Integers k with lo <= k <= hi for each pair, as (pair number, k) arrays
+def expand_ranges(lo, hi):
+    count = np.maximum(hi - lo + 1, 0)
+    pair = np.repeat(np.arange(len(lo)), count)
+    k = lo[pair] + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    return pair, k
+
+# Cells of points ((n, 2) array)
+def point_cells(points, shape):
+    points = np.floor(np.asarray(points, dtype=np.float64).reshape(-1, 2)).astype(np.int64)
+    return cell_index(points[:, 0], points[:, 1], shape)
+
+# Cells of lines (list of (vertices, 2) arrays): every cell a segment passes through.
+# Each segment is cut at the grid lines it crosses, and the middle of every piece falls in one of its cells.
+def line_cells(lines, shape):
+    lines = [np.asarray(line, dtype=np.float64).reshape(-1, 2) for line in lines]
+    segments = [np.hstack([line[:-1], line[1:]]) for line in lines if len(line) > 1]
+    segments += [np.hstack([line, line]) for line in lines if len(line) == 1]
+    if not segments:
+        return np.zeros(0, dtype=np.int64)
+    r0, c0, r1, c1 = np.vstack(segments).T
+    seg = np.arange(len(r0))
+    seg_list, t_list = [seg, seg], [np.zeros(len(seg)), np.ones(len(seg))]
+    for a0, a1 in ((r0, r1), (c0, c1)):
+        lo = np.floor(np.minimum(a0, a1)).astype(np.int64) + 1
+        hi = np.floor(np.maximum(a0, a1)).astype(np.int64)
+        pair, k = expand_ranges(lo, hi)
+        seg_list.append(pair)
+        t_list.append((k - a0[pair]) / (a1 - a0)[pair])
+    seg, t = np.concatenate(seg_list), np.concatenate(t_list)
+    order = np.lexsort((t, seg))
+    seg, t = seg[order], t[order]
+    piece = (seg[1:] == seg[:-1]) & (t[1:] > t[:-1])
+    s, tm = seg[1:][piece], (t[1:][piece] + t[:-1][piece]) / 2
+    rows = np.floor(r0[s] + tm * (r1 - r0)[s]).astype(np.int64)
+    cols = np.floor(c0[s] + tm * (c1 - c0)[s]).astype(np.int64)
+    return np.unique(cell_index(rows, cols, shape))
+
+# Cells of polygons (list of polygons, each a list of rings as (vertices, 2) arrays) with their center inside.
+# Every edge gives its crossings with the row centers; along each row of a polygon the sorted crossings pair up
+# into spans of cells (even-odd rule, so holes and overlapping rings are handled by the same pairing).
+def polygon_cells(polygons, shape):
+    poly_list, edge_list = [], []
+    for p, rings in enumerate(polygons):
+        for ring in rings:
+            ring = np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+            if len(ring) < 3:
+                continue
+            edge_list.append(np.hstack([ring, np.roll(ring, -1, axis=0)]))
+            poly_list.append(np.full(len(ring), p))
+    if not edge_list:
+        return np.zeros(0, dtype=np.int64)
+    r0, c0, r1, c1 = np.vstack(edge_list).T
+    poly = np.concatenate(poly_list)
+
+    # Crossings of the edges with the row centers (row + 0.5), half-open so a vertex on a row center counts once
+    lo = np.maximum(np.ceil(np.minimum(r0, r1) - 0.5).astype(np.int64), 0)
+    hi = np.minimum(np.ceil(np.maximum(r0, r1) - 0.5).astype(np.int64) - 1, shape[0] - 1)
+    edge, row = expand_ranges(lo, hi)
+    x = c0[edge] + (row + 0.5 - r0[edge]) * (c1 - c0)[edge] / (r1 - r0)[edge]
+
+    # Pair up the sorted crossings of each polygon and row into spans of cell centers
+    order = np.lexsort((x, row, poly[edge]))
+    row, x = row[order], x[order]
+    start = np.maximum(np.ceil(x[0::2] - 0.5).astype(np.int64), 0)
+    stop = np.minimum(np.ceil(x[1::2] - 0.5).astype(np.int64) - 1, shape[1] - 1)
+    span, col = expand_ranges(start, stop)
+    return np.unique(row[0::2][span] * shape[1] + col)
+
+# Cells of one geometry: kind "point" (points), "polyline" (lines) or "polygon" (list of rings)
+def geometry_cells(kind, parts, shape):
+    if kind in ("point", "multipoint"):
+        return point_cells(np.vstack(parts) if len(parts) else np.zeros((0, 2)), shape)
+    if kind == "polyline":
+        return line_cells(parts, shape)
+    if kind == "polygon":
+        return polygon_cells([parts], shape)
+    raise ValueError("Unsupported geometry type " + str(kind))
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Reading features
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# arcpy if it is installed, otherwise None
+def import_arcpy():
+    try:
+        import arcpy
+    except ImportError:
+        return None
+    return arcpy
+
+# GDAL's OGR, or a clear message if neither arcpy nor GDAL is installed
+def import_ogr():
+    try:
+        from osgeo import ogr
+    except ImportError:
+        raise ImportError("arcpy or GDAL (osgeo) is required to read feature classes without a .geojson copy")
+    return ogr
+
+# Open the layer of a feature class with OGR (a feature class inside a file GDB, or a file OGR can read)
+def open_layer(feature_class):
+    ogr = import_ogr()
+    gdb, name = os.path.split(feature_class)
+    ds = ogr.Open(gdb) if gdb.lower().endswith(".gdb") else ogr.Open(feature_class)
+    if ds is None:
+        raise IOError("Can't open feature class " + feature_class)
+    layer = ds.GetLayerByName(name) if gdb.lower().endswith(".gdb") else ds.GetLayer(0)
+    if layer is None:
+        raise IOError("Can't open feature class " + feature_class)
+    return ds, layer
+
+# Names of the feature classes of a workspace that match pattern (as arcpy.ListFeatureClasses): the .geojson files,
+# then the feature classes of arcpy or OGR
+def list_feature_classes(workspace, pattern="*"):
+    names = set()
+    if os.path.isdir(workspace):
+        names.update(filename[:-len(".geojson")] for filename in os.listdir(workspace) if filename.endswith(".geojson"))
+    arcpy = import_arcpy()
+    if arcpy is not None:
+        for dirpath, dirnames, filenames in arcpy.da.Walk(workspace, datatype="FeatureClass"):
+            names.update(filenames)
+            break
+    elif not names:
+        ds = import_ogr().Open(workspace)
+        if ds is not None:
+            names.update(ds.GetLayer(i).GetName() for i in range(ds.GetLayerCount()))
+    return sorted(fnmatch.filter(names, pattern))
+
+# Projection (WKT) of a feature class. A .geojson copy takes the WKT of feature_class + ".prj", "" without one.
+def feature_projection(feature_class):
+    if os.path.isfile(feature_class + ".geojson"):
+        if not os.path.isfile(feature_class + ".prj"):
+            return ""
+        with open(feature_class + ".prj") as f:
+            return f.read().strip()
+    arcpy = import_arcpy()
+    if arcpy is not None:
+        return arcpy.Describe(feature_class).spatialReference.exportToString().split(";")[0]
+    ds, layer = open_layer(feature_class)
+    reference = layer.GetSpatialRef()
+    return reference.ExportToWkt() if reference is not None else ""
+
+# Kind and parts (each an (n, 2) array of x, y; the rings of polygons are parts) of a GeoJSON geometry
+def geojson_parts(geometry):
+    kind, coordinates = geometry['type'], geometry['coordinates']
+    if kind == "Point":
+        return "point", [np.array([coordinates[:2]], dtype=np.float64)]
+    if kind == "MultiPoint":
+        return "multipoint", [np.array([point[:2]], dtype=np.float64) for point in coordinates]
+    if kind == "LineString":
+        coordinates, kind = [coordinates], "MultiLineString"
+    if kind == "MultiLineString":
+        return "polyline", [np.array([point[:2] for point in line], dtype=np.float64) for line in coordinates]
+    if kind == "Polygon":
+        coordinates, kind = [coordinates], "MultiPolygon"
+    if kind == "MultiPolygon":
+        return "polygon", [np.array([point[:2] for point in ring], dtype=np.float64) for polygon in coordinates for ring in polygon]
+    raise ValueError("Unsupported geometry type " + str(kind))
+
+# Read the features of a GeoJSON file or OGR layer as (kind, parts, value of value_field). "OID@" is the feature number.
+def read_geojson_features(features, value_field):
+    for number, feature in enumerate(features, 1):
+        if not feature.get('geometry'):
+            continue
+        kind, parts = geojson_parts(feature['geometry'])
+        value = number if value_field == "OID@" else (feature.get('properties') or {}).get(value_field)
+        yield kind, parts, value
+
+# Read the features of a feature class as (kind, parts in map coordinates, value of value_field).
+# Polygon parts are split into their rings (arcpy separates the rings of a part with None).
+# "OID@" reads the object ID, for the geometries of a feature class without a value field.
+def read_features(feature_class, value_field):
+    if os.path.isfile(feature_class + ".geojson"):
+        with open(feature_class + ".geojson") as f:
+            for feature in read_geojson_features(json.load(f)['features'], value_field):
+                yield feature
+        return
+    arcpy = import_arcpy()
+    if arcpy is None:
+        ds, layer = open_layer(feature_class)
+        features = ({'geometry': json.loads(feature.GetGeometryRef().ExportToJson()) if feature.GetGeometryRef() else None,
+                     'properties': feature.items()} for feature in layer)
+        for feature in read_geojson_features(features, value_field):
+            yield feature
+        return
+    with arcpy.da.SearchCursor(feature_class, ["SHAPE@", value_field]) as cursor:
+        for shape, value in cursor:
+            if shape is None:
+                continue
+            parts = []
+            for part in shape:
+                if shape.type == "point":
+                    part = [part]
+                ring = []
+                for point in part:
+                    if point is None:
+                        if ring:
+                            parts.append(np.array(ring))
+                        ring = []
+                    else:
+                        ring.append((point.X, point.Y))
+                if ring:
+                    parts.append(np.array(ring))
+            yield shape.type, parts, value
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Burning
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Burn the features of all years in one pass over the geometries.
+# features: (year, kind, parts in map coordinates, value). Returns {year: (linear indexes of the cells, values)}.
+def rasterize_years(features, year_list, shape, georef):
+    cells = dict((year, ([], [])) for year in year_list)
+    for year, kind, parts, value in features:
+        if year not in cells or value is None:
+            continue
+        index = geometry_cells(kind, [map_to_cells(part, georef) for part in parts], shape)
+        cells[year][0].append(index)
+        cells[year][1].append(np.full(len(index), value, dtype=np.float64))
+    out = {}
+    for year, (index, values) in cells.items():
+        out[year] = (np.concatenate(index) if index else np.zeros(0, dtype=np.int64),
+                     np.concatenate(values) if values else np.zeros(0))
+    return out
+
+# Raster of burned cells: the values on the cells, NoData elsewhere
+def burn(index, values, shape):
+    out = np.full(shape, np.nan)
+    out.ravel()[index] = values
+    return out
+
+# Burn the features of every year and save each year to its raster.
+# features: (year, kind, parts, value); out_rasters: paths in the order of year_list. Returns out_rasters.
+def save_year_rasters(features, year_list, out_rasters, shape, georef):
+    cells = rasterize_years(features, year_list, shape, georef)
+    for year, OutputName in zip(year_list, out_rasters):
+        save_raster(burn(cells[year][0], cells[year][1], shape), OutputName, georef)
+    return list(out_rasters)
+
+# Feature to Raster on the study area grid, same as FeatureToRaster_conversion(in_features, field, out_raster, cell_size)
+# clipped to extent: the cells of the features with the value of field, NoData elsewhere. Returns out_raster.
+def FeatureToRaster(in_features, field, out_raster, cell_size=cell_size, extent=Extent):
+    shape, georef = extent_grid(extent, cell_size, feature_projection(in_features))
+    features = ((None, kind, parts, value) for kind, parts, value in read_features(in_features, field))
+    return save_year_rasters(features, [None], [out_raster], shape, georef)[0]
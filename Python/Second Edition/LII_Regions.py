@@ -0,0 +1,172 @@
+# Name: LII_Regions.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, ArcMap 10.7 or ArcGIS Pro (arcpy, for reading and selecting the boundary polygons)
+# Description: Landscape Integrity Index of many regions (e.g. every BLM field office of a state) in one run, in place of
+#              the study area hard-coded in the scripts (Carlsbad Field Office):
+#               1. The boundary polygons are read from one feature class, grouped by the value of a name field.
+#               2. The grid of each region is the extent of its polygons snapped outward to the cells of a common
+#                  grid (Snap_origin, cell_size), so the rasters of neighboring regions line up and can be mosaicked.
+#               3. Each region gets a folder of its own (Workspace_Folder of the scripts) with its boundary, and the
+#                  pipeline (LII_0_RunPipeline_v2.py) runs for it with Study_Extent and boundary_input of the region.
+#               4. The regions run on a pool of worker processes (LII_Parallel.py), one region per worker. The national
+#                  inputs (LANDFIRE EVT and VDEP, NLCD) are given once, as the same paths for every region: they are
+#                  read where they are and not copied per region, and each region keeps only its own clip of them.
+#                  The reprojection indexes of every region are kept in one cache folder (out_folder/LII_Reproject),
+#                  so running the regions again, or some of them, doesn't compute them again.
+#              A region whose outputs are up to date is skipped stage by stage (LII_Pipeline.py), so a failed region
+#              can be run again alone.
+# Warning:
+#          - The boundary polygons need to be in the coordinate system of the outputs (NAD_1983_UTM_Zone_13N) and
+#          the name field needs to be a text field.
+#          - With more than one region worker, the scripts run their own tasks one by one (Workers = 1): worker
+#          processes can't start a pool of their own.
+#          - Each region worker holds the memory of one pipeline run of its region, Process_memory plus Cell_memory per
+#          cell of its grid. region_workers runs as many regions at the same time as the available memory holds (the
+#          largest regions together), up to the CPUs, and 1 when the memory can't be measured.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, re, math, json, shutil
+import numpy as np
+from collections import OrderedDict
+from LII_Rasterize import read_features, extent_grid, Extent, cell_size
+from LII_Parallel import run_tasks, Workers
+from LII_Pipeline import Stage, run_stage
+
+# Variables
+Snap_origin = (Extent[0], Extent[3])     # X, Y of a corner of the cells of the common grid (upper left of the Carlsbad grid)
+Pipeline_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "LII_0_RunPipeline_v2.py")
+Boundary_name = "boundary_input"    # Boundary of a region in its folder (boundary_input of LII_1_DataPrep_v2.py), .shp or .geojson
+Reproject_folder = "LII_Reproject"  # Cache folder of the reprojection indexes of every region in out_folder (Reproject_cache of LII_1_DataPrep_v2.py)
+Cell_memory = 100               # Peak bytes per cell of the EDT decay, patch labeling and focal mean stages (LII_Benchmark.py: 60 - 100 at 1/16 of the CFO)
+Process_memory = 128 * 1024 ** 2    # Bytes of a worker process before any raster (Python, NumPy and GDAL, 30 - 90 MB measured)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Grids
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Read the boundary polygons of a feature class into {name: rings in map coordinates}, grouped by the value of name_field
+def read_regions(feature_class, name_field):
+    regions = OrderedDict()
+    for kind, parts, name in read_features(feature_class, name_field):
+        if kind != "polygon" or name is None:
+            continue
+        regions.setdefault(str(name), []).extend(parts)
+    return regions
+
+# Extent (XMin, YMin, XMax, YMax) of rings or parts in map coordinates
+def parts_extent(parts):
+    xy = np.vstack([np.asarray(part, dtype=np.float64).reshape(-1, 2) for part in parts])
+    return float(xy[:, 0].min()), float(xy[:, 1].min()), float(xy[:, 0].max()), float(xy[:, 1].max())
+
+# Extent grown to the cells of the grid of cell_size cells with a corner at origin (X, Y), plus margin cells on every side
+def snap_extent(extent, origin=Snap_origin, cell_size=cell_size, margin=0):
+    xmin, ymin, xmax, ymax = extent
+    x0, y0 = origin
+    return (x0 + (math.floor((xmin - x0) / cell_size + 1e-6) - margin) * cell_size,
+            y0 + (math.floor((ymin - y0) / cell_size + 1e-6) - margin) * cell_size,
+            x0 + (math.ceil((xmax - x0) / cell_size - 1e-6) + margin) * cell_size,
+            y0 + (math.ceil((ymax - y0) / cell_size - 1e-6) + margin) * cell_size)
+
+# Snapped extent, shape (rows, columns) and georeference of the grid of a region from its rings
+def region_grid(parts, origin=Snap_origin, cell_size=cell_size, projection=""):
+    extent = snap_extent(parts_extent(parts), origin, cell_size)
+    shape, georef = extent_grid(extent, cell_size, projection)
+    return extent, shape, georef
+
+# Folder name of a region (letters, digits and _)
+def region_folder(name):
+    return re.sub(r"\W+", "_", name).strip("_") or "region"
+
+# Save the boundary polygons of one region to its folder (Boundary_name) and return the feature class: a .geojson copy
+# of the features of the region when the boundaries are a .geojson copy (with its .prj), else a shapefile
+def save_region_boundary(feature_class, name_field, name, folder):
+    out_fc = os.path.join(folder, Boundary_name)
+    if os.path.isfile(feature_class + ".geojson"):
+        with open(feature_class + ".geojson") as f:
+            collection = json.load(f)
+        collection['features'] = [feature for feature in collection['features']
+                                  if str((feature.get('properties') or {}).get(name_field)) == name]
+        with open(out_fc + ".geojson", "w") as f:
+            json.dump(collection, f)
+        if os.path.isfile(feature_class + ".prj"):
+            shutil.copyfile(feature_class + ".prj", out_fc + ".prj")
+        return out_fc
+    import arcpy
+    where = "{} = '{}'".format(arcpy.AddFieldDelimiters(feature_class, name_field), name.replace("'", "''"))
+    arcpy.Select_analysis(feature_class, out_fc + ".shp", where)
+    return out_fc + ".shp"
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Batch
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Bytes of memory available to new processes, None if it can't be measured (psutil, or the free pages on Linux)
+def available_memory():
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return psutil.virtual_memory().available
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+# Bytes of memory of one pipeline run of a region grid (rows, columns)
+def region_memory(shape):
+    return Process_memory + shape[0] * shape[1] * Cell_memory
+
+# Regions to run at the same time, from the grid shapes of the regions: as many as the available memory holds when the
+# largest regions run together, between 1 and the CPUs, and 1 when the memory can't be measured
+def region_workers(shape_list):
+    memory = available_memory()
+    if memory is None or not shape_list:
+        return 1
+    total, workers = 0, 0
+    for needed in sorted((region_memory(shape) for shape in shape_list), reverse=True):
+        total += needed
+        if total > memory:
+            break
+        workers += 1
+    return int(max(1, min(workers, Workers)))
+
+# Run the pipeline (LII_0_RunPipeline_v2.py) of one region with the parameters of its scripts ({name: value}).
+# Returns (name, [(stage, "ran" or "skipped")]).
+def run_region(name, folder, parameters, targets=None, force=False):
+    namespace = run_stage(Stage(name, Pipeline_script, parameters={'Workspace_Folder': folder, 'Target_list': list(targets or []),
+                                                                  'Force': force, 'Script_parameters': parameters}))
+    return name, namespace['report']
+
+# Landscape Integrity Index of every region of the boundary feature class (or the regions of name_list), each in
+# out_folder/name. shared_parameters ({name: value}) are given to the scripts of every region (e.g. Backend, the national
+# inputs EVT2001_input, NLCD2001_input, ...). The regions run on workers processes, None for region_workers.
+# The region grids are snapped to the cells with a corner at origin. Returns [(name, [(stage, "ran" or "skipped")])]
+# in the order of the regions.
+def run_regions(feature_class, name_field, out_folder, shared_parameters=None, name_list=None, targets=None, force=False,
+                workers=None, origin=Snap_origin):
+    regions = read_regions(feature_class, name_field)
+    missing = [name for name in name_list or [] if name not in regions]
+    if missing:
+        raise ValueError("No region " + ", ".join(missing) + " in " + str(feature_class))
+    task_list, shape_list = [], []
+    for name, parts in regions.items():
+        if name_list and name not in name_list:
+            continue
+        folder = os.path.join(out_folder, region_folder(name))
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        boundary_input = save_region_boundary(feature_class, name_field, name, folder)
+        extent, shape, georef = region_grid(parts, origin)
+        parameters = dict(shared_parameters or {}, Workspace_Folder=folder, Study_Extent=extent, boundary_input=boundary_input,
+                          Reproject_cache=os.path.join(out_folder, Reproject_folder))
+        task_list.append((name, folder, parameters, targets, force))
+        shape_list.append(shape)
+    if workers is None:
+        workers = region_workers(shape_list)
+    if min(workers, len(task_list)) > 1:
+        for task in task_list:
+            task[2]['Workers'] = 1
+    return run_tasks(run_region, task_list, workers)
@@ -0,0 +1,297 @@
+# Name: LII_Reproject.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, GDAL (only for reading the national rasters)
+# Description: Reprojection of the national rasters (LANDFIRE EVT and VDEP, NLCD in CONUS Albers at 30 m) to the study
+#              area grid (NAD_1983_UTM_Zone_13N) for the NumPy backend, in place of ProjectRaster_management on each raster:
+#               1. Reprojection index: the cell of the source grid (nearest neighbor) of every cell center of the study
+#                  area grid, computed tile by tile with the projection formulas (Albers Equal Area Conic and Transverse
+#                  Mercator on the ellipsoid of the WKT, Snyder 1987 and the Krueger series of Karney 2011).
+#                  It is computed once per distinct source grid (the 16 rasters share one or two grids) and cached
+#                  in a folder (int32 cell numbers of the source window that covers the study area, -1 outside the source).
+#                  The same window (grown by Source_margin cells) is the rectangle the ArcMap backend clips the
+#                  national rasters to before ProjectRaster_management (source_rectangle).
+#               2. Each raster is resampled with one gather of the source cells from the index, tile by tile, reading
+#                  only the source window under the tile. With a boundary mask (LII_Mask.py) the cells outside the
+#                  boundary are NoData and the tiles outside it are not read, so the clip is done in the same pass.
+#              The rasters run on a pool of worker processes (LII_Parallel.py), the index is only read by them.
+# Warning:
+#          - Nearest neighbor only (the default of ProjectRaster_management), for the class rasters (EVT, VDEP, NLCD).
+#          - No datum transformation: the source and target coordinate systems need the same datum (NAD 1983).
+#          - Projections: Albers Equal Area Conic, Transverse Mercator (UTM) and geographic coordinates.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, re, json, hashlib
+import numpy as np
+from collections import OrderedDict
+from LII_MapAlgebra import BlockRaster, open_raster, read_window, dataset_shape, georef_of_dataset, block_windows
+from LII_Store import open_store
+from LII_Tiles import tile_size
+from LII_Parallel import run_tasks, Workers
+
+# Variables
+index_prefix = "reproject_"     # Cached index: cache folder + index_prefix + key of the source and target grids + ".npy" (and ".json")
+GRS80 = (6378137.0, 298.257222101)     # Semimajor axis and inverse flattening when the WKT has no spheroid
+Source_margin = 10      # Cells of the source grid added on every side of the window of a source raster under the study area grid
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Projections
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Projection of a WKT (ESRI or OGC): {'projection': 'albers', 'tm' or 'longlat', 'a', 'f' and the parameters in degrees
+# and meters: lat_1, lat_2, lat_0, lon_0, k_0, x_0, y_0}
+def parse_projection(wkt):
+    spheroid = re.search(r'SPHEROID\["[^"]*",\s*([-\d.eE+]+),\s*([-\d.eE+]+)', wkt, re.I)
+    a, inverse_f = (float(spheroid.group(1)), float(spheroid.group(2))) if spheroid else GRS80
+    params = dict((name.lower(), float(value)) for name, value in re.findall(r'PARAMETER\["([^"]+)",\s*([-\d.eE+]+)\]', wkt, re.I))
+    crs = {'a': a, 'f': 1.0 / inverse_f if inverse_f else 0.0,
+           'lat_1': params.get('standard_parallel_1', 0.0), 'lat_2': params.get('standard_parallel_2', params.get('standard_parallel_1', 0.0)),
+           'lat_0': params.get('latitude_of_origin', params.get('latitude_of_center', 0.0)),
+           'lon_0': params.get('central_meridian', params.get('longitude_of_center', 0.0)),
+           'k_0': params.get('scale_factor', 1.0), 'x_0': params.get('false_easting', 0.0), 'y_0': params.get('false_northing', 0.0)}
+    projection = re.search(r'PROJECTION\["([^"]+)"', wkt, re.I)
+    name = projection.group(1).lower() if projection else ""
+    if not projection and re.match(r'\s*GEOG', wkt, re.I):
+        crs['projection'] = 'longlat'
+    elif name.startswith('albers'):
+        crs['projection'] = 'albers'
+    elif name == 'transverse_mercator':
+        crs['projection'] = 'tm'
+    else:
+        raise ValueError("Unsupported projection " + (name or repr(wkt[:60])))
+    return crs
+
+# Albers q of latitudes (radians)
+def albers_q(phi, e):
+    s = np.sin(phi)
+    if e == 0:
+        return 2 * s
+    return (1 - e * e) * (s / (1 - e * e * s * s) - np.log((1 - e * s) / (1 + e * s)) / (2 * e))
+
+# Albers constants: e, n, C, rho0 / a
+def albers_constants(crs):
+    e = np.sqrt(crs['f'] * (2 - crs['f']))
+    phi1, phi2, phi0 = np.radians([crs['lat_1'], crs['lat_2'], crs['lat_0']])
+    m1, m2 = [np.cos(phi) / np.sqrt(1 - (e * np.sin(phi)) ** 2) for phi in (phi1, phi2)]
+    q1, q2, q0 = [albers_q(phi, e) for phi in (phi1, phi2, phi0)]
+    n = (m1 * m1 - m2 * m2) / (q2 - q1) if abs(phi1 - phi2) > 1e-12 else np.sin(phi1)
+    C = m1 * m1 + n * q1
+    return e, n, C, np.sqrt(C - n * q0) / n
+
+# Albers Equal Area Conic: longitude, latitude (radians) -> x, y
+def albers_forward(lon, lat, crs):
+    e, n, C, rho0 = albers_constants(crs)
+    rho = np.sqrt(C - n * albers_q(lat, e)) / n
+    theta = n * (lon - np.radians(crs['lon_0']))
+    return crs['a'] * rho * np.sin(theta) + crs['x_0'], crs['a'] * (rho0 - rho * np.cos(theta)) + crs['y_0']
+
+# Albers Equal Area Conic: x, y -> longitude, latitude (radians), latitude by fixed-point iteration on q
+def albers_inverse(x, y, crs):
+    e, n, C, rho0 = albers_constants(crs)
+    x, y = (x - crs['x_0']) / crs['a'], rho0 - (y - crs['y_0']) / crs['a']
+    rho = np.hypot(x, y) * np.sign(n)
+    theta = np.arctan2(x * np.sign(n), y * np.sign(n))
+    q = (C - (rho * n) ** 2) / n
+    phi = np.arcsin(np.clip(q / 2, -1, 1))
+    for i in range(10):
+        s = np.sin(phi)
+        phi = phi + (1 - (e * s) ** 2) ** 2 / (2 * np.cos(phi)) * (q / (1 - e * e) - s / (1 - (e * s) ** 2)
+                                                                  + (np.log((1 - e * s) / (1 + e * s)) / (2 * e) if e else 0))
+    return np.radians(crs['lon_0']) + theta / n, phi
+
+# Transverse Mercator series constants: n, A and the alpha, beta and delta coefficients of the Krueger series
+def tm_constants(crs):
+    n = crs['f'] / (2 - crs['f'])
+    A = crs['a'] / (1 + n) * (1 + n ** 2 / 4 + n ** 4 / 64)
+    alpha = [n / 2 - 2 * n ** 2 / 3 + 5 * n ** 3 / 16, 13 * n ** 2 / 48 - 3 * n ** 3 / 5, 61 * n ** 3 / 240]
+    beta = [n / 2 - 2 * n ** 2 / 3 + 37 * n ** 3 / 96, n ** 2 / 48 + n ** 3 / 15, 17 * n ** 3 / 480]
+    delta = [2 * n - 2 * n ** 2 / 3 - 2 * n ** 3, 7 * n ** 2 / 3 - 8 * n ** 3 / 5, 56 * n ** 3 / 15]
+    return n, A, alpha, beta, delta
+
+# Transverse Mercator on the ellipsoid, without false easting and northing: longitude, latitude (radians) -> x, y
+def tm_xy(lon, lat, crs):
+    n, A, alpha, beta, delta = tm_constants(crs)
+    k = 2 * np.sqrt(n) / (1 + n)
+    t = np.sinh(np.arctanh(np.sin(lat)) - k * np.arctanh(k * np.sin(lat)))
+    dlon = lon - np.radians(crs['lon_0'])
+    xi, eta = np.arctan2(t, np.cos(dlon)), np.arctanh(np.sin(dlon) / np.sqrt(1 + t * t))
+    x, y = eta.copy(), xi.copy()
+    for j, a in enumerate(alpha, 1):
+        x += a * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+        y += a * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+    return crs['k_0'] * A * x, crs['k_0'] * A * y
+
+# Transverse Mercator: longitude, latitude (radians) -> x, y
+def tm_forward(lon, lat, crs):
+    x, y = tm_xy(lon, lat, crs)
+    y0 = tm_xy(np.radians(crs['lon_0']), np.radians(crs['lat_0']), crs)[1]
+    return x + crs['x_0'], y - y0 + crs['y_0']
+
+# Transverse Mercator: x, y -> longitude, latitude (radians)
+def tm_inverse(x, y, crs):
+    n, A, alpha, beta, delta = tm_constants(crs)
+    y0 = tm_xy(np.radians(crs['lon_0']), np.radians(crs['lat_0']), crs)[1]
+    xi, eta = (y - crs['y_0'] + y0) / (crs['k_0'] * A), (x - crs['x_0']) / (crs['k_0'] * A)
+    xi1, eta1 = xi.copy(), eta.copy()
+    for j, b in enumerate(beta, 1):
+        xi1 -= b * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        eta1 -= b * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+    chi = np.arcsin(np.sin(xi1) / np.cosh(eta1))
+    lat = chi.copy()
+    for j, d in enumerate(delta, 1):
+        lat += d * np.sin(2 * j * chi)
+    return np.radians(crs['lon_0']) + np.arctan2(np.sinh(eta1), np.cos(xi1)), lat
+
+# Transform x, y arrays from the coordinate system src to dst ({projection, ...} of parse_projection)
+def transform(x, y, src, dst):
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    inverse = {'albers': albers_inverse, 'tm': tm_inverse, 'longlat': lambda x, y, crs: (np.radians(x), np.radians(y))}
+    forward = {'albers': albers_forward, 'tm': tm_forward, 'longlat': lambda lon, lat, crs: (np.degrees(lon), np.degrees(lat))}
+    lon, lat = inverse[src['projection']](x, y, src)
+    return forward[dst['projection']](lon, lat, dst)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Reprojection index
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Map coordinates of the cell centers of a window of a grid
+def cell_centers(window, georef):
+    x0, dx, rx, y0, ry, dy = georef['geotransform']
+    rows = np.arange(window[0].start, window[0].stop)[:, np.newaxis] + 0.5
+    cols = np.arange(window[1].start, window[1].stop)[np.newaxis, :] + 0.5
+    return x0 + cols * dx + rows * rx, y0 + cols * ry + rows * dy
+
+# Row and column (integer, not clipped) of the source cells that hold map coordinates x, y of the source grid
+def source_cells(x, y, source_georef):
+    x0, dx, rx, y0, ry, dy = source_georef['geotransform']
+    return np.floor((y - y0) / dy).astype(np.int64), np.floor((x - x0) / dx).astype(np.int64)
+
+# Source cells (row, column arrays) of the cell centers of a window of the target grid
+def window_source_cells(window, source_georef, georef):
+    x, y = cell_centers(window, georef)
+    x, y = transform(x, y, parse_projection(georef['projection']), parse_projection(source_georef['projection']))
+    return source_cells(x, y, source_georef)
+
+# Window of the source grid (row slice, column slice, clipped to the source) under the target grid (shape, georef),
+# grown by margin cells. The target grid maps to a region whose bounds are reached on the image of its edge cells.
+def source_window(source_shape, source_georef, shape, georef, margin=1):
+    rows, cols = shape
+    edges = [(slice(0, 1), slice(0, cols)), (slice(rows - 1, rows), slice(0, cols)),
+             (slice(0, rows), slice(0, 1)), (slice(0, rows), slice(cols - 1, cols))]
+    cells = [window_source_cells(window, source_georef, georef) for window in edges]
+    r = np.concatenate([row.ravel() for row, col in cells])
+    c = np.concatenate([col.ravel() for row, col in cells])
+    r0, r1 = max(int(r.min()) - margin, 0), min(int(r.max()) + margin + 1, source_shape[0])
+    c0, c1 = max(int(c.min()) - margin, 0), min(int(c.max()) + margin + 1, source_shape[1])
+    if r0 >= r1 or c0 >= c1:
+        raise ValueError("The source raster doesn't cover the study area")
+    return slice(r0, r1), slice(c0, c1)
+
+# Extent (XMin, YMin, XMax, YMax in the map units of the source) of the window of the source grid under the target grid
+# (shape, georef), grown by margin cells of the source
+def source_extent(source_shape, source_georef, shape, georef, margin=Source_margin):
+    rows, cols = source_window(source_shape, source_georef, shape, georef, margin)
+    x0, dx, rx, y0, ry, dy = source_georef['geotransform']
+    return x0 + cols.start * dx, y0 + rows.stop * dy, x0 + cols.stop * dx, y0 + rows.start * dy
+
+# Key of a source grid and target grid (for the cache)
+def grid_key(source_shape, source_georef, shape, georef):
+    text = json.dumps([list(source_shape), list(source_georef['geotransform']), source_georef['projection'],
+                       list(shape), list(georef['geotransform']), georef['projection']])
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+# Reprojection index of a source grid to the target grid (shape, georef), computed once and cached in cache_folder:
+# int32 cell numbers (row x columns + column) of the source window, -1 where the cell center is outside the source.
+# Returns the path of the index (.npy) and the source window.
+def save_reprojection_index(source_shape, source_georef, shape, georef, cache_folder, tile_size=tile_size):
+    path = os.path.join(cache_folder, index_prefix + grid_key(source_shape, source_georef, shape, georef))
+    if os.path.isfile(path + ".npy") and os.path.isfile(path + ".json"):
+        with open(path + ".json") as f:
+            rows, cols = json.load(f)['window']
+        return path + ".npy", (slice(*rows), slice(*cols))
+    if not os.path.exists(cache_folder):
+        os.makedirs(cache_folder)
+    window = source_window(source_shape, source_georef, shape, georef)
+    (r0, r1), (c0, c1) = (window[0].start, window[0].stop), (window[1].start, window[1].stop)
+    if (r1 - r0) * (c1 - c0) >= 2 ** 31:
+        raise ValueError("The source window is too large for an int32 index")
+    index = np.lib.format.open_memmap(path + ".npy.part", mode='w+', dtype=np.int32, shape=tuple(shape))
+    for block in block_windows(shape, tile_size):
+        r, c = window_source_cells(block, source_georef, georef)
+        inside = (r >= r0) & (r < r1) & (c >= c0) & (c < c1)
+        index[block] = np.where(inside, (r - r0) * (c1 - c0) + (c - c0), -1)
+    index.flush()
+    index = None
+    os.replace(path + ".npy.part", path + ".npy")
+    with open(path + ".json", 'w') as f:
+        json.dump({'window': [[r0, r1], [c0, c1]], 'source_shape': list(source_shape), 'source_georef': source_georef,
+                   'shape': list(shape), 'georef': georef}, f)
+    return path + ".npy", window
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Resampling
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Resample a raster to the target grid with a reprojection index (nearest neighbor gather), tile by tile, reading only the
+# source cells under each tile, with NoData outside the boundary mask when there is one. Saves out_raster and returns it.
+def save_resampled(in_raster, out_raster, index_path, window, georef, mask=None, tile_size=tile_size):
+    index = np.load(index_path, mmap_mode='r')
+    ds, rb, nd = open_raster(in_raster)
+    (r0, r1), (c0, c1) = (window[0].start, window[0].stop), (window[1].start, window[1].stop)
+    mask = open_store(mask) if mask else None
+
+    def block(target):
+        cells = np.array(index[target], dtype=np.int64)
+        if mask is not None:
+            cells[np.asarray(mask.read(target)) == 0] = -1
+        out = np.full(cells.shape, np.nan)
+        valid = cells >= 0
+        if not valid.any():
+            return out
+        rows, cols = cells[valid] // (c1 - c0) + r0, cells[valid] % (c1 - c0) + c0
+        read = (slice(int(rows.min()), int(rows.max()) + 1), slice(int(cols.min()), int(cols.max()) + 1))
+        source = read_window(rb, nd, read)
+        out[valid] = np.asarray(source, dtype=np.float64)[rows - read[0].start, cols - read[1].start]
+        return out
+
+    BlockRaster(block, index.shape, georef, tile_size).save(out_raster)
+    ds = rb = None
+    return out_raster
+
+# Shape and georeference of a raster
+def raster_grid(in_raster):
+    ds, rb, nd = open_raster(in_raster)
+    grid = dataset_shape(ds), georef_of_dataset(ds)
+    ds = rb = None
+    return grid
+
+# Rectangle of Clip_management ("XMin YMin XMax YMax" in the coordinate system of the raster) of the window of a raster
+# under the target grid (shape, georef), grown by margin cells, so that only that window is projected.
+# The grid of the raster is read with arcpy when it is installed (national rasters in a file GDB), else with GDAL.
+def source_rectangle(in_raster, shape, georef, margin=Source_margin):
+    try:
+        import arcpy
+    except ImportError:
+        source_shape, source_georef = raster_grid(in_raster)
+    else:
+        ras = arcpy.Raster(in_raster)
+        source_shape = (ras.height, ras.width)
+        source_georef = {'geotransform': (ras.extent.XMin, ras.meanCellWidth, 0.0, ras.extent.YMax, 0.0, -ras.meanCellHeight),
+                         'projection': ras.spatialReference.exportToString().split(";")[0]}
+    return " ".join(str(value) for value in source_extent(source_shape, source_georef, shape, georef, margin))
+
+# Project the rasters of in_rasters to the target grid (shape, georef) and save them to out_rasters, clipped to the
+# boundary mask when there is one. The reprojection index is computed once per distinct source grid (cached in
+# cache_folder) and the rasters are resampled on workers processes. Returns out_rasters.
+def save_projected_rasters(in_rasters, out_rasters, shape, georef, cache_folder, mask=None, workers=Workers):
+    indexes = OrderedDict()
+    task_list = []
+    for Input, Output in zip(in_rasters, out_rasters):
+        source_shape, source_georef = raster_grid(Input)
+        key = grid_key(source_shape, source_georef, shape, georef)
+        if key not in indexes:
+            indexes[key] = save_reprojection_index(source_shape, source_georef, shape, georef, cache_folder)
+        task_list.append((Input, Output) + indexes[key] + (georef, mask))
+    run_tasks(save_resampled, task_list, workers)
+    return list(out_rasters)
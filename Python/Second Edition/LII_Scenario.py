@@ -0,0 +1,174 @@
+# Name: LII_Scenario.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Scoring scenarios: the Landscape Integrity Index with other impact scores (IP) of the resource and stressor
+#              layers and of the Important Plant Areas, without computing the distance decay again.
+#              The normalized distance decay surfaces (_EucDis_Log10_Null_nor) don't depend on the impact score, and are
+#              kept by LII_2_CompositeScoringSystem_v2.py (Scenario_cache = True). For every scenario of the impact score
+#              table (LII_ImpactScores.csv: Scenario, Layer, IP), only these steps are computed again:
+#               1. Con(nor & Null, nor * Null, ...) of every layer-year with its new IP (Null: IP on the burned source
+#                  cells of the _ras raster, -10 elsewhere), fused with the per-year Cell Statistics MINIMUM of the
+#                  resource, stressor and ecological integrity indicators (the IPA is one of them). Nothing is saved per layer.
+#               2. The per-year and all-year Cell Statistics MEAN (LII, eco, resource, stressor) and the 1km circle
+#                  Focal Statistics of the Moving Window Analysis.
+#              The landscape metrics don't depend on the impact scores and are read from LII_LandscapeMetrics.gdb.
+#              The outputs of each scenario go to a folder of their own, and the min, max and mean of the final rasters
+#              of every scenario are listed in LII_Scenarios.csv to compare them.
+# Warning:
+#          - Only for Backend = "numpy". The layers of a scenario that are not in the table keep the IP of the
+#          first scenario (baseline), so a scenario only needs the rows of the IP it changes.
+#          - A layer burned with different IP for different features can't be scored again with one IP.
+#          - The final rasters are clipped with the boundary mask of LII_3_MovingWindowAnalysis_v2.py (LII_Mask.py) when
+#          it is given, otherwise they keep the whole study area grid.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, io, csv
+import numpy as np
+from collections import OrderedDict
+from LII_MapAlgebra import BlockRaster, reduce_cells
+from LII_Store import saved_rasters
+from LII_Stats import read_stats
+from LII_Tiles import open_inputs, tile_size
+from LII_Distance import impact_block, nor_suffix
+from LII_Focal import FocalStatistics
+from LII_Mask import ExtractByMask
+from LII_Parallel import run_tasks, save_cell_statistics, Workers
+from LII_Pipeline import path_exists
+
+# Variables
+ImpactScores_csv = os.path.join(os.path.dirname(os.path.abspath(__file__)), "LII_ImpactScores.csv")
+Resource_list = ['noxweed', 'vTreatment']
+Stressor_list = ['ogwell', 'apd_pt', 'flowline', 'pipeline', 'powerline', 'road', 'frac_pond', 'well_pad']
+IPA_layer = "IPA"           # Layer of IPA2017 in the impact score table
+EcoYear_list = ['2001', '2008', '2010', '2012', '2014']
+Year_list = [str(year) for year in range(2001, 2019)]
+Neighborhood = "Circle 100 MAP"
+Summary_csv = "LII_Scenarios.csv"
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Impact score table
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Read the impact score table into {scenario: {layer: IP}} in the order of the table.
+# Layers missing from a scenario take the IP of the first scenario.
+def read_scenarios(path=ImpactScores_csv):
+    scenarios = OrderedDict()
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            scenarios.setdefault(row['Scenario'].strip(), {})[row['Layer'].strip()] = float(row['IP'])
+    baseline = next(iter(scenarios.values()), {})
+    for name, scores in scenarios.items():
+        scenarios[name] = dict(baseline, **scores)
+    return scenarios
+
+# Layer-years of a workspace with a kept decay surface: {year: [(layer, source raster)]}
+def layer_years(ws_RS, layer_list, year_list=Year_list):
+    out = OrderedDict()
+    for year in year_list:
+        sources = [(layer, os.path.join(ws_RS, layer + year + "_ras")) for layer in layer_list]
+        sources = [(layer, source) for layer, source in sources if path_exists(source + nor_suffix)]
+        if sources:
+            out[year] = sources
+    return out
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Impact of one layer block with a new IP: the source cells (not NoData) of the burned raster get ip.
+# With a nor block, the distance decay Con(nor & Null, nor * Null, ...) and SetNull of the scoring script;
+# without (IPA), SetNull(Null < 0, Null).
+def layer_impact(source, nor, ip):
+    scored = np.where(np.isnan(source), np.nan, float(ip))
+    if nor is None:
+        return np.where(scored < 0, np.nan, scored)
+    return impact_block(nor, scored)
+
+# Cell Statistics MINIMUM (DATA) of the layers scored again (layer_list: [source, nor or None, ip]) and of the rasters
+# that keep their values (fixed_rasters), block by block, saved to out_raster. Returns out_raster.
+def save_scenario_minimum(layer_list, fixed_rasters, out_raster):
+    paths = [path for source, nor, ip in layer_list for path in ((source, nor) if nor else (source,))] + list(fixed_rasters)
+    readers, shape, georef = open_inputs(paths)
+
+    def block(window):
+        values = iter([reader(window) for reader in readers])
+        arrays = [layer_impact(next(values), next(values) if nor else None, ip) for source, nor, ip in layer_list]
+        return reduce_cells(arrays + list(values), "MINIMUM", "DATA")
+
+    BlockRaster(block, shape, georef, tile_size).save(out_raster)
+    return out_raster
+
+# Focal Statistics MEAN (DATA) of in_raster, tile by tile, saved to out_raster, with NoData outside the boundary mask
+# when there is one (the tiles outside it are not computed). Returns out_raster.
+def save_focal_mean(in_raster, out_raster, neighborhood=Neighborhood, mask=None):
+    focal = FocalStatistics(in_raster, neighborhood, "MEAN", "DATA")
+    if mask:
+        focal = ExtractByMask(focal, mask)
+    focal.save(out_raster)
+    return out_raster
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Landscape Integrity Index of every scenario ({scenario: {layer: IP}}), from the decay surfaces of ws_RS, the ecological
+# integrity indicators of ws_Eco (_SetNull and IPA2017_SetNull) and the landscape metrics of ws_LM, saved to
+# out_folder/scenario and clipped with the boundary mask (LII_Mask.py) when there is one. Each step runs the tasks of all
+# scenarios on workers processes. Returns the path of the summary.
+def run_scenarios(scenarios, ws_Eco, ws_RS, ws_LM, out_folder, workers=Workers, mask=None):
+    resource_years = layer_years(ws_RS, Resource_list)
+    stressor_years = layer_years(ws_RS, Stressor_list)
+    eco_years = OrderedDict((year, [os.path.join(ws_Eco, name) for name in saved_rasters(ws_Eco, '*' + year + '*_SetNull')])
+                            for year in EcoYear_list)
+    IPA2017_SetNull = os.path.join(ws_Eco, "IPA2017_SetNull")
+    landscape_years = OrderedDict((year, os.path.join(ws_LM, "LandscapeMetrics" + year + "_CellStats")) for year in Year_list
+                                  if path_exists(os.path.join(ws_LM, "LandscapeMetrics" + year + "_CellStats")))
+
+    Minimum_tasks, YearMean_tasks, Mean_tasks, Focal_tasks = [], [], [], []
+    for name, scores in scenarios.items():
+        ws_Scenario = os.path.join(out_folder, name)
+        if not os.path.exists(ws_Scenario):
+            os.makedirs(ws_Scenario)
+        groups = OrderedDict([('eco', OrderedDict()), ('resource', OrderedDict()), ('stressor', OrderedDict())])
+        for group, Metrics, years in [('resource', "ResourceMetrics", resource_years), ('stressor', "StressorMetrics", stressor_years)]:
+            for year, sources in years.items():
+                layer_list = [(source, source + nor_suffix, scores[layer]) for layer, source in sources]
+                groups[group][year] = os.path.join(ws_Scenario, Metrics + year + "_CellStats")
+                Minimum_tasks.append((layer_list, [], groups[group][year]))
+        for year, eco_inputs in eco_years.items():
+            groups['eco'][year] = os.path.join(ws_Scenario, "EcoIndicator" + year + "_CellStats")
+            Minimum_tasks.append(([(IPA2017_SetNull, None, scores[IPA_layer])], eco_inputs, groups['eco'][year]))
+
+        LII_list = []
+        for year in Year_list:
+            LIIYear_list = [groups[group][year] for group in groups if year in groups[group]]
+            LIIYear_list += [landscape_years[year]] if year in landscape_years else []
+            if LIIYear_list:
+                LII_list.append(os.path.join(ws_Scenario, "LII" + year + "_CellStats"))
+                YearMean_tasks.append((LIIYear_list, LII_list[-1], "MEAN", "DATA"))
+        for group, Mean_list in [('LII', LII_list)] + [(group, list(groups[group].values())) for group in groups]:
+            if Mean_list:
+                Mean_tasks.append((Mean_list, os.path.join(ws_Scenario, group + "_CellStats"), "MEAN", "DATA"))
+                Focal_tasks.append((Mean_tasks[-1][1], os.path.join(ws_Scenario, group + "_FocalStats"), Neighborhood, mask))
+
+    run_tasks(save_scenario_minimum, Minimum_tasks, workers)
+    run_tasks(save_cell_statistics, YearMean_tasks, workers)
+    run_tasks(save_cell_statistics, Mean_tasks, workers)
+    run_tasks(save_focal_mean, Focal_tasks, workers)
+    return save_summary(scenarios, out_folder)
+
+# List the min, max and mean of the final rasters (_FocalStats) of every scenario in out_folder/LII_Scenarios.csv,
+# from their statistics sidecars. Returns the path of the summary.
+def save_summary(scenarios, out_folder):
+    path = os.path.join(out_folder, Summary_csv)
+    with io.open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Scenario', 'Raster', 'Minimum', 'Maximum', 'Mean'])
+        for name in scenarios:
+            for group in ['LII', 'eco', 'resource', 'stressor']:
+                stats = read_stats(os.path.join(out_folder, name, group + "_FocalStats"))
+                if stats is not None:
+                    writer.writerow([name, group + "_FocalStats", stats['minimum'], stats['maximum'], stats['mean']])
+    return path
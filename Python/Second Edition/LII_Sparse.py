@@ -0,0 +1,369 @@
+# Name: LII_Sparse.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Sparse raster for the layers that are almost all NoData (burned resource and stressor rasters such as
+#              well_pad2003_ras or frac_pond2012_ras, habitat rasters such as riparian2001), so that memory and work
+#              follow the cells with data instead of the size of the grid.
+#              The grid is split into tiles (the tiles of LII_Store.py), and a SparseRaster keeps only the tiles that
+#              are not all NoData (tile presence), each as:
+#               - a constant tile: every cell has the fill value (e.g. -10 after Con(IsNull(ras), -10, ras)).
+#               - a COO tile: the fill value plus the (cell number, value) pairs of the cells that differ from it.
+#               - a dense tile: all values, when more than sparse_fraction of the cells differ from the fill value.
+#              Map algebra on sparse rasters (sparse_apply, used by the functions of LII_MapAlgebra.py and the operators)
+#              runs tile by tile: a tile where every input is constant (absent tiles are constant NoData) is computed
+#              from one cell, and only the tiles with data are computed cell by cell.
+#              Saved sparse rasters keep the same tiles in path + ".sparse.npz".
+# Warning:
+#          - Only for cell-by-cell functions (map algebra, Cell Statistics); neighborhood operations read dense windows.
+#          - Values are float64 in memory and float32 on disk, like the other rasters of the NumPy backend.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, io, json
+import numpy as np
+from LII_Store import tile_size, tile_grid, tile_pieces, window_bounds, sparse_suffix, delete_store
+
+# Variables
+sparse_fraction = 0.25  # A tile with more than this fraction of cells different from its fill value is kept dense
+sparse_limit = 0.05     # save_raster writes a sparse raster when fewer than this fraction of the cells have data
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Sparse raster
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Raster of tiles: {(tile row, tile column): (fill, cell numbers or None, values)}, tiles not listed are all NoData.
+# A constant tile has an empty list of cells, a dense tile None and all its values.
+class SparseRaster(object):
+
+    ndim = 2
+    __array_ufunc__ = None      # Arithmetic with arrays and Rasters uses the operators below
+
+    def __init__(self, shape, georef=None, tiles=None, tile_size=tile_size):
+        self.shape = tuple(int(n) for n in shape)
+        self.georef = georef
+        self.tiles = tiles if tiles is not None else {}
+        self.tile_size = tile_size
+        self.grid = tile_grid(self.shape, tile_size)
+
+    @classmethod
+    def from_array(cls, array, georef=None, tile_size=tile_size):
+        array = np.asarray(array, dtype=np.float64)
+        out = cls(array.shape, georef if georef is not None else getattr(array, 'georef', None), tile_size=tile_size)
+        for key in out.keys():
+            out.set_tile(key, array[out.window(key)], np.nan)
+        return out
+
+    # All tile keys in row order
+    def keys(self):
+        return [(tr, tc) for tr in range(self.grid[0]) for tc in range(self.grid[1])]
+
+    # (row slice, column slice) of a tile
+    def window(self, key):
+        t = self.tile_size
+        return (slice(key[0] * t, min((key[0] + 1) * t, self.shape[0])), slice(key[1] * t, min((key[1] + 1) * t, self.shape[1])))
+
+    # Shape of a tile
+    def tile_shape(self, key):
+        rows, cols = self.window(key)
+        return (rows.stop - rows.start, cols.stop - cols.start)
+
+    # Fill value of a tile when it is constant (NaN for absent tiles), None when it has cells of its own
+    def constant(self, key):
+        tile = self.tiles.get(key)
+        if tile is None:
+            return np.nan
+        fill, index, values = tile
+        return fill if index is not None and not len(index) else None
+
+    # Values of a tile as a float64 array
+    def tile(self, key):
+        tile = self.tiles.get(key)
+        if tile is None:
+            return np.full(self.tile_shape(key), np.nan)
+        fill, index, values = tile
+        if index is None:
+            return values.reshape(self.tile_shape(key)).astype(np.float64)
+        out = np.full(self.tile_shape(key), fill)
+        out.ravel()[index] = values
+        return out
+
+    # Keep the values of a tile: constant, COO over fill or dense. All-NoData tiles are dropped.
+    def set_tile(self, key, block, fill=np.nan):
+        block = np.asarray(block, dtype=np.float64)
+        if not np.isnan(fill) and np.isnan(block).all():
+            fill = np.nan
+        same = np.isnan(block) if np.isnan(fill) else block == fill
+        index = np.flatnonzero(~same)
+        if not len(index) and np.isnan(fill):
+            self.tiles.pop(key, None)
+        elif len(index) > sparse_fraction * block.size:
+            self.tiles[key] = (np.nan, None, block.ravel().copy())
+        else:
+            self.tiles[key] = (float(fill), index.astype(np.int32), block.ravel()[index])
+
+    # Tiles that are not all NoData
+    def present(self):
+        return sorted(self.tiles)
+
+    # Read a (row slice, column slice) window, or the whole raster, as float64
+    def read(self, window=None):
+        rows, cols = window_bounds(window, self.shape)
+        out = np.empty((rows[1] - rows[0], cols[1] - cols[0]))
+        for (r0, r1, c0, c1), (tr, tc, tr0, tc0) in tile_pieces(rows, cols, self.tile_size):
+            out[r0 - rows[0]:r1 - rows[0], c0 - cols[0]:c1 - cols[0]] = self.tile((tr, tc))[r0 - tr0:r1 - tr0, c0 - tc0:c1 - tc0]
+        return out
+
+    def __getitem__(self, window):
+        return self.read(window)
+
+    # Yield (window, values) for every tile, in row order (same as BlockRaster)
+    def blocks(self):
+        for key in self.keys():
+            yield self.window(key), self.tile(key)
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.read()
+        return out if dtype is None else out.astype(dtype)
+
+    # Values of every tile with data, with the number of cells each value stands for
+    def weighted_values(self):
+        values_list, weight_list = [np.zeros(0)], [np.zeros(0)]
+        for key, (fill, index, values) in self.tiles.items():
+            values_list.append(values)
+            weight_list.append(np.ones(len(values)))
+            if index is not None:
+                values_list.append(np.array([fill]))
+                weight_list.append(np.array([float(np.prod(self.tile_shape(key)) - len(index))]))
+        values, weights = np.concatenate(values_list), np.concatenate(weight_list)
+        valid = ~np.isnan(values) & (weights > 0)
+        return values[valid], weights[valid]
+
+    @property
+    def minimum(self):
+        values, weights = self.weighted_values()
+        return float(values.min()) if len(values) else np.nan
+
+    @property
+    def maximum(self):
+        values, weights = self.weighted_values()
+        return float(values.max()) if len(values) else np.nan
+
+    @property
+    def mean(self):
+        values, weights = self.weighted_values()
+        return float((values * weights).sum() / weights.sum()) if len(values) else np.nan
+
+    def save(self, path):
+        return save_sparse(self, path)
+
+    # Operators, cell by cell with sparse_apply (NoData where any input is NoData)
+    def __add__(self, other):
+        return sparse_apply(lambda a, b: a + b, [self, other])
+
+    def __radd__(self, other):
+        return sparse_apply(lambda a, b: a + b, [other, self])
+
+    def __sub__(self, other):
+        return sparse_apply(lambda a, b: a - b, [self, other])
+
+    def __rsub__(self, other):
+        return sparse_apply(lambda a, b: a - b, [other, self])
+
+    def __mul__(self, other):
+        return sparse_apply(lambda a, b: a * b, [self, other])
+
+    def __rmul__(self, other):
+        return sparse_apply(lambda a, b: a * b, [other, self])
+
+    def __truediv__(self, other):
+        return sparse_apply(divide, [self, other])
+
+    def __rtruediv__(self, other):
+        return sparse_apply(divide, [other, self])
+
+    def __neg__(self):
+        return sparse_apply(lambda a: -a, [self])
+
+    def __lt__(self, other):
+        from LII_MapAlgebra import LessThan
+        return LessThan(self, other)
+
+    def __le__(self, other):
+        from LII_MapAlgebra import LessThanEqual
+        return LessThanEqual(self, other)
+
+    def __gt__(self, other):
+        from LII_MapAlgebra import GreaterThan
+        return GreaterThan(self, other)
+
+    def __ge__(self, other):
+        from LII_MapAlgebra import GreaterThanEqual
+        return GreaterThanEqual(self, other)
+
+    def __eq__(self, other):
+        from LII_MapAlgebra import EqualTo
+        return EqualTo(self, other)
+
+    def __ne__(self, other):
+        from LII_MapAlgebra import NotEqual
+        return NotEqual(self, other)
+
+    def __and__(self, other):
+        from LII_MapAlgebra import BooleanAnd
+        return BooleanAnd(self, other)
+
+    def __rand__(self, other):
+        from LII_MapAlgebra import BooleanAnd
+        return BooleanAnd(other, self)
+
+    def __or__(self, other):
+        from LII_MapAlgebra import BooleanOr
+        return BooleanOr(self, other)
+
+    def __ror__(self, other):
+        from LII_MapAlgebra import BooleanOr
+        return BooleanOr(other, self)
+
+    def __invert__(self):
+        from LII_MapAlgebra import BooleanNot
+        return BooleanNot(self)
+
+    __hash__ = None
+
+# Division with NoData for division by zero, as in Spatial Analyst
+def divide(a, b):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out = np.true_divide(a, b)
+    return np.where(np.isinf(out), np.nan, out)
+
+# True if fewer than sparse_limit of the cells of an array have data
+def is_sparse(array):
+    return np.count_nonzero(~np.isnan(array)) < sparse_limit * np.size(array)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Sparse map algebra
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Run a cell-by-cell function tile by tile over rasters (SparseRaster, arrays on the same grid) and constants.
+# Tiles where every raster is a SparseRaster with a constant tile are computed from one cell; the other tiles cell by cell.
+# Returns a SparseRaster.
+def sparse_apply(func, inputs):
+    sparse = [x for x in inputs if isinstance(x, SparseRaster)]
+    ref = sparse[0]
+    dense = [x for x in inputs if not isinstance(x, SparseRaster) and np.ndim(x) == 2]
+    for x in sparse + dense:
+        if tuple(np.shape(x)) != ref.shape:
+            raise ValueError("Inputs of sparse map algebra must be on the same grid")
+    georef = next((x.georef for x in inputs if getattr(x, 'georef', None)), None)
+    inputs = [x if isinstance(x, SparseRaster) or np.ndim(x) == 2 else np.asarray(x, dtype=np.float64) for x in inputs]
+    out = SparseRaster(ref.shape, georef, tile_size=ref.tile_size)
+    for key in ref.keys():
+        window = ref.window(key)
+        constants = [x.constant(key) if isinstance(x, SparseRaster) else None for x in inputs if np.ndim(x) == 2]
+        if not dense and all(c is not None for c in constants):
+            cell = [np.full((1, 1), x.constant(key)) if isinstance(x, SparseRaster) else x for x in inputs]
+            value = float(np.asarray(func(*cell), dtype=np.float64).ravel()[0])
+            if not np.isnan(value):
+                out.tiles[key] = (value, np.zeros(0, dtype=np.int32), np.zeros(0))
+            continue
+        blocks = [x.tile(key) if isinstance(x, SparseRaster) else (np.asarray(x[window], dtype=np.float64) if np.ndim(x) == 2 else x)
+                  for x in inputs]
+        result = np.broadcast_to(np.asarray(func(*blocks), dtype=np.float64), out.tile_shape(key))
+        out.set_tile(key, result, fill_value(result))
+    return out
+
+# Most common of NaN and the first value of a block, used as the fill value of a computed tile
+def fill_value(block):
+    nodata = np.count_nonzero(np.isnan(block))
+    first = block.flat[0]
+    if np.isnan(first) or nodata * 2 >= block.size:
+        return np.nan
+    return first if np.count_nonzero(block == first) > nodata else np.nan
+
+# Call a map algebra function on sparse rasters tile by tile: the SparseRaster and 2D array arguments (also inside a
+# list, as for CellStatistics) are replaced by the blocks of each tile. Returns a SparseRaster.
+def sparse_call(function, args, kwargs):
+    slots, inputs = [], []
+    for i, arg in enumerate(args):
+        if isinstance(arg, SparseRaster) or (isinstance(arg, np.ndarray) and arg.ndim == 2):
+            slots.append((i, None))
+            inputs.append(arg)
+        elif isinstance(arg, (list, tuple)):
+            for j, item in enumerate(arg):
+                if isinstance(item, SparseRaster) or (isinstance(item, np.ndarray) and item.ndim == 2):
+                    slots.append((i, j))
+                    inputs.append(item)
+
+    def func(*blocks):
+        call = [list(arg) if isinstance(arg, (list, tuple)) else arg for arg in args]
+        for (i, j), block in zip(slots, blocks):
+            if j is None:
+                call[i] = block
+            else:
+                call[i][j] = block
+        return np.asarray(function(*call, **kwargs), dtype=np.float64)
+
+    return sparse_apply(func, inputs)
+
+# True if an argument is a SparseRaster or a list holding one
+def has_sparse(arg):
+    if isinstance(arg, (list, tuple)):
+        return any(isinstance(item, SparseRaster) for item in arg)
+    return isinstance(arg, SparseRaster)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Saving and opening
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# True if path is saved as a sparse raster
+def sparse_exists(path):
+    return os.path.isfile(path + sparse_suffix)
+
+# Save a sparse raster to path + ".sparse.npz" (float32 values) with its statistics sidecar, in place of a tile store.
+# A path with an extension (.tif) or scratch_format = "tif" is written dense. Returns the path.
+def save_sparse(raster, path):
+    import LII_MapAlgebra
+    from LII_Stats import RasterStats, save_stats
+    if LII_MapAlgebra.scratch_format != "store" or os.path.splitext(path)[1]:
+        return LII_MapAlgebra.save_blocks(raster.blocks(), raster.shape, path, raster.georef)
+    path = os.path.abspath(path)
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    keys = raster.present()
+    tiles = [raster.tiles[key] for key in keys]
+    georef = raster.georef
+    if georef:
+        georef = {'geotransform': list(georef['geotransform']), 'projection': georef['projection']}
+    header = {'shape': raster.shape, 'tile_size': raster.tile_size, 'georef': georef}
+    stats = RasterStats()
+    for key, (fill, index, values) in zip(keys, tiles):
+        stats.add(values)
+        if index is not None and not np.isnan(fill):
+            stats.add(np.full(int(np.prod(raster.tile_shape(key))) - len(index), fill))
+    delete_store(path)
+    with open(path + sparse_suffix, 'wb') as f:
+        np.savez(f, header=np.array(json.dumps(header)),
+                 keys=np.array(keys, dtype=np.int32).reshape(-1, 2),
+                 fills=np.array([fill for fill, index, values in tiles], dtype=np.float64),
+                 dense=np.array([index is None for fill, index, values in tiles], dtype=bool),
+                 index_count=np.array([0 if index is None else len(index) for fill, index, values in tiles], dtype=np.int64),
+                 value_count=np.array([len(values) for fill, index, values in tiles], dtype=np.int64),
+                 index=np.concatenate([np.zeros(0, dtype=np.int32)] + [index for fill, index, values in tiles if index is not None]),
+                 values=np.concatenate([np.zeros(0, dtype=np.float32)] + [values.astype(np.float32) for fill, index, values in tiles]))
+    save_stats(path, stats)
+    return path
+
+# Open a sparse raster saved by save_sparse
+def open_sparse(path):
+    with np.load(path + sparse_suffix) as data:
+        header = json.loads(str(data['header']))
+        out = SparseRaster(header['shape'], header.get('georef'), tile_size=header['tile_size'])
+        index_end, value_end = np.cumsum(data['index_count']), np.cumsum(data['value_count'])
+        index_all, values_all = data['index'], data['values'].astype(np.float64)
+        for n, key in enumerate(data['keys']):
+            values = values_all[value_end[n] - data['value_count'][n]:value_end[n]]
+            index = None if data['dense'][n] else index_all[index_end[n] - data['index_count'][n]:index_end[n]]
+            out.tiles[(int(key[0]), int(key[1]))] = (float(data['fills'][n]), index, values)
+    return out
@@ -0,0 +1,132 @@
+# Name: LII_Stats.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Statistics of the rasters saved by the NumPy backend, gathered while the blocks are written, so the
+#              normalizations (ras - ras.minimum) / (ras.maximum - ras.minimum) of the _nor rasters (NLCD*_CAI_CV_nor,
+#              NLCD*_CORE_CV_nor, VDEP*_inv_nor, ...) don't need a pass over the raster to find its min and max.
+#              Each saved raster gets a sidecar (path + ".stats.json") with:
+#               - minimum, maximum, count (cells with data), sum and mean of the saved (float32) values.
+#               - histogram: counts of bins of the same width, from start. The width is a power of 2 and the bins
+#                 start on multiples of it, so the histogram of every block is merged into the same bins, and the
+#                 width doubles (merging pairs of bins) when the values need more than hist_bins bins.
+#              Raster(path).minimum, .maximum and .mean read the sidecar when it is there, and histogram_percentile gives
+#              the percentiles of the raster from the histogram.
+# Warning:
+#          - A sidecar older than its raster is not used (the raster was saved again by something else, e.g. arcpy).
+#          - The sidecar describes the raster on disk: a Raster changed in place after reading keeps the statistics
+#          of the file.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, io, json
+import numpy as np
+from LII_Store import store_exists, store_times, sparse_suffix
+
+# Variables
+stats_suffix = ".stats.json"
+hist_bins = 256     # Maximum number of bins of the histogram
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Statistics of a raster gathered block by block: add(block) for every block written (NaN as NoData)
+class RasterStats(object):
+
+    def __init__(self):
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.count = 0
+        self.sum = 0.0
+        self.width = None       # Width of the histogram bins (power of 2)
+        self.first = 0          # Bin number of the first bin: the bin of value v is floor(v / width)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    # Add the cells of a block with the values they get on disk (float32)
+    def add(self, block):
+        values = np.asarray(block, dtype=np.float32).astype(np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        low, high = values.min(), values.max()
+        self.minimum, self.maximum = min(self.minimum, low), max(self.maximum, high)
+        self.count += len(values)
+        self.sum += float(values.sum())
+        if self.width is None:
+            self.width = bin_width(high - low or abs(high) or 1.0)
+            self.first = int(np.floor(low / self.width))
+        self.rebin()
+        self.counts += np.bincount(np.floor(values / self.width).astype(np.int64) - self.first, minlength=len(self.counts))
+
+    # Grow the histogram to cover minimum - maximum, doubling the width until it fits in hist_bins bins
+    def rebin(self):
+        width = self.width
+        while np.floor(self.maximum / width) - np.floor(self.minimum / width) + 1 > hist_bins:
+            width *= 2
+        factor = int(round(width / self.width))
+        first = int(np.floor(self.minimum / width))
+        counts = np.zeros(int(np.floor(self.maximum / width)) - first + 1, dtype=np.int64)
+        if len(self.counts):
+            np.add.at(counts, (self.first + np.arange(len(self.counts))) // factor - first, self.counts)
+        self.width, self.first, self.counts = width, first, counts
+
+    def as_dict(self):
+        if not self.count:
+            return {'minimum': None, 'maximum': None, 'count': 0, 'sum': 0.0, 'mean': None, 'histogram': None}
+        return {'minimum': float(self.minimum), 'maximum': float(self.maximum), 'count': int(self.count),
+                'sum': self.sum, 'mean': self.sum / self.count,
+                'histogram': {'start': self.first * self.width, 'width': self.width, 'counts': self.counts.tolist()}}
+
+# q-th percentile (0 - 100) of a raster from its statistics (as_dict or read_stats): the bin holding that rank, linear
+# inside the bin, so within a bin width of the two saved values np.nanpercentile interpolates between. None for a raster
+# without data.
+def histogram_percentile(stats, q):
+    if not stats['count']:
+        return None
+    counts = np.asarray(stats['histogram']['counts'], dtype=np.float64)
+    rank = q / 100.0 * (stats['count'] - 1) + 0.5
+    cumulative = np.cumsum(counts)
+    i = min(int(np.searchsorted(cumulative, rank, side='right')), len(counts) - 1)
+    before = cumulative[i] - counts[i]
+    value = stats['histogram']['start'] + (i + (rank - before) / counts[i]) * stats['histogram']['width']
+    return float(min(max(value, stats['minimum']), stats['maximum']))
+
+# Smallest power of 2 that splits a range in at most hist_bins bins
+def bin_width(value_range):
+    return 2.0 ** int(np.ceil(np.log2(float(value_range) / hist_bins)))
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Sidecar
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Modification time of the data of a saved raster (tile store, sparse raster or file), None if there is none
+def data_time(path):
+    if store_exists(path):
+        return max(store_times(path))
+    if os.path.isfile(path + sparse_suffix):
+        return os.path.getmtime(path + sparse_suffix)
+    if os.path.isfile(path):
+        return os.path.getmtime(path)
+    return None
+
+# Save the statistics of a raster saved to path (as returned by create_raster) to its sidecar
+def save_stats(path, stats):
+    with io.open(path + stats_suffix, 'w', encoding='utf-8') as f:
+        f.write(u"" + json.dumps(stats.as_dict()))
+
+# Statistics of a saved raster (path, or path + ".tif") from its sidecar, None if there is no sidecar newer than the raster
+def read_stats(path):
+    for name in (path, path + ".tif"):
+        sidecar = name + stats_suffix
+        data = data_time(name)
+        if data is None:
+            continue
+        if os.path.isfile(sidecar) and os.path.getmtime(sidecar) >= data:
+            try:
+                with io.open(sidecar, encoding='utf-8') as f:
+                    return json.load(f)
+            except (IOError, ValueError):
+                return None
+        return None
+    return None
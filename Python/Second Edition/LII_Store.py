@@ -0,0 +1,195 @@
+# Name: LII_Store.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Chunked, memory-mapped raster store for the intermediate rasters of the NumPy backend
+#              (_ReclassifyIP, _EucDis, _Log10_Null_nor, _CellStats, ...), used in place of file GDB scratch rasters.
+#              A raster is saved as two files next to its path:
+#               - path + ".tiles": the cells in fixed-size tiles (tile_size x tile_size, tiles in row order, edge tiles
+#                 padded), so every tile is one contiguous piece of the file.
+#               - path + ".tiles.json": the header with the shape, tile size, data type, NoData (NaN) and the
+#                 georeference (geotransform and projection).
+#              Opening a raster reads the header and maps the tiles file, without decoding anything, and open rasters
+#              are kept (open_store), so reopening the same path is free. A tile, or a window inside one tile,
+#              is a view of the mapped file (no copy); other windows are assembled from the tiles they cross.
+# Warning:
+#          - NoData is NaN, as in LII_MapAlgebra.py. Data are float32 like the saved GeoTIFFs, or an integer type
+#          (e.g. uint8 habitat labels) with 0 as NoData (nodata of the header). read() gives the cells as stored; the
+#          readers of LII_MapAlgebra.py (read_window, Raster) and np.asarray() give NaN for the NoData of integer stores.
+#          - The tile size is the block size of LII_MapAlgebra.py, so the blocks of block_windows are tiles.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, json, fnmatch
+import numpy as np
+
+# Variables
+tile_size = 1024            # Rows and columns of a tile (same as block_size of LII_MapAlgebra.py)
+store_dtype = 'float32'     # Data type of the cells
+data_suffix = ".tiles"
+header_suffix = ".tiles.json"
+sparse_suffix = ".sparse.npz"   # Sparse raster of LII_Sparse.py saved in place of a tile store
+open_store_dict = {}        # Open rasters: {path: (modification times, TileStore)}
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Tile store
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Raster of a tile store. mode "r" maps the tiles read-only, "r+" for writing.
+class TileStore(object):
+
+    def __init__(self, path, mode="r"):
+        with open(path + header_suffix) as f:
+            header = json.load(f)
+        self.path = path
+        self.shape = tuple(header['shape'])
+        self.tile_size = int(header['tile_size'])
+        self.dtype = np.dtype(header['dtype'])
+        self.georef = header.get('georef')
+        self.nodata = None if self.dtype.kind == 'f' else header.get('nodata', 0)    # NoData of integer types (None: NaN)
+        self.grid = tile_grid(self.shape, self.tile_size)
+        self.tiles = np.memmap(path + data_suffix, dtype=self.dtype, mode=mode,
+                               shape=self.grid + (self.tile_size, self.tile_size))
+
+    # View of tile (tile row, tile column), trimmed to the raster
+    def tile(self, tr, tc):
+        rows, cols = self.shape
+        t = self.tile_size
+        return self.tiles[tr, tc, :min(t, rows - tr * t), :min(t, cols - tc * t)]
+
+    # Yield (window, view) for every tile, in row order
+    def blocks(self):
+        t = self.tile_size
+        for tr in range(self.grid[0]):
+            for tc in range(self.grid[1]):
+                view = self.tile(tr, tc)
+                yield (slice(tr * t, tr * t + view.shape[0]), slice(tc * t, tc * t + view.shape[1])), view
+
+    # Read a (row slice, column slice) window, or the whole raster.
+    # A window inside one tile is a view of the file, other windows are copied into a float64 array (same type for integers).
+    def read(self, window=None):
+        rows, cols = window_bounds(window, self.shape)
+        t = self.tile_size
+        if rows[0] // t == (rows[1] - 1) // t and cols[0] // t == (cols[1] - 1) // t:
+            tr, tc = rows[0] // t, cols[0] // t
+            return self.tiles[tr, tc, rows[0] - tr * t:rows[1] - tr * t, cols[0] - tc * t:cols[1] - tc * t]
+        out = np.empty((rows[1] - rows[0], cols[1] - cols[0]), dtype=np.float64 if self.dtype.kind == 'f' else self.dtype)
+        for (r0, r1, c0, c1), (tr, tc, tr0, tc0) in tile_pieces(rows, cols, t):
+            out[r0 - rows[0]:r1 - rows[0], c0 - cols[0]:c1 - cols[0]] = self.tiles[tr, tc, r0 - tr0:r1 - tr0, c0 - tc0:c1 - tc0]
+        return out
+
+    # Write a block of values (NaN as NoData) at a (row slice, column slice) window, or the whole raster
+    def write(self, array, window=None):
+        rows, cols = window_bounds(window, self.shape)
+        array = np.asarray(array)
+        for (r0, r1, c0, c1), (tr, tc, tr0, tc0) in tile_pieces(rows, cols, self.tile_size):
+            self.tiles[tr, tc, r0 - tr0:r1 - tr0, c0 - tc0:c1 - tc0] = array[r0 - rows[0]:r1 - rows[0], c0 - cols[0]:c1 - cols[0]]
+
+    def flush(self):
+        self.tiles.flush()
+
+    def __array__(self, dtype=None, copy=None):
+        out = np.array(nodata_to_nan(self.read(), self.nodata), dtype=np.float64)
+        return out if dtype is None else out.astype(dtype)
+
+# Cells of a block as float64 with the NoData value nodata as NaN (a copy; the block itself when nodata is None)
+def nodata_to_nan(block, nodata):
+    if nodata is None:
+        return block
+    out = np.array(block, dtype=np.float64)
+    out[out == nodata] = np.nan
+    return out
+
+# Number of tile rows and tile columns of a raster shape
+def tile_grid(shape, tile_size=tile_size):
+    return (-(-shape[0] // tile_size), -(-shape[1] // tile_size))
+
+# (start, stop) of the rows and of the columns of a window, or of the whole raster
+def window_bounds(window, shape):
+    if window is None:
+        return (0, shape[0]), (0, shape[1])
+    rows, cols = window
+    return (rows.start or 0, shape[0] if rows.stop is None else rows.stop), (cols.start or 0, shape[1] if cols.stop is None else cols.stop)
+
+# Pieces of a window cut by the tiles: ((r0, r1, c0, c1) of the piece, (tile row, tile column, first row, first column of the tile))
+def tile_pieces(rows, cols, tile_size):
+    pieces = []
+    for tr in range(rows[0] // tile_size, (rows[1] - 1) // tile_size + 1):
+        tr0 = tr * tile_size
+        for tc in range(cols[0] // tile_size, (cols[1] - 1) // tile_size + 1):
+            tc0 = tc * tile_size
+            pieces.append(((max(rows[0], tr0), min(rows[1], tr0 + tile_size), max(cols[0], tc0), min(cols[1], tc0 + tile_size)), (tr, tc, tr0, tc0)))
+    return pieces
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Opening and saving
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# True if path is saved as a tile store
+def store_exists(path):
+    return os.path.isfile(path + header_suffix) and os.path.isfile(path + data_suffix)
+
+# Modification times of the files of a tile store
+def store_times(path):
+    return os.path.getmtime(path + header_suffix), os.path.getmtime(path + data_suffix)
+
+# Open a tile store read-only. The same path is opened once and reused until its files change.
+def open_store(path):
+    path = os.path.abspath(path)
+    times = store_times(path)
+    cached = open_store_dict.get(path)
+    if cached is not None and cached[0] == times:
+        return cached[1]
+    store = TileStore(path)
+    open_store_dict[path] = (times, store)
+    return store
+
+# Create an empty tile store (all NoData: NaN, or 0 for integer types) of the given shape and return it open for writing
+def create_store(path, shape, georef=None, tile_size=tile_size, dtype=store_dtype):
+    path = os.path.abspath(path)
+    open_store_dict.pop(path, None)
+    if os.path.isfile(path + sparse_suffix):
+        os.remove(path + sparse_suffix)
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    shape = tuple(int(n) for n in shape)
+    if georef:
+        georef = {'geotransform': list(georef['geotransform']), 'projection': georef['projection']}
+    nodata = 'nan' if np.dtype(dtype).kind == 'f' else 0
+    header = {'shape': shape, 'tile_size': tile_size, 'dtype': np.dtype(dtype).name, 'nodata': nodata, 'georef': georef}
+    grid = tile_grid(shape, tile_size)
+    tiles = np.memmap(path + data_suffix, dtype=dtype, mode='w+', shape=grid + (tile_size, tile_size))
+    tiles[:] = float(nodata)
+    tiles.flush()
+    del tiles
+    with open(path + header_suffix, 'w') as f:
+        json.dump(header, f)
+    return TileStore(path, mode="r+")
+
+# Delete the files of a tile store (close the stores open on it first)
+def delete_store(path):
+    path = os.path.abspath(path)
+    open_store_dict.pop(path, None)
+    for name in (path + data_suffix, path + header_suffix):
+        if os.path.isfile(name):
+            os.remove(name)
+
+# Names of the rasters saved in a folder by the NumPy backend (tile store, sparse raster or .tif) that match pattern,
+# in place of arcpy.da.Walk, which doesn't see them
+def saved_rasters(folder, pattern="*"):
+    names = set()
+    if not os.path.isdir(folder):
+        return []
+    for filename in os.listdir(folder):
+        for suffix in (header_suffix, sparse_suffix, ".tif"):
+            if filename.endswith(suffix):
+                names.add(filename[:-len(suffix)])
+    return sorted(fnmatch.filter(names, pattern))
+
+# Save an array as a tile store. Returns the path.
+def save_store(array, path, georef=None, tile_size=tile_size, dtype=store_dtype):
+    store = create_store(path, np.shape(array), georef, tile_size, dtype)
+    store.write(array)
+    store.flush()
+    return path
@@ -0,0 +1,162 @@
+# Name: LII_Sweep.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Sensitivity sweep of the resource- and stressor-based metrics over the maximum distance of the distance
+#              decay (maxDistance) and the impact scores (LII_ImpactScores.csv), without a distance transform per setting.
+#               1. The distance field of every layer-year is computed once, at the largest maximum distance of the sweep
+#                  (batched and tile by tile as in LII_Distance.py), and kept as a float32 raster (source + "_EucDis_sweep"
+#                  + the maximum distance, e.g. road2010_ras_EucDis_sweep4000). It is computed again only when the
+#                  source raster is newer.
+#               2. The distance for a smaller maximum distance is the field with the cells beyond it set to NoData, which is
+#                  what EucDistance gives with that maximum distance. One pass over each field gives the min and max of its
+#                  Log 10 for every maximum distance of the sweep (the normalization of the decay).
+#               3. Every setting (maximum distance x impact score scenario) is a task for the worker processes: the decay of
+#                  the layer-years with their IP, the per-year Cell Statistics MINIMUM and the mean of all years
+#                  (resource_CellStats and stressor_CellStats of the Moving Window Analysis), block by block.
+#              The results are two float32 cubes (setting, row, column), out_cube + "_resource.npy" and "_stressor.npy",
+#              that every setting writes its own plane of, and out_cube + ".json" with the settings and the georeference.
+# Warning:
+#          - Only for Backend = "numpy". The cubes hold settings x rows x columns x 4 bytes each on disk
+#          (memory-mapped, a plane is 168 MB for the CFO at 30 m).
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, json
+import numpy as np
+from collections import OrderedDict
+from LII_MapAlgebra import reduce_cells, block_windows
+from LII_Store import create_store, open_store
+from LII_Tiles import open_inputs, halo_tiles, tile_size
+from LII_Distance import euc_distance_batch, max_cells, log10_null, decay_nor
+from LII_Scenario import layer_impact, Resource_list, Stressor_list, Year_list
+from LII_Parallel import run_tasks, Workers
+from LII_Pipeline import path_exists, path_time
+
+# Variables
+field_suffix = "_EucDis_sweep"  # Distance field at the largest maximum distance: source raster name + field_suffix + maximum distance
+Group_list = ['resource', 'stressor']
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Distance fields
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Path of the distance field of a source raster at maximum_distance
+def field_path(in_raster, maximum_distance):
+    return in_raster + field_suffix + "{:g}".format(float(maximum_distance))
+
+# Distance fields of all years of a resource or stressor (source rasters on disk) at maximum_distance, in one batched
+# distance transform tile by tile with a halo of the maximum distance. Fields newer than their source are kept.
+# Returns the paths of the fields.
+def save_distance_fields(in_rasters, maximum_distance, cell_size=30, tile_size=tile_size):
+    out_rasters = [field_path(Input, maximum_distance) for Input in in_rasters]
+    todo = [i for i, Input in enumerate(in_rasters) if path_time(out_rasters[i]) is None or path_time(out_rasters[i]) < path_time(Input)]
+    if not todo:
+        return out_rasters
+    readers, shape, georef = open_inputs([in_rasters[i] for i in todo])
+    field_list = [create_store(out_rasters[i], shape, georef) for i in todo]
+    for window, sources, inner in halo_tiles(readers, shape, max_cells(maximum_distance, cell_size), tile_size):
+        tile = euc_distance_batch(sources, maximum_distance, cell_size)[(slice(None),) + inner]
+        for field, distance in zip(field_list, tile):
+            field.write(distance, window)
+    for field in field_list:
+        field.flush()
+    return out_rasters
+
+# Min and max of the Log 10 (with NoData as -10) of a distance field truncated at each maximum distance, in one pass.
+# Returns [(min, max)] in the order of distance_list.
+def field_ranges(field, distance_list, tile_size=tile_size):
+    store = open_store(field)
+    low, high = [np.inf] * len(distance_list), [-np.inf] * len(distance_list)
+    for window in block_windows(store.shape, tile_size):
+        distance = np.asarray(store.read(window), dtype=np.float64)
+        for i, maximum_distance in enumerate(distance_list):
+            values = log10_null(truncate(distance, maximum_distance))
+            low[i], high[i] = min(low[i], values.min()), max(high[i], values.max())
+    return [(float(a), float(b)) for a, b in zip(low, high)]
+
+# Distance with the cells beyond maximum_distance set to NoData
+def truncate(distance, maximum_distance):
+    with np.errstate(invalid='ignore'):
+        return np.where(distance > float(maximum_distance), np.nan, distance)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Resource- and stressor-based metrics of one setting (plane of the cubes): for each group, the mean over the years of
+# the per-year Cell Statistics MINIMUM of the layers, decayed with distance_range (the min and max of field_ranges
+# for this maximum distance) and scored with scores ({layer: IP}).
+# group_years: {group: {year: [(layer, source raster)]}}, fields: {source raster: distance field}. Returns the plane number.
+def save_setting(out_cube, plane, group_years, fields, maximum_distance, scores, distance_range):
+    for group, years in group_years.items():
+        cube = np.load(out_cube + "_" + group + ".npy", mmap_mode='r+')
+        paths = [path for sources in years.values() for layer, source in sources for path in (source, fields[source])]
+        readers = iter(open_inputs(paths)[0])
+        year_readers = [[(layer, source, next(readers), next(readers)) for layer, source in sources] for sources in years.values()]
+        for window in block_windows(cube.shape[1:], tile_size):
+            total = count = None
+            for layers in year_readers:
+                arrays = [layer_impact(source_reader(window), decay_nor(truncate(field_reader(window), maximum_distance), *distance_range[source]),
+                                       scores[layer]) for layer, source, source_reader, field_reader in layers]
+                minimum = reduce_cells(arrays, "MINIMUM", "DATA")
+                if total is None:
+                    total, count = np.zeros(minimum.shape), np.zeros(minimum.shape, dtype=np.int32)
+                valid = ~np.isnan(minimum)
+                total[valid] += minimum[valid]
+                count += valid
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cube[plane][window] = np.where(count == 0, np.nan, total / count)
+        cube.flush()
+        cube = None
+    return plane
+
+# Sweep of every maximum distance of distance_list with every impact score scenario ({scenario: {layer: IP}}) over the
+# layer-years of ws_RS, saved to the cubes of out_cube. Returns the settings [{'scenario', 'maximum_distance'}] in the
+# order of the planes.
+def run_sweep(ws_RS, distance_list, scenarios, out_cube, cell_size=30, workers=Workers):
+    distance_list = sorted(float(distance) for distance in distance_list)
+    group_years = OrderedDict()
+    for group, layer_list in zip(Group_list, [Resource_list, Stressor_list]):
+        group_years[group] = OrderedDict()
+        for year in Year_list:
+            sources = [(layer, os.path.join(ws_RS, layer + year + "_ras")) for layer in layer_list]
+            sources = [(layer, source) for layer, source in sources if path_exists(source)]
+            if sources:
+                group_years[group][year] = sources
+    layer_sources = OrderedDict()
+    for years in group_years.values():
+        for sources in years.values():
+            for layer, source in sources:
+                layer_sources.setdefault(layer, []).append(source)
+
+    # Distance fields at the largest maximum distance (one task per resource or stressor), then their ranges
+    source_list = [source for sources in layer_sources.values() for source in sources]
+    if not source_list:
+        raise ValueError("No resource or stressor raster (_ras) in " + ws_RS)
+    run_tasks(save_distance_fields, [(sources, distance_list[-1], cell_size) for sources in layer_sources.values()], workers)
+    fields = dict((source, field_path(source, distance_list[-1])) for source in source_list)
+    ranges = run_tasks(field_ranges, [(fields[source], distance_list) for source in source_list], workers)
+
+    # Cubes and settings, one task per setting
+    shape, georef = open_inputs([source_list[0]])[1:]
+    if os.path.dirname(out_cube) and not os.path.exists(os.path.dirname(out_cube)):
+        os.makedirs(os.path.dirname(out_cube))
+    settings = [{'scenario': name, 'maximum_distance': distance} for distance in distance_list for name in scenarios]
+    for group in Group_list:
+        np.lib.format.open_memmap(out_cube + "_" + group + ".npy", mode='w+', dtype=np.float32, shape=(len(settings),) + tuple(shape))[:] = np.nan
+    setting_tasks = []
+    for plane, setting in enumerate(settings):
+        i = distance_list.index(setting['maximum_distance'])
+        distance_range = dict((source, source_range[i]) for source, source_range in zip(source_list, ranges))
+        setting_tasks.append((out_cube, plane, group_years, fields, setting['maximum_distance'], scenarios[setting['scenario']], distance_range))
+    run_tasks(save_setting, setting_tasks, workers)
+    with open(out_cube + ".json", 'w') as f:
+        json.dump({'settings': settings, 'groups': Group_list, 'shape': list(shape), 'georef': georef}, f, indent=2)
+    return settings
+
+# Open the cube of a group (memory-mapped, read-only) and the settings of its planes
+def read_sweep(out_cube, group):
+    with open(out_cube + ".json") as f:
+        index = json.load(f)
+    return np.load(out_cube + "_" + group + ".npy", mmap_mode='r'), index['settings']
@@ -0,0 +1,69 @@
+# Name: LII_Tiles.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy
+# Description: Tiled execution of the neighborhood operations of the NumPy backend (Focal Statistics, Euclidean distance),
+#              so the study area is not limited by the memory needed for whole rasters.
+#              The grid is split into tiles (block_windows) and each tile is computed on its own:
+#               1. The tile is read with a halo of cells on every side (clipped to the raster), as wide as the reach of
+#                  the operation: the radius of the focal neighborhood, or the maximum distance of Euclidean distance.
+#               2. The operation runs on the tile with its halo, and only the tile is kept.
+#              Every cell the operation looks at for a cell of the tile is inside the halo, and the raster edges are the
+#              same as for the whole raster, so the stitched tiles are the same as the whole-raster result (no seams).
+#              Memory is a few tiles with their halos, whatever the size of the raster.
+# Warning:
+#          - Operations without a bounded reach (Euclidean distance with no maximum distance) can't be tiled.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import numpy as np
+from LII_MapAlgebra import BlockRaster, open_raster, read_window, dataset_shape, georef_of_dataset, block_windows, block_size
+
+# Variables
+tile_size = block_size      # Rows and columns of a tile, without the halo
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Tiles with halo
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Window of a tile grown by halo cells on every side (clipped to the raster), and the tile inside that window
+def halo_window(window, halo, shape):
+    rows, cols = window
+    r0, r1 = max(rows.start - halo, 0), min(rows.stop + halo, shape[0])
+    c0, c1 = max(cols.start - halo, 0), min(cols.stop + halo, shape[1])
+    return (slice(r0, r1), slice(c0, c1)), (slice(rows.start - r0, rows.stop - r0), slice(cols.start - c0, cols.stop - c0))
+
+# Reader of windows of a raster path (opened once) or array, with its shape and georeference.
+# The reader returns a float64 array with NoData as NaN.
+def window_reader(in_raster):
+    if isinstance(in_raster, str):
+        ds, rb, nd = open_raster(in_raster)
+        return (lambda window, ds=ds: np.asarray(read_window(rb, nd, window), dtype=np.float64)), dataset_shape(ds), georef_of_dataset(ds)
+    return (lambda window: np.asarray(in_raster[window], dtype=np.float64)), np.shape(in_raster), getattr(in_raster, 'georef', None)
+
+# Open the inputs of a tiled operation (paths or arrays on the same grid). Returns the readers, shape and georeference.
+def open_inputs(in_rasters):
+    readers = [window_reader(ras) for ras in in_rasters]
+    shape = readers[0][1]
+    for ras, (reader, other, georef) in zip(in_rasters, readers):
+        if tuple(other) != tuple(shape):
+            raise ValueError("Inputs of a tiled operation must be on the same grid: " + str(ras))
+    georef = next((georef for reader, other, georef in readers if georef), None)
+    return [reader for reader, other, georef in readers], tuple(shape), georef
+
+# Yield (tile window, tile with halo of every input, tile inside the halo window) for every tile
+def halo_tiles(readers, shape, halo, tile_size=tile_size):
+    for window in block_windows(shape, tile_size):
+        read, inner = halo_window(window, halo, shape)
+        yield window, [reader(read) for reader in readers], inner
+
+# Raster of func (cell values of a tile with halo of every input -> same-shape values) computed tile by tile.
+# Saving it computes and writes one tile at a time; np.asarray() assembles the whole raster.
+def halo_raster(func, in_rasters, halo, tile_size=tile_size):
+    readers, shape, georef = open_inputs(in_rasters)
+
+    def block(window):
+        read, inner = halo_window(window, halo, shape)
+        return func(*[reader(read) for reader in readers])[inner]
+
+    return BlockRaster(block, shape, georef, tile_size)
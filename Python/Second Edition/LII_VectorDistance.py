@@ -0,0 +1,172 @@
+# Name: LII_VectorDistance.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3, NumPy, ArcMap 10.7 or ArcGIS Pro (arcpy, only for reading feature classes)
+# Description: Distance decay of the resource- and stressor-based metrics from the features themselves, for the
+#              layer-years with few features (e.g. ogwell and apd_pt wells, APD lines), in place of the Euclidean
+#              distance transform of the whole grid (LII_Distance.py):
+#               1. The features are split into points and segments (polylines, polygon rings) in cell coordinates.
+#               2. Grid hash: every point and segment is listed in the tiles its box of cells within the maximum
+#                  distance overlaps. Tiles with no element are skipped (all NoData).
+#               3. In the other tiles, each element gives the exact distance from the cell centers to the point or
+#                  segment, only on its box of cells within the maximum distance.
+#              The cost is proportional to the number of features instead of the size of the grid. A layer-year is
+#              computed this way when the boxes of its elements cover fewer cells than sparse_ratio times the grid,
+#              otherwise save_vector_decay leaves it to the distance transform.
+#              The distances go through the same fused distance decay as LII_Distance.py (decay_block), kept in
+#              the float32 output raster between the two passes (no scratch distance raster), and the
+#              nor surface kept with keep_nor is a sparse raster (LII_Sparse.py): constant outside the tiles with elements.
+# Warning:
+#          - Distances are measured to the geometry of the features, not to the centers of the source cells as in
+#          EucDistance, so cells near a line or polygon edge are up to half a cell diagonal (21 m) closer.
+#          Source cells (the burned _ras cells) stay at distance 0.
+#          - The grid is assumed to have square cells of cell_size.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import numpy as np
+from LII_MapAlgebra import create_raster, read_window, write_window, close_raster, nodata_value
+from LII_Stats import RasterStats, save_stats
+from LII_Tiles import open_inputs, tile_size
+from LII_Rasterize import map_to_cells
+from LII_Distance import log10_null, decay_nor, impact_block, nor_suffix, null_value
+from LII_Sparse import SparseRaster
+
+# Variables
+sparse_ratio = 4.0      # Sparse layer-year: cells in the boxes of its elements < sparse_ratio x cells of the grid
+                        # (a box cell costs about a fifth of a grid cell of the distance transform, 1000 x 1000 grid)
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Elements
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Points ((n, 2) array) and segments ((m, 4) array of row, column of both ends) in cell coordinates of the features
+# (kind, parts in map coordinates, value). Features with no value are skipped, as when they are burned.
+def feature_elements(features, georef):
+    point_list, segment_list = [np.zeros((0, 2))], [np.zeros((0, 4))]
+    for kind, parts, value in features:
+        if value is None:
+            continue
+        for part in parts:
+            cells = map_to_cells(part, georef)
+            if kind in ("point", "multipoint") or len(cells) == 1:
+                point_list.append(cells)
+                continue
+            if kind == "polygon":
+                cells = np.vstack([cells, cells[:1]])
+            segment_list.append(np.hstack([cells[:-1], cells[1:]]))
+    return np.vstack(point_list), np.vstack(segment_list)
+
+# Box of the cells (first row, last row, first column, last column) whose center can be within cap cells of each element
+def element_boxes(points, segments, cap):
+    lo = np.vstack([points, np.minimum(segments[:, :2], segments[:, 2:])])
+    hi = np.vstack([points, np.maximum(segments[:, :2], segments[:, 2:])])
+    first = np.ceil(lo - cap - 0.5).astype(np.int64)
+    last = np.floor(hi + cap - 0.5).astype(np.int64)
+    return np.column_stack([first[:, 0], last[:, 0], first[:, 1], last[:, 1]])
+
+# Cells of the grid in the boxes of the elements (the cost of the vector distance)
+def box_cells(boxes, shape):
+    rows = np.clip(boxes[:, 1], -1, shape[0] - 1) - np.clip(boxes[:, 0], 0, shape[0]) + 1
+    cols = np.clip(boxes[:, 3], -1, shape[1] - 1) - np.clip(boxes[:, 2], 0, shape[1]) + 1
+    return int((np.maximum(rows, 0) * np.maximum(cols, 0)).sum())
+
+# Grid hash: {(tile row, tile column): element numbers} of the tiles each box overlaps
+def tile_index(boxes, shape, tile_size=tile_size):
+    index = {}
+    for element, (r0, r1, c0, c1) in enumerate(boxes):
+        r0, r1, c0, c1 = max(r0, 0), min(r1, shape[0] - 1), max(c0, 0), min(c1, shape[1] - 1)
+        if r0 > r1 or c0 > c1:
+            continue
+        for tr in range(r0 // tile_size, r1 // tile_size + 1):
+            for tc in range(c0 // tile_size, c1 // tile_size + 1):
+                index.setdefault((tr, tc), []).append(element)
+    return index
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Distance
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Squared distance in cells from the cell centers of a window to the nearest of the elements (inf beyond their boxes)
+def window_distance(window, elements, points, segments, boxes):
+    rows, cols = window
+    d2 = np.full((rows.stop - rows.start, cols.stop - cols.start), np.inf)
+    for element in elements:
+        r0, r1, c0, c1 = boxes[element]
+        r0, r1, c0, c1 = max(r0, rows.start), min(r1 + 1, rows.stop), max(c0, cols.start), min(c1 + 1, cols.stop)
+        if r0 >= r1 or c0 >= c1:
+            continue
+        y = np.arange(r0, r1)[:, np.newaxis] + 0.5
+        x = np.arange(c0, c1)[np.newaxis, :] + 0.5
+        if element < len(points):
+            py, px = points[element]
+            d = (y - py) ** 2 + (x - px) ** 2
+        else:
+            ay, ax, by, bx = segments[element - len(points)]
+            dy, dx = by - ay, bx - ax
+            t = np.clip(((y - ay) * dy + (x - ax) * dx) / max(dy * dy + dx * dx, 1e-300), 0.0, 1.0)
+            d = (y - ay - t * dy) ** 2 + (x - ax - t * dx) ** 2
+        sub = d2[r0 - rows.start:r1 - rows.start, c0 - cols.start:c1 - cols.start]
+        np.minimum(sub, d, out=sub)
+    return d2
+
+# Yield (window, distance in map units with NaN beyond maximum_distance) for every tile with elements near it
+def vector_distance_tiles(points, segments, shape, maximum_distance, cell_size=30, tile_size=tile_size):
+    boxes = element_boxes(points, segments, float(maximum_distance) / cell_size)
+    for (tr, tc), elements in sorted(tile_index(boxes, shape, tile_size).items()):
+        window = (slice(tr * tile_size, min((tr + 1) * tile_size, shape[0])), slice(tc * tile_size, min((tc + 1) * tile_size, shape[1])))
+        distance = np.sqrt(window_distance(window, elements, points, segments, boxes)) * float(cell_size)
+        distance[distance > float(maximum_distance)] = np.nan
+        yield window, distance
+
+# ---------------------------------------------------------------------------------------------------------------------------
+# Distance decay
+# ---------------------------------------------------------------------------------------------------------------------------
+
+# Fused distance decay of one layer-year from its features (kind, parts, value) and its source raster (in_raster, the
+# burned _ras raster with IP on the sources), saved to out_raster with its statistics sidecar. Tiles without elements
+# are left NoData. With sparse_only=True nothing is done and None is returned when the layer-year is not sparse.
+# keep_nor=True also saves the nor surface to in_raster + "_EucDis_Log10_Null_nor". Returns out_raster.
+def save_vector_decay(features, in_raster, out_raster, maximum_distance, cell_size=30, sparse_only=False, tile_size=tile_size, keep_nor=False):
+    (reader,), shape, georef = open_inputs([in_raster])
+    points, segments = feature_elements(features, georef)
+    cap = float(maximum_distance) / cell_size
+    if sparse_only and box_cells(element_boxes(points, segments, cap), shape) >= sparse_ratio * shape[0] * shape[1]:
+        return None
+
+    # First pass: distance of the tiles with elements (0 on the source cells), written to the output raster, and the
+    # min and max of its Log 10 as written (float32). The skipped tiles are NoData, which is -10 in Log 10.
+    ds, rb, path = create_raster(out_raster, shape, georef)
+    window_list = []
+    low, high = np.inf, -np.inf
+    for window, distance in vector_distance_tiles(points, segments, shape, maximum_distance, cell_size, tile_size):
+        distance[~np.isnan(reader(window))] = 0.0
+        distance = distance.astype(np.float32).astype(np.float64)
+        write_window(rb, distance, window)
+        window_list.append(window)
+        values = log10_null(distance)
+        low, high = min(low, values.min()), max(high, values.max())
+    if len(window_list) < np.prod([-(-n // tile_size) for n in shape]):
+        low, high = min(low, null_value), max(high, null_value)
+
+    # Second pass: final values of the tiles with elements, in place of their distance. The other tiles of the nor
+    # surface are constant.
+    stats = RasterStats()
+    nor_skipped = float(decay_nor(np.full((1, 1), np.nan), low, high)[0, 0])
+    nor_raster = SparseRaster(shape, georef, tile_size=tile_size) if keep_nor else None
+    if keep_nor:
+        for key in nor_raster.keys():
+            nor_raster.set_tile(key, np.full(nor_raster.tile_shape(key), nor_skipped), nor_skipped)
+    for window in window_list:
+        nor = decay_nor(read_window(rb, nodata_value, window), low, high)
+        block = impact_block(nor, reader(window))
+        write_window(rb, block, window)
+        stats.add(block)
+        if keep_nor:
+            nor_raster.set_tile((window[0].start // tile_size, window[1].start // tile_size), nor, nor_skipped)
+    close_raster(rb)
+    save_stats(path, stats)
+    if keep_nor:
+        nor_raster.save(in_raster + nor_suffix)
+    ds = rb = None
+    return out_raster
@@ -0,0 +1,22 @@
+# Name: conftest.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Shared setup of the checks of the NumPy backend: the modules of the scripts folder are importable,
+#              and each check gets a temporary folder for its rasters (tests/synthetic.py writes the synthetic data).
+# Warning: SciPy, GDAL and arcpy are not needed; reference results are computed by brute force or known values.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, sys
+
+import pytest
+
+Script_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if Script_folder not in sys.path:
+    sys.path.insert(0, Script_folder)
+
+# Temporary folder for the rasters of a check
+@pytest.fixture
+def workspace(tmp_path):
+    return str(tmp_path)
@@ -0,0 +1,82 @@
+# Name: synthetic.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend)
+# Description: Small synthetic rasters and feature classes for the checks of the NumPy backend, on a grid of 30 m cells.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, json
+
+import numpy as np
+
+from LII_MapAlgebra import Raster
+from LII_Store import save_store
+
+# Variables
+Script_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+cell_size = 30
+Extent = (0.0, 0.0, 300.0, 240.0)     # XMin, YMin, XMax, YMax of the synthetic grid: 8 rows, 10 columns
+georef = {'geotransform': (Extent[0], cell_size, 0.0, Extent[3], 0.0, -cell_size), 'projection': ""}
+shape = (8, 10)
+EVT_dict = {'2001': (2016, 76), '2008': (2016, 76), '2010': (3016, 3132), '2012': (3016, 3132), '2014': (3016, 3132)}  # conifer, grassland codes
+NLCD_list = ['2001', '2004', '2006', '2008', '2011', '2013', '2016']
+
+# Save a GeoJSON feature class (geometries: list of GeoJSON geometries) as workspace/name.geojson. Returns its path.
+def save_geojson(workspace, name, geometries):
+    path = os.path.join(workspace, name)
+    with open(path + ".geojson", "w") as f:
+        json.dump({'type': "FeatureCollection",
+                   'features': [{'type': "Feature", 'properties': {}, 'geometry': geometry} for geometry in geometries]}, f)
+    return path
+
+# True if point (x, y) is inside the ring (list of vertices, even-odd rule)
+def point_in_ring(x, y, ring):
+    inside = False
+    for (x0, y0), (x1, y1) in zip(ring, ring[1:] + ring[:1]):
+        if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+    return inside
+
+# Distance in map units from every cell center to the nearest source cell center (cells with data), one cell at a time,
+# NoData beyond maximum_distance
+def brute_force_distance(source, maximum_distance=None, cell_size=cell_size):
+    sr, sc = np.nonzero(~np.isnan(source))
+    out = np.full(np.shape(source), np.nan)
+    for row in range(out.shape[0]):
+        for col in range(out.shape[1]):
+            if len(sr):
+                out[row, col] = np.sqrt(np.min((sr - row) ** 2 + (sc - col) ** 2)) * cell_size
+    if maximum_distance is not None:
+        out[out > maximum_distance] = np.nan
+    return out
+
+# Save an array as a tile store of the synthetic grid
+def save_grid(array, path, dtype='float32'):
+    return save_store(np.asarray(array), path, georef, dtype=dtype)
+
+# Read a raster saved by the NumPy backend (tile store, sparse raster) as a float64 array with NoData as NaN
+def read_grid(path):
+    return np.asarray(Raster(path), dtype=np.float64)
+
+# Synthetic LII_Data.gdb: EVT and habitat labels, VDEP, NLCD, grassland patch size and connectivity, boundary, IPA2017,
+# and one point of noxweed and one line of road in their first year
+def make_workspace(folder):
+    ws = os.path.join(folder, "LII_Data.gdb")
+    os.makedirs(ws)
+    columns = np.arange(shape[1])[np.newaxis, :].repeat(shape[0], axis=0)
+    for year, (conifer, grassland) in EVT_dict.items():
+        save_grid(np.where(columns < 5, conifer, grassland), os.path.join(ws, "EVT" + year))
+        save_grid(np.where(columns < 5, 1, 3), os.path.join(ws, "EVT" + year + "_habitat"), dtype='uint8')
+    for year in ['2001', '2008', '2012', '2014']:
+        save_grid(np.arange(shape[0] * shape[1]).reshape(shape) % 7, os.path.join(ws, "VDEP" + year))
+    for year in NLCD_list:
+        save_grid(np.where(columns < 5, 41, 71), os.path.join(ws, "NLCD" + year))
+    save_grid(np.where(columns < 5, 100.0, 20000.0), os.path.join(ws, "grassland2001_Acres"))
+    save_grid(np.where(columns < 5, 5000.0, 1000.0), os.path.join(ws, "grassland2001_connectivity"))
+    xmin, ymin, xmax, ymax = Extent
+    save_geojson(ws, "boundary", [{'type': "Polygon", 'coordinates': [[[xmin, ymin], [xmax, ymin], [xmax, ymax], [xmin, ymax], [xmin, ymin]]]}])
+    save_geojson(ws, "IPA2017", [{'type': "Polygon", 'coordinates': [[[0, 0], [90, 0], [90, 60], [0, 60], [0, 0]]]}])
+    save_geojson(ws, "noxweed2002", [{'type': "Point", 'coordinates': [255, 195]}])
+    save_geojson(ws, "road2005", [{'type': "LineString", 'coordinates': [[15, 105], [285, 105]]}])
+    return ws
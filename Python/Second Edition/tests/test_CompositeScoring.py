@@ -0,0 +1,53 @@
+# Name: test_CompositeScoring.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: End-to-end check of LII_2_CompositeScoringSystem_v2.py with Backend = "numpy" on a tiny synthetic workspace
+#              (tile stores and .geojson feature classes, no arcpy): every CellStats output is written and holds the
+#              minimum of its inputs.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+import pytest
+
+from .synthetic import Script_folder, Extent, shape, EVT_dict, NLCD_list, make_workspace, read_grid
+from LII_Pipeline import Stage, run_stage
+from LII_Scenario import read_scenarios
+
+# Vector_distance = True computes the decay of the layer-years from their features
+@pytest.mark.parametrize('vector_distance', [False, True])
+def test_numpy_backend(workspace, capsys, vector_distance):
+    make_workspace(workspace)
+    script = os.path.join(Script_folder, "LII_2_CompositeScoringSystem_v2.py")
+    run_stage(Stage("score", script, parameters={'Workspace_Folder': workspace, 'Backend': "numpy", 'Workers': 1,
+                                                 'Scenario_cache': False, 'Vector_distance': vector_distance,
+                                                 'Study_Extent': Extent}))
+    assert "PYTHON ERRORS" not in capsys.readouterr().out
+
+    ws_Eco = os.path.join(workspace, "LII_Eco.gdb")
+    ws_RS = os.path.join(workspace, "LII_ResourceStress.gdb")
+    ws_LM = os.path.join(workspace, "LII_LandscapeMetrics.gdb")
+
+    # IPA2017 burns the IP of its layer on its cells, which are the minimum of every year
+    ip = read_scenarios()['baseline']
+    IPA = read_grid(os.path.join(ws_Eco, "IPA2017_SetNull"))
+    assert np.nansum(IPA > 0) == 6 and np.nanmax(IPA) == ip['IPA']
+    for year in EVT_dict:
+        Eco = read_grid(os.path.join(ws_Eco, "EcoIndicator" + year + "_CellStats"))
+        assert Eco.shape == shape
+        assert np.all(Eco[~np.isnan(IPA)] <= ip['IPA'])
+
+    # The decay of each layer-year was written from the rasterized features, and its CellStats is their minimum
+    for layer, year, Metrics in [('noxweed', '2002', "ResourceMetrics"), ('road', '2005', "StressorMetrics")]:
+        decay = read_grid(os.path.join(ws_RS, layer + year + "_Log10IP_Null_SetNull"))
+        CellStats = read_grid(os.path.join(ws_RS, Metrics + year + "_CellStats"))
+        assert not np.all(np.isnan(decay))
+        np.testing.assert_allclose(CellStats, decay)
+        assert np.nanmax(decay) <= ip[layer] + 1e-6
+
+    for year in NLCD_list:
+        LM = read_grid(os.path.join(ws_LM, "LandscapeMetrics" + year + "_CellStats"))
+        assert LM.shape == shape and not np.all(np.isnan(LM))
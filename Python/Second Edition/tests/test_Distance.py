@@ -0,0 +1,41 @@
+# Name: test_Distance.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the Euclidean distance transform (LII_Distance.py) against the distance to every source cell,
+#              with and without a maximum distance, and of the distance decay run tile by tile with a halo
+#              (save_distance_decay_tiles) against the same decay on the whole raster.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import save_grid, read_grid, brute_force_distance
+from LII_Distance import euc_distance_batch, EucDistance, distance_decay, save_distance_decay_tiles
+
+# Random source raster: the value on a fraction of the cells, NoData elsewhere
+def source_array(shape, seed, fraction=0.03, value=0.4):
+    rng = np.random.RandomState(seed)
+    return np.where(rng.uniform(0, 1, shape) < fraction, value, np.nan)
+
+def test_euc_distance():
+    sources = [source_array((23, 31), seed) for seed in range(3)]
+    sources.append(np.full((23, 31), np.nan))
+    batch = euc_distance_batch(sources, 150, 30)
+    for source, distance in zip(sources, batch):
+        np.testing.assert_allclose(distance, brute_force_distance(source, 150), equal_nan=True)
+    np.testing.assert_allclose(EucDistance(sources[0]), brute_force_distance(sources[0]), equal_nan=True)
+
+def test_distance_decay_tiles(workspace):
+    shape = (40, 37)
+    sources = [source_array(shape, seed) for seed in (5, 6)]
+    in_rasters = [save_grid(source, os.path.join(workspace, "road" + year + "_ras")) for source, year in zip(sources, ["2001", "2002"])]
+    out_rasters = [Input + "_Log10IP_Null_SetNull" for Input in in_rasters]
+    # Tiles of 16 cells with a halo of 5 cells (150 m), so most sources reach across a seam
+    save_distance_decay_tiles(in_rasters, out_rasters, 150, 30, tile_size=16)
+    for source, OutputName in zip(sources, out_rasters):
+        source = np.asarray(source, dtype=np.float32).astype(np.float64)
+        expected = distance_decay(brute_force_distance(source, 150), source)
+        np.testing.assert_allclose(read_grid(OutputName), expected, rtol=1e-5, equal_nan=True)
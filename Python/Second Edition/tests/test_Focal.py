@@ -0,0 +1,67 @@
+# Name: test_Focal.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of Focal Statistics (LII_Focal.py) against the mean and sum of the cells of every window, visited
+#              one by one: circle (cell centers within the radius) and rectangle neighborhoods, "DATA" and "NODATA",
+#              and the tiled computation of a raster on disk.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import save_grid, read_grid
+from LII_Focal import FocalStatistics, focal_tiles
+
+# Focal Statistics of every cell from the cells of its window (offsets in cells) inside the array
+def brute_force_focal(a, offsets, statistics_type="MEAN", ignore_nodata="DATA"):
+    rows, cols = a.shape
+    out = np.full(a.shape, np.nan)
+    for row in range(rows):
+        for col in range(cols):
+            values = [a[row + dr, col + dc] for dr, dc in offsets if 0 <= row + dr < rows and 0 <= col + dc < cols]
+            data = [value for value in values if not np.isnan(value)]
+            if not data or (ignore_nodata == "NODATA" and len(data) < len(values)):
+                continue
+            out[row, col] = np.mean(data) if statistics_type == "MEAN" else np.sum(data)
+    return out
+
+# Offsets of the cells of a circle of radius r cells
+def circle_offsets(r):
+    R = int(np.floor(r))
+    return [(dr, dc) for dr in range(-R, R + 1) for dc in range(-R, R + 1) if dr * dr + dc * dc <= r * r]
+
+# Offsets of the cells of a rectangle, centered one cell up and left for even sizes
+def rectangle_offsets(height, width):
+    return [(dr, dc) for dr in range(-(height // 2), height - height // 2) for dc in range(-(width // 2), width - width // 2)]
+
+# Random values with NoData cells
+def random_array(shape, seed):
+    rng = np.random.RandomState(seed)
+    a = rng.uniform(0, 1, shape)
+    a[rng.uniform(0, 1, shape) < 0.2] = np.nan
+    return a
+
+def test_circle():
+    a = random_array((17, 19), 0)
+    # Circle 100 MAP at 30 m: radius of 3.33 cells
+    np.testing.assert_allclose(FocalStatistics(a, "Circle 100 MAP", "MEAN", "DATA"), brute_force_focal(a, circle_offsets(100 / 30.0)), equal_nan=True)
+    np.testing.assert_allclose(FocalStatistics(a, "Circle 2 CELL", "SUM", "NODATA"),
+                               brute_force_focal(a, circle_offsets(2), "SUM", "NODATA"), equal_nan=True)
+
+def test_rectangle():
+    a = random_array((9, 12), 1)
+    for height, width in [(3, 3), (4, 2)]:
+        neighborhood = "Rectangle {} {} CELL".format(width, height)
+        np.testing.assert_allclose(FocalStatistics(a, neighborhood, "MEAN", "DATA"),
+                                   brute_force_focal(a, rectangle_offsets(height, width)), equal_nan=True)
+
+def test_focal_tiles(workspace):
+    a = random_array((21, 18), 2)
+    path = save_grid(a, os.path.join(workspace, "LII2001"))
+    a = np.asarray(a, dtype=np.float32).astype(np.float64)
+    out = os.path.join(workspace, "LII2001_1kmFocal")
+    focal_tiles(path, "Circle 100 MAP", "MEAN", "DATA", tile_size=8).save(out)
+    np.testing.assert_allclose(read_grid(out), brute_force_focal(a, circle_offsets(100 / 30.0)), rtol=1e-5, equal_nan=True)
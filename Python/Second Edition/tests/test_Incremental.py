@@ -0,0 +1,52 @@
+# Name: test_Incremental.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the append-a-year mean (LII_Incremental.py) against np.nanmean of all the years, on a grid of
+#              two blocks: folding a new year, and rebuilding when a folded year changed.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, json
+
+import numpy as np
+
+from .synthetic import save_grid, read_grid
+from LII_Incremental import update_mean, inputs_suffix
+
+# Variables
+shape = (1100, 6)     # More rows than a block (1024), so the sum is folded in two blocks
+
+# Random year raster with NoData cells
+def year_array(seed):
+    rng = np.random.RandomState(seed)
+    array = rng.uniform(0, 1, shape)
+    array[rng.uniform(0, 1, shape) < 0.3] = np.nan
+    return array
+
+# Mean of the years with NoData ignored, NoData where every year is NoData
+def reference_mean(arrays):
+    stack = np.array(arrays, dtype=np.float32).astype(np.float64)
+    count = np.sum(~np.isnan(stack), axis=0)
+    return np.where(count == 0, np.nan, np.nansum(stack, axis=0) / np.maximum(count, 1))
+
+def test_update_mean(workspace):
+    arrays = [year_array(seed) for seed in range(3)]
+    paths = [save_grid(array, os.path.join(workspace, "LII" + str(2001 + i) + "_CellStats")) for i, array in enumerate(arrays)]
+    out = os.path.join(workspace, "LII_CellStats")
+
+    update_mean(paths[:2], out)
+    np.testing.assert_allclose(read_grid(out), reference_mean(arrays[:2]), rtol=1e-6, equal_nan=True)
+
+    # A new year is folded into the running sum
+    update_mean(paths, out)
+    np.testing.assert_allclose(read_grid(out), reference_mean(arrays), rtol=1e-6, equal_nan=True)
+    with open(out + inputs_suffix) as f:
+        assert [path for path, time in json.load(f)] == paths
+
+    # A folded year that changed rebuilds the sum from all years
+    arrays[1] = year_array(10)
+    save_grid(arrays[1], paths[1])
+    os.utime(paths[1] + ".tiles", (0, os.path.getmtime(paths[1] + ".tiles") + 10))
+    update_mean(paths, out)
+    np.testing.assert_allclose(read_grid(out), reference_mean(arrays), rtol=1e-6, equal_nan=True)
@@ -0,0 +1,63 @@
+# Name: test_Lookup.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the lookup-table reclassification of NLCD (LII_Lookup.py) against the rows of
+#              LII_LandscapeMetrics_LUT.csv cell by cell: the metrics, -10 for classes not in the table, and the
+#              normalizations (fixed ranges for PAFRAC and CLUMPY, min and max of the raster for CAI_CV and CORE_CV).
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, csv
+
+import numpy as np
+
+from .synthetic import save_grid, read_grid
+from LII_Lookup import LandscapeMetrics_LUT_csv, Metric_list, read_lut, landscape_metrics, save_landscape_metrics
+
+# Rows of the lookup table of a year: {class: {metric: value}}
+def year_rows(year):
+    with open(LandscapeMetrics_LUT_csv) as f:
+        return dict((int(row['Value']), dict((metric, float(row[metric])) for metric in Metric_list))
+                    for row in csv.DictReader(f) if row['Year'].strip() == year)
+
+# Bands of an NLCD array reclassified one cell at a time
+def brute_force_metrics(nlcd, rows):
+    out = {}
+    for metric in Metric_list:
+        values = np.array([[np.nan if np.isnan(v) else rows.get(int(v), {}).get(metric, -10.0) for v in line] for line in nlcd])
+        if metric == 'PAFRAC':
+            low, high = 1.0, 2.0
+        elif metric == 'CLUMPY':
+            low, high = -1.0, 1.0
+        else:
+            low, high = np.nanmin(values), np.nanmax(values)
+        out[metric] = values
+        out[metric + "_nor"] = (values - low) / (high - low)
+    return out
+
+# NLCD array of classes of the table, a class not in it (12) and NoData
+def nlcd_array(rows, seed):
+    rng = np.random.RandomState(seed)
+    nlcd = rng.choice(sorted(rows) + [12], (9, 14)).astype(np.float64)
+    nlcd[rng.uniform(0, 1, nlcd.shape) < 0.1] = np.nan
+    return nlcd
+
+def test_landscape_metrics(workspace):
+    lut = read_lut()
+    year = sorted(lut)[0]
+    rows = year_rows(year)
+    nlcd = nlcd_array(rows, 0)
+    expected = brute_force_metrics(nlcd, rows)
+    bands = landscape_metrics(nlcd, lut[year])
+    assert sorted(bands) == sorted(expected)
+    for band, values in expected.items():
+        np.testing.assert_allclose(bands[band], values, equal_nan=True, err_msg=band)
+
+    # On disk, block by block: the min and max of CAI_CV and CORE_CV come from the histogram of every block
+    in_raster = save_grid(nlcd, os.path.join(workspace, "NLCD" + year))
+    saved = save_landscape_metrics(in_raster, lut[year], os.path.join(workspace, "NLCD" + year), block_size=4)
+    assert len(saved) == len(expected)
+    for band, values in expected.items():
+        np.testing.assert_allclose(read_grid(os.path.join(workspace, "NLCD" + year + "_" + band)), values, rtol=1e-6,
+                                   equal_nan=True, err_msg=band)
@@ -0,0 +1,44 @@
+# Name: test_Mask.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the boundary mask (LII_Mask.py): the cells whose center is inside the boundary, against a brute-force
+#              point-in-polygon test, the mask rasterized again when the boundary changes, and ExtractByMask.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import Extent, shape, georef, cell_size, save_geojson, read_grid, point_in_ring
+from LII_Mask import save_boundary_mask, ExtractByMask
+
+# Mask of the cell centers inside the ring, one cell at a time
+def brute_force_mask(ring):
+    mask = np.zeros(shape, dtype=bool)
+    for row in range(shape[0]):
+        for col in range(shape[1]):
+            mask[row, col] = point_in_ring(Extent[0] + (col + 0.5) * cell_size, Extent[3] - (row + 0.5) * cell_size, ring)
+    return mask
+
+def test_boundary_mask(workspace):
+    triangle = [[10.0, 10.0], [290.0, 40.0], [101.0, 233.0]]
+    boundary = save_geojson(workspace, "boundary", [{'type': "Polygon", 'coordinates': [triangle + triangle[:1]]}])
+    out_mask = os.path.join(workspace, "boundary_mask")
+    save_boundary_mask(boundary, out_mask, shape, georef)
+    np.testing.assert_array_equal(read_grid(out_mask) > 0, brute_force_mask(triangle))
+
+    # Same boundary and grid: the mask is kept. Another boundary: rasterized again, whatever the file times.
+    mask_time = os.path.getmtime(out_mask + ".tiles")
+    save_boundary_mask(boundary, out_mask, shape, georef)
+    assert os.path.getmtime(out_mask + ".tiles") == mask_time
+    square = [[0.0, 0.0], [150.0, 0.0], [150.0, 120.0], [0.0, 120.0]]
+    save_geojson(workspace, "boundary", [{'type': "Polygon", 'coordinates': [square + square[:1]]}])
+    os.utime(boundary + ".geojson", (0, mask_time - 100))
+    save_boundary_mask(boundary, out_mask, shape, georef)
+    np.testing.assert_array_equal(read_grid(out_mask) > 0, brute_force_mask(square))
+
+    values = np.arange(shape[0] * shape[1], dtype=np.float64).reshape(shape)
+    masked = np.asarray(ExtractByMask(values, out_mask))
+    np.testing.assert_array_equal(masked, np.where(brute_force_mask(square), values, np.nan))
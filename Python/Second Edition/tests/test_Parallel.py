@@ -0,0 +1,37 @@
+# Name: test_Parallel.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the scheduler (LII_Parallel.py): run_tasks returns the results in the order of the tasks with
+#              one worker (in this process) and two workers (in other processes), and the error of a task is raised
+#              by run_tasks with its type and message.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import pytest
+
+from LII_Parallel import run_tasks
+
+# Task: the power of a number and the process it ran in
+def power_task(value, exponent):
+    return value ** exponent, os.getpid()
+
+# Task failing on a negative number
+def checked_task(value):
+    if value < 0:
+        raise ValueError("Negative value " + str(value))
+    return value
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_run_tasks(workers):
+    results = run_tasks(power_task, [(value, 2) for value in range(6)], workers)
+    assert [result for result, pid in results] == [value ** 2 for value in range(6)]
+    pids = set(pid for result, pid in results)
+    assert (pids == {os.getpid()}) if workers == 1 else (os.getpid() not in pids)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_task_error(workers):
+    with pytest.raises(ValueError, match="Negative value -2"):
+        run_tasks(checked_task, [(1,), (-2,), (3,)], workers)
@@ -0,0 +1,79 @@
+# Name: test_Patch.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the patch labeling (LII_Patch.py) against a flood fill of the 8-connected cells with the same
+#              value, on blocks smaller than the raster so that patches are merged across the block seams, and the
+#              patch acres of several habitats saved block by block from one labeling.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import save_grid, read_grid
+from LII_Patch import label_patches, block_labels, patch_cells, patch_acres, save_habitat_patch_acres, acres_per_cell
+
+# Patch number of every cell (8 directions, same value) by flood fill, -1 for NoData. Returns the patch numbers and
+# the number of cells of the patch of every cell (0 for NoData).
+def flood_fill(values):
+    rows, cols = values.shape
+    patch = np.full(values.shape, -1)
+    sizes = []
+    for row in range(rows):
+        for col in range(cols):
+            if np.isnan(values[row, col]) or patch[row, col] >= 0:
+                continue
+            stack, size = [(row, col)], 0
+            patch[row, col] = len(sizes)
+            while stack:
+                r, c = stack.pop()
+                size += 1
+                for nr in range(max(r - 1, 0), min(r + 2, rows)):
+                    for nc in range(max(c - 1, 0), min(c + 2, cols)):
+                        if patch[nr, nc] < 0 and values[nr, nc] == values[r, c]:
+                            patch[nr, nc] = len(sizes)
+                            stack.append((nr, nc))
+            sizes.append(size)
+    return patch, np.where(patch >= 0, np.array(sizes + [0])[patch], 0)
+
+# Values of 3 classes with NoData, and a diagonal chain of one class crossing the seams of the 5 x 5 blocks
+def patch_values():
+    rng = np.random.RandomState(0)
+    values = rng.randint(1, 4, (19, 23)).astype(np.float64)
+    values[rng.uniform(0, 1, values.shape) < 0.15] = np.nan
+    for i in range(19):
+        values[i, i] = 9
+    return values
+
+def test_block_labels():
+    values = patch_values()
+    patch = flood_fill(values)[0]
+    valid = patch >= 0
+    labels, count = block_labels(values, valid)
+    # One label per patch, numbered from 0 in the order of the first cell of each patch like the flood fill
+    np.testing.assert_array_equal(labels, patch)
+    assert count == patch.max() + 1
+
+def test_patch_cells():
+    values = patch_values()
+    patch, count = flood_fill(values)
+    valid = patch >= 0
+    for block_size in (5, 1024):
+        reader, shape, georef, offsets, sizes = label_patches(values, block_size)
+        # One count per label of a block, not per cell
+        assert len(sizes) < values.size
+        np.testing.assert_array_equal(np.asarray(patch_cells(values, block_size)), np.where(valid, count, np.nan))
+    np.testing.assert_allclose(np.asarray(patch_acres(values, block_size=5)), np.where(valid, count * acres_per_cell, np.nan))
+
+def test_save_habitat_patch_acres(workspace):
+    values = patch_values()
+    evt = save_grid(values, os.path.join(workspace, "EVT2001"))
+    count = flood_fill(values)[1]
+    habitat_rasters = dict((habitat, np.where(np.isin(values, classes), 1.0, np.nan)) for habitat, classes in (('grassland', [1, 9]), ('shrubland', [2])))
+    out_rasters = dict((habitat, os.path.join(workspace, habitat + "2001_patch_size_Lookup_Acres")) for habitat in habitat_rasters)
+    save_habitat_patch_acres(evt, habitat_rasters, out_rasters, block_size=5)
+    for habitat, path in out_rasters.items():
+        expected = np.where(np.isnan(habitat_rasters[habitat]), np.nan, count * acres_per_cell)
+        np.testing.assert_allclose(read_grid(path), expected, rtol=1e-6)
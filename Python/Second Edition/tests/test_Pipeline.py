@@ -0,0 +1,59 @@
+# Name: test_Pipeline.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (pytest)
+# Description: Checks of the stage runner (LII_Pipeline.py): a stage whose script raises an error, or one of whose try blocks
+#              fails, or that doesn't write its outputs, stops the pipeline and is not logged as completed.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import pytest
+
+from LII_Pipeline import Stage, read_log, run_pipeline
+
+# Script whose try block fails and prints the error, as the try blocks of the LII scripts do
+Failing_script = """import sys
+from LII_Pipeline import raise_in_stage
+try:
+    1 / 0
+except:
+    print("PYTHON ERRORS:\\n" + str(sys.exc_info()[1]))
+    raise_in_stage()
+"""
+
+# Save a script to folder and return its path
+def save_script(folder, name, source):
+    path = os.path.join(folder, name)
+    with open(path, "w") as f:
+        f.write(source)
+    return path
+
+def test_completed_stage(workspace):
+    output = os.path.join(workspace, "out.txt")
+    script = save_script(workspace, "write.py", "open({!r}, 'w').write('1')\n".format(output))
+    log_path = os.path.join(workspace, "log.json")
+    assert run_pipeline([Stage("write", script, outputs=[output])], log_path) == [("write", "ran")]
+    assert "write" in read_log(log_path)
+    assert run_pipeline([Stage("write", script, outputs=[output])], log_path) == [("write", "skipped")]
+
+def test_failed_try_block(workspace):
+    log_path = os.path.join(workspace, "log.json")
+    stage_list = [Stage("fail", save_script(workspace, "fail.py", Failing_script)),
+                  Stage("next", save_script(workspace, "next.py", "\n"), depends=["fail"])]
+    with pytest.raises(ZeroDivisionError):
+        run_pipeline(stage_list, log_path)
+    assert read_log(log_path) == {}
+
+def test_missing_output(workspace):
+    log_path = os.path.join(workspace, "log.json")
+    stage = Stage("empty", save_script(workspace, "empty.py", "\n"), outputs=[os.path.join(workspace, "missing")])
+    with pytest.raises(RuntimeError):
+        run_pipeline([stage], log_path)
+    assert "empty" not in read_log(log_path)
+
+def test_failed_try_block_outside_pipeline(workspace):
+    # Run as a script, the error of the try block is printed and the script goes on
+    namespace = {'__name__': '__main__'}
+    exec(compile(Failing_script, "fail.py", 'exec'), namespace)
@@ -0,0 +1,58 @@
+# Name: test_Rasterize.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the rasterizer (LII_Rasterize.py) against cell-by-cell tests: the cell of every point, the cells
+#              a line crosses with a length inside (segment clipped to every cell), the cells whose center is inside a
+#              polygon with a hole, and FeatureToRaster of a GeoJSON feature class on the synthetic grid.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import Extent, shape, georef, cell_size, save_geojson, read_grid, point_in_ring
+from LII_Rasterize import point_cells, line_cells, polygon_cells, map_to_cells, FeatureToRaster
+
+# Length of the part of segment (p, q) inside the cell (row, col) in cell coordinates (Liang-Barsky clipping)
+def clipped_length(p, q, row, col):
+    t0, t1 = 0.0, 1.0
+    for a, b, lo in ((p[0], q[0], row), (p[1], q[1], col)):
+        d = b - a
+        if d == 0:
+            if not lo <= a < lo + 1:
+                return 0.0
+            continue
+        s0, s1 = sorted([(lo - a) / d, (lo + 1 - a) / d])
+        t0, t1 = max(t0, s0), min(t1, s1)
+    return max(t1 - t0, 0.0) * np.hypot(q[0] - p[0], q[1] - p[1])
+
+def test_point_cells():
+    points = np.array([[0.5, 0.5], [3.99, 7.0], [7.2, 9.9], [-0.1, 2.0], [2.0, 10.0]])
+    assert sorted(point_cells(points, shape)) == [0 * 10 + 0, 3 * 10 + 7, 7 * 10 + 9]
+
+def test_line_cells():
+    rng = np.random.RandomState(0)
+    for n in range(20):
+        line = rng.uniform(-1, 11, (3, 2)) * [shape[0] / 10.0, 1]
+        expected = [row * shape[1] + col for row in range(shape[0]) for col in range(shape[1])
+                    if any(clipped_length(p, q, row, col) > 1e-9 for p, q in zip(line[:-1], line[1:]))]
+        assert list(line_cells([line], shape)) == expected
+
+def test_polygon_cells():
+    outer = [(0.3, 0.2), (1.1, 9.6), (7.8, 8.7), (6.2, 0.9)]
+    hole = [(2.2, 3.1), (2.4, 6.3), (5.1, 5.6)]
+    expected = [row * shape[1] + col for row in range(shape[0]) for col in range(shape[1])
+                if point_in_ring(row + 0.5, col + 0.5, outer) and not point_in_ring(row + 0.5, col + 0.5, hole)]
+    assert list(polygon_cells([[np.array(outer), np.array(hole)]], shape)) == expected
+
+def test_feature_to_raster(workspace):
+    ring = [[45.0, 20.0], [280.0, 50.0], [130.0, 220.0], [45.0, 20.0]]
+    road = save_geojson(workspace, "road2010", [{'type': "Polygon", 'coordinates': [ring]}])
+    out_raster = os.path.join(workspace, "road2010_ras")
+    FeatureToRaster(road, "OID@", out_raster, cell_size, Extent)
+    cells = map_to_cells(ring, georef)
+    expected = [[1.0 if point_in_ring(row + 0.5, col + 0.5, [tuple(cell) for cell in cells]) else np.nan
+                 for col in range(shape[1])] for row in range(shape[0])]
+    np.testing.assert_array_equal(read_grid(out_raster), expected)
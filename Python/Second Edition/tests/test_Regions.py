@@ -0,0 +1,80 @@
+# Name: test_Regions.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy, pytest)
+# Description: Checks of the multi-region batch (LII_Regions.py): region grids snapped to the common grid, the number
+#              of regions run at the same time from the available memory and the size of the regions, and two small
+#              synthetic regions run on two workers, each on its own grid and in its own folder.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, json, time
+
+import numpy as np
+
+import LII_Regions
+from .synthetic import Extent, EVT_dict, make_workspace, save_grid, read_grid
+from LII_Store import saved_rasters, open_store, save_store
+from LII_Regions import snap_extent, region_folder, region_workers, region_memory, run_regions, Boundary_name
+
+# Variables
+Region_dict = {'North Office': (0.0, 0.0, 300.0, 240.0), 'South Office': (30.0, 30.0, 270.0, 210.0)}   # Extent of the boundary of each region
+
+def test_snap_extent():
+    # Grown outward to the 30 m cells of a grid with a corner at (0, 0); extents already on the grid don't move
+    assert snap_extent((31.0, 59.0, 91.0, 120.0), (0.0, 0.0), 30) == (30.0, 30.0, 120.0, 120.0)
+    assert snap_extent((30.0, 30.0, 120.0, 120.0), (0.0, 0.0), 30, margin=1) == (0.0, 0.0, 150.0, 150.0)
+
+def test_region_folder():
+    assert region_folder("Carlsbad Field Office") == "Carlsbad_Field_Office"
+    assert region_folder("***") == "region"
+
+def test_region_workers(monkeypatch):
+    monkeypatch.setattr(LII_Regions, 'Workers', 8)
+    shape_list = [(1000, 1000), (4000, 3000), (2000, 2000)]
+    large, middle, small = [region_memory(shape) for shape in [(4000, 3000), (2000, 2000), (1000, 1000)]]
+    # Workers are counted with the largest regions running together, and are at most the CPUs
+    for memory, workers in [(None, 1), (large // 2, 1), (large + middle - 1, 1), (large + middle, 2), (large + middle + small, 3)]:
+        monkeypatch.setattr(LII_Regions, 'available_memory', lambda: memory)
+        assert region_workers(shape_list) == workers
+    monkeypatch.setattr(LII_Regions, 'available_memory', lambda: large * 100)
+    assert region_workers(shape_list * 10) == 8
+
+# Crop the synthetic rasters of a workspace to the cells of an extent inside the synthetic grid
+def crop_workspace(ws, extent):
+    x0, y0, x1, y1 = extent
+    window = (slice(int((Extent[3] - y1) / 30), int((Extent[3] - y0) / 30)), slice(int((x0 - Extent[0]) / 30), int((x1 - Extent[0]) / 30)))
+    for name in saved_rasters(ws):
+        path = os.path.join(ws, name)
+        store = open_store(path)
+        save_store(np.array(store.read()[window]), path, {'geotransform': (x0, 30.0, 0.0, y1, 0.0, -30.0), 'projection': ""}, dtype=store.dtype)
+
+def test_run_regions(workspace):
+    regions = os.path.join(workspace, "regions")
+    with open(regions + ".geojson", "w") as f:
+        json.dump({'type': "FeatureCollection", 'features': [
+            {'type': "Feature", 'properties': {'NAME': name},
+             'geometry': {'type': "Polygon", 'coordinates': [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]}}
+            for name, (x0, y0, x1, y1) in Region_dict.items()]}, f)
+    # The data prep of each region is done (synthetic inputs on the grid of the region and a log), so the scoring stage
+    # runs without arcpy
+    out_folder = os.path.join(workspace, "regions_out")
+    for name in Region_dict:
+        folder = os.path.join(out_folder, region_folder(name))
+        ws = make_workspace(folder)
+        for year in EVT_dict:
+            save_grid(read_grid(os.path.join(ws, "grassland2001_Acres")), os.path.join(ws, "grassland" + year + "_patch_size_Lookup_Acres"))
+        crop_workspace(ws, Region_dict[name])
+        with open(os.path.join(folder, "LII_Pipeline_log.json"), "w") as f:
+            json.dump({'DataPrep': time.time() + 1}, f)
+
+    report = run_regions(regions, "NAME", out_folder, {'Backend': "numpy"}, targets=["EcologicalIntegrity"], workers=2, origin=(0.0, 0.0))
+    assert report == [(name, [("DataPrep", "skipped"), ("EcologicalIntegrity", "ran")]) for name in Region_dict]
+    for name, (x0, y0, x1, y1) in Region_dict.items():
+        folder = os.path.join(out_folder, region_folder(name))
+        with open(os.path.join(folder, Boundary_name + ".geojson")) as f:
+            assert [feature['properties']['NAME'] for feature in json.load(f)['features']] == [name]
+        # Each region is scored on its own grid
+        metrics = read_grid(os.path.join(folder, "LII_Eco.gdb", "EcoIndicator2001_CellStats"))
+        assert metrics.shape == (int((y1 - y0) / 30), int((x1 - x0) / 30))
+        assert not np.isnan(metrics).all()
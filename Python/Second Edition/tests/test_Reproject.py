@@ -0,0 +1,93 @@
+# Name: test_Reproject.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the reprojection (LII_Reproject.py): the Albers Equal Area Conic and Transverse Mercator formulas
+#              against the numerical examples of Snyder 1987 (Map Projections - A Working Manual, pages 292 and 269,
+#              Clarke 1866 ellipsoid), the inverse formulas back to the same longitude and latitude, and a raster
+#              resampled to a grid shifted by whole cells and clipped to a boundary mask, and a raster in Albers clipped
+#              to its window under a UTM grid (source_extent) before projecting gives the cells of the whole raster.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import read_grid
+from LII_Store import save_store
+from LII_Reproject import parse_projection, albers_forward, albers_inverse, tm_forward, tm_inverse, transform, save_projected_rasters, source_extent
+
+# Variables
+Clarke1866 = 'SPHEROID["Clarke_1866",6378206.4,294.9786982]'
+Albers_wkt = ('PROJCS["Albers",GEOGCS["GCS_North_American_1927",DATUM["D_North_American_1927",' + Clarke1866 + ']],'
+              'PROJECTION["Albers"],PARAMETER["False_Easting",0.0],PARAMETER["False_Northing",0.0],'
+              'PARAMETER["Central_Meridian",-96.0],PARAMETER["Standard_Parallel_1",29.5],'
+              'PARAMETER["Standard_Parallel_2",45.5],PARAMETER["Latitude_Of_Origin",23.0]]')
+TM_wkt = ('PROJCS["Transverse_Mercator",GEOGCS["GCS_North_American_1927",DATUM["D_North_American_1927",' + Clarke1866 + ']],'
+          'PROJECTION["Transverse_Mercator"],PARAMETER["False_Easting",0.0],PARAMETER["False_Northing",0.0],'
+          'PARAMETER["Central_Meridian",-75.0],PARAMETER["Scale_Factor",0.9996],PARAMETER["Latitude_Of_Origin",0.0]]')
+UTM13N_wkt = ('PROJCS["NAD_1927_UTM_Zone_13N",GEOGCS["GCS_North_American_1927",DATUM["D_North_American_1927",' + Clarke1866 + ']],'
+              'PROJECTION["Transverse_Mercator"],PARAMETER["False_Easting",500000.0],PARAMETER["False_Northing",0.0],'
+              'PARAMETER["Central_Meridian",-105.0],PARAMETER["Scale_Factor",0.9996],PARAMETER["Latitude_Of_Origin",0.0]]')
+
+def test_albers():
+    crs = parse_projection(Albers_wkt)
+    assert crs['projection'] == 'albers'
+    lon, lat = np.radians([-75.0]), np.radians([35.0])
+    x, y = albers_forward(lon, lat, crs)
+    np.testing.assert_allclose([x[0], y[0]], [1885472.7, 1535925.0], atol=0.1)
+    np.testing.assert_allclose(albers_inverse(x, y, crs), (lon, lat), atol=1e-11)
+
+def test_transverse_mercator():
+    crs = parse_projection(TM_wkt)
+    assert crs['projection'] == 'tm'
+    lon, lat = np.radians([-73.5]), np.radians([40.5])
+    x, y = tm_forward(lon, lat, crs)
+    np.testing.assert_allclose([x[0], y[0]], [127106.5, 4484124.4], atol=0.1)
+    np.testing.assert_allclose(tm_inverse(x, y, crs), (lon, lat), atol=1e-11)
+
+def test_save_projected_rasters(workspace):
+    values = np.arange(12 * 15, dtype=np.float64).reshape(12, 15)
+    source_georef = {'geotransform': (1500000.0, 30.0, 0.0, 1200000.0, 0.0, -30.0), 'projection': Albers_wkt}
+    source = save_store(values, os.path.join(workspace, "NLCD2001_Albers"), source_georef)
+
+    # Target grid 2 rows down and 3 columns right of the source corner, going 2 columns past its right edge
+    shape = (6, 14)
+    georef = {'geotransform': (1500090.0, 30.0, 0.0, 1199940.0, 0.0, -30.0), 'projection': Albers_wkt}
+    mask = np.ones(shape, dtype=np.uint8)
+    mask[0, :4] = 0
+    mask_path = save_store(mask, os.path.join(workspace, "boundary_mask"), georef, dtype='uint8')
+    out = os.path.join(workspace, "NLCD2001")
+    save_projected_rasters([source], [out], shape, georef, os.path.join(workspace, "cache"), mask_path, workers=1)
+
+    expected = np.full(shape, np.nan)
+    expected[:, :12] = values[2:8, 3:15]
+    expected[mask == 0] = np.nan
+    np.testing.assert_array_equal(read_grid(out), expected)
+
+def test_source_extent(workspace):
+    # UTM grid of 40 x 50 cells of 30 m, and a larger Albers raster around it with 30 m cells
+    shape = (40, 50)
+    georef = {'geotransform': (560000.0, 30.0, 0.0, 3640000.0, 0.0, -30.0), 'projection': UTM13N_wkt}
+    x, y = transform([560000.0, 561500.0, 560000.0, 561500.0], [3640000.0, 3640000.0, 3638800.0, 3638800.0],
+                     parse_projection(UTM13N_wkt), parse_projection(Albers_wkt))
+    x0, y0 = np.floor(x.min() / 30.0 - 20) * 30.0, np.ceil(y.max() / 30.0 + 20) * 30.0
+    source_shape = (int((y0 - y.min()) / 30.0) + 20, int((x.max() - x0) / 30.0) + 20)
+    source_georef = {'geotransform': (x0, 30.0, 0.0, y0, 0.0, -30.0), 'projection': Albers_wkt}
+    values = np.random.RandomState(0).randint(1, 100, source_shape).astype(np.float64)
+    whole = save_store(values, os.path.join(workspace, "LCM_Albers"), source_georef)
+
+    # Clip_management of the rectangle: the cells of the source whose extent is in the rectangle
+    xmin, ymin, xmax, ymax = source_extent(source_shape, source_georef, shape, georef)
+    r0, r1 = int(round((y0 - ymax) / 30.0)), int(round((y0 - ymin) / 30.0))
+    c0, c1 = int(round((xmin - x0) / 30.0)), int(round((xmax - x0) / 30.0))
+    assert 0 < r0 < r1 < source_shape[0] and 0 < c0 < c1 < source_shape[1]
+    clipped = save_store(values[r0:r1, c0:c1], os.path.join(workspace, "LCM_window"),
+                         {'geotransform': (xmin, 30.0, 0.0, ymax, 0.0, -30.0), 'projection': Albers_wkt})
+
+    outs = [os.path.join(workspace, "LCM_whole"), os.path.join(workspace, "LCM_clipped")]
+    save_projected_rasters([whole, clipped], outs, shape, georef, os.path.join(workspace, "cache"), workers=1)
+    projected = read_grid(outs[0])
+    assert not np.isnan(projected).any()
+    np.testing.assert_array_equal(read_grid(outs[1]), projected)
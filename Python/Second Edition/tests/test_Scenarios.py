@@ -0,0 +1,51 @@
+# Name: test_Scenarios.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the scoring scenarios (LII_Scenario.py, LII_5_Scenarios_v2.py) on a tiny synthetic workspace:
+#              the baseline scenario gives the Cell Statistics of the scoring script, and LII_5_Scenarios_v2.py keeps
+#              the decay surfaces itself when the scoring script ran with Scenario_cache = False. The impact score table
+#              fills the layers a scenario doesn't list with the baseline IP.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import Script_folder, Extent, make_workspace, read_grid
+from LII_Pipeline import Stage, run_stage
+from LII_Scenario import layer_impact, read_scenarios
+
+# Run LII_2_CompositeScoringSystem_v2.py (Backend = "numpy", Scenario_cache = False) and LII_5_Scenarios_v2.py on folder,
+# with parameters of LII_5_Scenarios_v2.py in place of its values
+def run_scoring_and_scenarios(folder, parameters={}):
+    make_workspace(folder)
+    run_stage(Stage("score", os.path.join(Script_folder, "LII_2_CompositeScoringSystem_v2.py"),
+                    parameters={'Workspace_Folder': folder, 'Backend': "numpy", 'Workers': 1, 'Study_Extent': Extent}))
+    run_stage(Stage("scenarios", os.path.join(Script_folder, "LII_5_Scenarios_v2.py"),
+                    parameters=dict({'Workspace_Folder': folder, 'Workers': 1, 'Script_parameters': {'Study_Extent': Extent}}, **parameters)))
+
+def test_baseline_scenario(workspace):
+    run_scoring_and_scenarios(workspace)
+    ws_RS = os.path.join(workspace, "LII_ResourceStress.gdb")
+    ws_Baseline = os.path.join(workspace, "LII_Scenarios", "baseline")
+    for Metrics in ["ResourceMetrics2002_CellStats", "StressorMetrics2005_CellStats"]:
+        np.testing.assert_allclose(read_grid(os.path.join(ws_Baseline, Metrics)), read_grid(os.path.join(ws_RS, Metrics)),
+                                   rtol=1e-6, equal_nan=True)
+    assert os.path.isfile(os.path.join(workspace, "LII_Scenarios", "LII_Scenarios.csv"))
+
+def test_layer_impact():
+    source = np.array([[np.nan, 1.0], [np.nan, np.nan]])
+    nor = np.array([[0.5, 0.0], [1.0, np.nan]])
+    # Source cells get the IP; off the sources, nor * Null (-10) is below 0 and SetNull drops it
+    np.testing.assert_allclose(layer_impact(source, None, 0.4), [[np.nan, 0.4], [np.nan, np.nan]], equal_nan=True)
+    np.testing.assert_allclose(layer_impact(source, nor, 0.4), [[np.nan, 0.4], [np.nan, np.nan]], equal_nan=True)
+
+def test_read_scenarios(workspace):
+    path = os.path.join(workspace, "LII_ImpactScores.csv")
+    with open(path, "w") as f:
+        f.write("Scenario,Layer,IP\nbaseline,road,0.2\nbaseline,IPA,0.8\nlow_roads, road ,0.1\n")
+    scenarios = read_scenarios(path)
+    assert list(scenarios) == ["baseline", "low_roads"]
+    assert scenarios["low_roads"] == {'road': 0.1, 'IPA': 0.8}
@@ -0,0 +1,78 @@
+# Name: test_Sparse.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the sparse raster (LII_Sparse.py) on tiles smaller than the raster: constant, COO and dense tiles,
+#              map algebra tile by tile, and the raster saved and opened again. Con, SetNull, IsNull, Log10, Cell Statistics
+#              and the min-max normalization of sparse rasters give the results of the same functions on dense Rasters.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import georef
+from LII_Sparse import SparseRaster, save_sparse, open_sparse, sparse_exists
+from LII_MapAlgebra import Raster, Con, SetNull, IsNull, Log10, CellStatistics, Statistics_list
+
+# Sparse values on tiles of 4 x 4: absent tiles, a COO tile, a dense tile with zeros and negative values (Log10), and
+# a constant tile (e.g. -10 after Con(IsNull(ras), -10, ras))
+def sparse_values(seed):
+    rng = np.random.RandomState(seed)
+    values = np.full((10, 12), np.nan)
+    values[1, 2] = rng.uniform(0, 5)
+    values[5:8, 4:8] = rng.randint(-2, 6, (3, 4))
+    values[8:10, 8:12] = -10
+    values[rng.randint(0, 10), 9] = rng.uniform(1, 3)
+    return values
+
+# Same values as a dense Raster and as a SparseRaster
+def both(values):
+    return Raster(values, georef), SparseRaster.from_array(values, georef, tile_size=4)
+
+# Check that a function of sparse rasters is sparse and gives the cells of the same function of dense Rasters
+def check_sparse(function, *values):
+    dense, sparse = zip(*[both(v) for v in values])
+    out = function(*sparse)
+    assert isinstance(out, SparseRaster)
+    np.testing.assert_allclose(np.asarray(out), np.asarray(function(*dense)), rtol=1e-12, equal_nan=True)
+
+def test_sparse_raster(workspace):
+    values = np.full((10, 12), np.nan)
+    values[1, 1] = 0.2                  # COO tile
+    values[5:8, 4:8] = 0.7              # dense tile
+    sparse = SparseRaster.from_array(values, georef, tile_size=4)
+    assert sparse.present() == [(0, 0), (1, 1)]
+    assert sparse.tiles[(0, 0)][1] is not None and sparse.tiles[(1, 1)][1] is None
+    np.testing.assert_array_equal(np.asarray(sparse), values)
+
+    # Con(IsNull(ras), -10, ras): the absent tiles become constant -10 tiles computed from one cell
+    null = Con(IsNull(sparse), -10, sparse)
+    assert isinstance(null, SparseRaster)
+    assert null.constant((2, 2)) == -10
+    np.testing.assert_array_equal(np.asarray(null), np.where(np.isnan(values), -10, values))
+    np.testing.assert_allclose(np.asarray(null * 2 + 1), np.where(np.isnan(values), -10, values) * 2 + 1)
+
+    path = save_sparse(null, os.path.join(workspace, "road2001_ras_Null"))
+    assert sparse_exists(path)
+    np.testing.assert_allclose(np.asarray(open_sparse(path)), np.asarray(null), rtol=1e-7)
+
+def test_sparse_map_algebra():
+    a, b = sparse_values(1), sparse_values(2)
+    check_sparse(lambda x: Con(IsNull(x), -10, x), a)
+    check_sparse(lambda x, y: Con(x > 1, y, x), a, b)
+    check_sparse(lambda x: Con(x, 1), a)
+    check_sparse(lambda x: SetNull(x < 0, x), a)
+    check_sparse(lambda x, y: SetNull(x, y * 2), a, b)
+    check_sparse(IsNull, a)
+    check_sparse(Log10, a)
+    # Normalization with the minimum and maximum of the raster, as the _nor rasters
+    check_sparse(lambda x: (x - x.minimum) / (x.maximum - x.minimum), a)
+    check_sparse(lambda x: Log10(Con(IsNull(x), 0, x) + 1) * 0.7, b)
+
+def test_sparse_cell_statistics():
+    values = [sparse_values(seed) for seed in range(3)]
+    for statistics_type in Statistics_list:
+        for ignore_nodata in ("DATA", "NODATA"):
+            check_sparse(lambda *rasters: CellStatistics(list(rasters), statistics_type, ignore_nodata), *values)
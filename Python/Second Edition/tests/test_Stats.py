@@ -0,0 +1,53 @@
+# Name: test_Stats.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the raster statistics (LII_Stats.py): the histogram gathered block by block, with its bins
+#              merged as the values spread, gives the percentiles of np.nanpercentile within a bin width, and a sidecar
+#              older than its raster is not used: the statistics are computed from the cells again.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os, time
+
+import numpy as np
+
+from .synthetic import georef
+from LII_Stats import RasterStats, histogram_percentile, read_stats, stats_suffix
+from LII_MapAlgebra import Raster, save_raster
+from LII_Store import save_store
+
+def test_histogram_percentile():
+    rng = np.random.RandomState(0)
+    blocks = [rng.uniform(0, 1, (20, 30)), rng.normal(40, 15, (20, 30)), rng.lognormal(3, 1, (20, 30))]
+    blocks[1][rng.uniform(0, 1, (20, 30)) < 0.2] = np.nan
+    stats = RasterStats()
+    widths = []
+    for block in blocks:
+        stats.add(block)
+        widths.append(stats.width)
+    # The first block sets fine bins, the next ones merge them
+    assert widths[0] < widths[1] <= widths[2]
+    result = stats.as_dict()
+    values = np.concatenate([np.asarray(block, dtype=np.float32).ravel() for block in blocks]).astype(np.float64)
+    assert result['count'] == np.count_nonzero(~np.isnan(values)) == sum(result['histogram']['counts'])
+    # Within a bin width of the two values np.nanpercentile interpolates between
+    ranked = np.sort(values[~np.isnan(values)])
+    width = result['histogram']['width']
+    for q in (0, 1, 10, 25, 50, 75, 90, 99, 100):
+        rank = q / 100.0 * (len(ranked) - 1)
+        low, high = ranked[int(np.floor(rank))], ranked[int(np.ceil(rank))]
+        assert low - width <= histogram_percentile(result, q) <= high + width, q
+    assert histogram_percentile(RasterStats().as_dict(), 50) is None
+
+def test_stale_sidecar(workspace):
+    path = os.path.join(workspace, "values")
+    save_raster(np.arange(80, dtype=np.float64).reshape(8, 10), path, georef)
+    assert read_stats(path)['maximum'] == 79.0 and Raster(path).maximum == 79.0
+    # Saved again without its sidecar (e.g. by another tool): the statistics come from the new cells
+    save_store(np.arange(80, dtype=np.float64).reshape(8, 10) * 2 - 5, path, georef)
+    old = time.time() - 60
+    os.utime(path + stats_suffix, (old, old))
+    assert read_stats(path) is None
+    ras = Raster(path)
+    assert (ras.minimum, ras.maximum, ras.mean) == (-5.0, 153.0, 74.0)
@@ -0,0 +1,47 @@
+# Name: test_Store.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the tile store (LII_Store.py) on tiles smaller than the raster: windows read and written across
+#              tiles, the header, the rasters of a folder listed by name, and an integer store read with 0 as NoData.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import georef
+from LII_Store import create_store, open_store, save_store, saved_rasters
+from LII_MapAlgebra import open_raster, read_window, Raster
+
+def test_tile_store(workspace):
+    values = np.arange(11 * 9, dtype=np.float64).reshape(11, 9)
+    store = create_store(os.path.join(workspace, "values"), values.shape, georef, tile_size=4)
+    assert np.isnan(store.read()).all()
+    store.write(values[2:7, 3:9], (slice(2, 7), slice(3, 9)))
+    store.flush()
+
+    expected = np.full(values.shape, np.nan)
+    expected[2:7, 3:9] = values[2:7, 3:9]
+    store = open_store(os.path.join(workspace, "values"))
+    assert store.grid == (3, 3) and store.georef['geotransform'] == list(georef['geotransform'])
+    np.testing.assert_array_equal(np.asarray(store), expected)
+    # A window inside one tile and one across four tiles
+    np.testing.assert_array_equal(store.read((slice(4, 6), slice(4, 7))), expected[4:6, 4:7])
+    np.testing.assert_array_equal(store.read((slice(3, 10), slice(2, 6))), expected[3:10, 2:6])
+    assert saved_rasters(workspace, "val*") == ["values"]
+
+def test_integer_store(workspace):
+    labels = np.arange(11 * 9, dtype=np.uint8).reshape(11, 9) % 6
+    path = save_store(labels, os.path.join(workspace, "labels"), georef, tile_size=4, dtype='uint8')
+    expected = np.where(labels == 0, np.nan, labels)
+    store = open_store(path)
+    assert store.dtype == np.uint8 and store.nodata == 0
+    # The cells as stored, and NaN for NoData from the readers of the map algebra
+    np.testing.assert_array_equal(store.read(), labels)
+    np.testing.assert_array_equal(np.asarray(store), expected)
+    ds, rb, nd = open_raster(path)
+    np.testing.assert_array_equal(read_window(rb, nd, (slice(1, 3), slice(1, 3))), expected[1:3, 1:3])
+    np.testing.assert_array_equal(read_window(rb, nd, (slice(3, 10), slice(2, 6))), expected[3:10, 2:6])
+    np.testing.assert_array_equal(Raster(path), expected)
@@ -0,0 +1,83 @@
+# Name: test_Sweep.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the sensitivity sweep (LII_Sweep.py): every plane of the resource and stressor cubes against the
+#              decay of the layer-years computed from the distance to every source cell at the maximum distance of the
+#              plane, scored with the IP of its scenario, with the Cell Statistics MINIMUM of each year and the mean of the years.
+#              The sweep of LII_5_Scenarios_v2.py (Sweep_distance_list) is checked the same way, with its distance fields.
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import shape, save_grid, read_grid, brute_force_distance
+from .test_Scenarios import run_scoring_and_scenarios
+from LII_Distance import log10_null, decay_nor
+from LII_Scenario import layer_impact, read_scenarios, Resource_list, Stressor_list, Year_list
+from LII_Pipeline import path_exists
+from LII_Sweep import run_sweep, read_sweep, field_path, Group_list
+
+# Variables
+Distance_list = [120, 60]
+Scenarios = {'baseline': {'noxweed': 0.7, 'vTreatment': 0.7, 'ogwell': 0.2}, 'low': {'noxweed': 0.5, 'vTreatment': 0.6, 'ogwell': 0.1}}
+Layer_dict = {'resource': [('noxweed', '2001', 0), ('vTreatment', '2001', 1), ('noxweed', '2002', 2)], 'stressor': [('ogwell', '2001', 3)]}
+
+# Source raster of a layer-year: a few burned cells
+def source_array(seed):
+    rng = np.random.RandomState(seed)
+    return np.where(rng.uniform(0, 1, shape) < 0.06, 1.0, np.nan)
+
+# Decay of a layer-year at a maximum distance, scored with ip, from the distance to every source cell
+def reference_impact(source, maximum_distance, ip):
+    distance = brute_force_distance(source, maximum_distance)
+    values = log10_null(distance)
+    return layer_impact(source, decay_nor(distance, values.min(), values.max()), ip)
+
+# Mean over the years of the per-year Cell Statistics MINIMUM (DATA) of the layers of a group ([(layer, year, source)])
+def reference_plane(layers, maximum_distance, scores):
+    years = {}
+    for layer, year, source in layers:
+        years.setdefault(year, []).append(reference_impact(source, maximum_distance, scores[layer]))
+    minimum = [np.fmin.reduce(arrays) for arrays in years.values()]
+    count = np.sum([~np.isnan(a) for a in minimum], axis=0)
+    return np.where(count == 0, np.nan, np.nansum(minimum, axis=0) / np.maximum(count, 1))
+
+def test_run_sweep(workspace):
+    ws_RS = os.path.join(workspace, "LII_ResourceStress.gdb")
+    sources = {}
+    for layers in Layer_dict.values():
+        for layer, year, seed in layers:
+            sources[seed] = source_array(seed)
+            save_grid(sources[seed], os.path.join(ws_RS, layer + year + "_ras"))
+    out_cube = os.path.join(workspace, "LII_Sweep", "sweep")
+    settings = run_sweep(ws_RS, Distance_list, Scenarios, out_cube, workers=1)
+    assert [(s['maximum_distance'], s['scenario']) for s in settings] == [(d, name) for d in (60.0, 120.0) for name in Scenarios]
+
+    for group, layers in Layer_dict.items():
+        cube, cube_settings = read_sweep(out_cube, group)
+        assert cube_settings == settings
+        for plane, setting in enumerate(settings):
+            expected = reference_plane([(layer, year, sources[seed]) for layer, year, seed in layers],
+                                       setting['maximum_distance'], Scenarios[setting['scenario']])
+            np.testing.assert_allclose(cube[plane], expected, rtol=1e-5, equal_nan=True, err_msg=str(setting))
+
+def test_scenarios_script_sweep(workspace):
+    run_scoring_and_scenarios(workspace, {'Sweep_distance_list': [60, 120]})
+    ws_RS = os.path.join(workspace, "LII_ResourceStress.gdb")
+    scenarios = read_scenarios()
+    for group, layer_list in zip(Group_list, [Resource_list, Stressor_list]):
+        layers = [(layer, year, os.path.join(ws_RS, layer + year + "_ras")) for year in Year_list for layer in layer_list]
+        layers = [(layer, year, read_grid(source)) for layer, year, source in layers if path_exists(source)]
+        assert layers
+        # The distance fields are at the cell size of the grid (30 m)
+        for layer, year, source in layers:
+            np.testing.assert_allclose(read_grid(field_path(os.path.join(ws_RS, layer + year + "_ras"), 120)),
+                                       brute_force_distance(source, 120), rtol=1e-6, equal_nan=True)
+        cube, settings = read_sweep(os.path.join(workspace, "LII_Scenarios", "LII_Sweep"), group)
+        assert [s['maximum_distance'] for s in settings] == [60.0] * len(scenarios) + [120.0] * len(scenarios)
+        for plane, setting in enumerate(settings):
+            np.testing.assert_allclose(cube[plane], reference_plane(layers, setting['maximum_distance'], scenarios[setting['scenario']]),
+                                       rtol=1e-5, equal_nan=True, err_msg=str(setting))
@@ -0,0 +1,42 @@
+# Name: test_Tiles.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the tiles with halo (LII_Tiles.py): the halo windows at the raster edges, and a neighborhood
+#              operation computed tile by tile from a raster on disk gives the whole-raster result (no seams).
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import save_grid
+from LII_Tiles import halo_window, halo_tiles, halo_raster, open_inputs
+
+# Maximum of the 3 x 3 window of every cell (cells outside the array ignored), one cell at a time
+def window_maximum(a):
+    rows, cols = a.shape
+    out = np.empty(a.shape)
+    for row in range(rows):
+        for col in range(cols):
+            out[row, col] = a[max(row - 1, 0):row + 2, max(col - 1, 0):col + 2].max()
+    return out
+
+def test_halo_window():
+    shape = (10, 12)
+    # Inner tile: grown on every side; corner tile: clipped to the raster, so the tile starts at the top left
+    assert halo_window((slice(4, 8), slice(4, 8)), 2, shape) == ((slice(2, 10), slice(2, 10)), (slice(2, 6), slice(2, 6)))
+    assert halo_window((slice(0, 4), slice(8, 12)), 2, shape) == ((slice(0, 6), slice(6, 12)), (slice(0, 4), slice(2, 6)))
+
+def test_halo_raster(workspace):
+    a = np.random.RandomState(0).uniform(0, 1, (13, 11))
+    path = save_grid(a, os.path.join(workspace, "values"))
+    a = np.asarray(a, dtype=np.float32).astype(np.float64)
+    tiled = halo_raster(window_maximum, [path], 1, tile_size=4)
+    np.testing.assert_array_equal(np.asarray(tiled), window_maximum(a))
+
+    # Every tile with its halo holds the cells of the halo window
+    readers, shape, georef = open_inputs([path])
+    for window, (block,), inner in halo_tiles(readers, shape, 1, tile_size=4):
+        np.testing.assert_array_equal(block[inner], a[window])
@@ -0,0 +1,52 @@
+# Name: test_VectorDistance.py
+# Author: Liling Lee
+# Date: 20261018
+# Updates: 2.0
+# Software: Python 3 (NumPy backend, pytest)
+# Description: Checks of the distance decay from the features (LII_VectorDistance.py): for wells on cell centers, the
+#              decay of the layer-year equals the decay from the distance to every source cell and the distance
+#              transform (LII_Distance.py), on tiles smaller than the grid, and the layer-years with many wells are left
+#              to the distance transform (sparse_ratio).
+# -----------------------------------------------------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from .synthetic import shape, georef, save_grid, read_grid, brute_force_distance
+from LII_Distance import log10_null, decay_nor, save_distance_decay_tiles
+from LII_Scenario import layer_impact
+from LII_VectorDistance import save_vector_decay
+
+# Variables
+maximum_distance = 90
+ip = 0.3
+
+# Point features on the centers of cells, and the source raster with the IP burned on them
+def point_features(cells):
+    x0, cell, _, y0, _, _ = georef['geotransform']
+    features = [("point", [np.array([[x0 + (col + 0.5) * cell, y0 - (row + 0.5) * cell]])], ip) for row, col in cells]
+    source = np.full(shape, np.nan)
+    source[tuple(np.transpose(cells))] = ip
+    return features, source
+
+def test_point_decay(workspace):
+    features, source = point_features([(1, 1), (6, 8)])
+    in_raster = save_grid(source, os.path.join(workspace, "ogwell2010_ras"))
+    out_raster = os.path.join(workspace, "ogwell2010_Log10IP_Null_SetNull")
+    assert save_vector_decay(features, in_raster, out_raster, maximum_distance, sparse_only=True, tile_size=4) == out_raster
+
+    distance = brute_force_distance(source, maximum_distance)
+    values = log10_null(distance)
+    expected = layer_impact(source, decay_nor(distance, values.min(), values.max()), ip)
+    np.testing.assert_allclose(read_grid(out_raster), expected, rtol=1e-5, equal_nan=True)
+    raster_decay = os.path.join(workspace, "ogwell2010_raster")
+    save_distance_decay_tiles([in_raster], [raster_decay], maximum_distance, tile_size=4)
+    np.testing.assert_allclose(read_grid(out_raster), read_grid(raster_decay), rtol=1e-5, equal_nan=True)
+
+def test_dense_year(workspace):
+    features, source = point_features([(row, col) for row in range(0, 8, 2) for col in range(0, 10, 2)])
+    in_raster = save_grid(source, os.path.join(workspace, "ogwell2010_ras"))
+    out_raster = os.path.join(workspace, "ogwell2010_Log10IP_Null_SetNull")
+    assert save_vector_decay(features, in_raster, out_raster, maximum_distance, sparse_only=True) is None
+    assert not os.path.exists(out_raster)